@@ -5,6 +5,7 @@ from os.path import abspath, dirname
 
 from controllers.game import Game, initialize_pygame
 from data.constants import LOG_LEVEL, LOGGING_FILE, VERSION
+from events.events_base import EventManager
 from views.view_manager import ViewManager
 
 # Ensure that working directory is sixth_corp
@@ -49,6 +50,7 @@ if __name__ == '__main__':
     logging.info('Start Application')
 
     initialize_pygame()
+    EventManager.set_queued(True)
     view_manager = ViewManager()  # This instantiates the singleton class
     g = Game()
 
@@ -11,6 +11,7 @@ COMBAT_KEYBOARD_INPUTS = [str(i) for i in range(9)]
 
 class CombatSceneController(Controller):
     """Processes player input in a Combat Scene."""
+    handled_events = (InputEvent, MoveExecutedEvent)
 
     def __init__(self, scene: CombatScene) -> None:
         super(CombatSceneController, self).__init__()
@@ -29,7 +30,7 @@ class CombatSceneController(Controller):
                 EventManager.post(SelectCharacterEvent(None))
 
     def _handle_input(self, input_event: InputEvent) -> None:
-        if input_event.event_type == BasicEvents.MOUSE_CLICK:
+        if input_event.event_type is BasicEvents.MOUSE_CLICK:
             self._handle_mouse_click(input_event)
             return
 
@@ -5,6 +5,7 @@ from models.scenes.decision_scene import DecisionScene
 
 
 class DecisionSceneController(Controller):
+    handled_events = (InputEvent,)
 
     def __init__(self, scene: DecisionScene) -> None:
         super().__init__()
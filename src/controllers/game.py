@@ -26,27 +26,84 @@ def initialize_pygame(no_UI: bool = False) -> None:
 class Game(EventListener):
     """Stores sceneMachine and keyboard, handles framerate and quit event."""
     keyboard: Optional[Keyboard] = None
+    handled_events = (BasicEvents.QUIT, BasicEvents.TICK)
 
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False) -> None:
+        """
+
+        Args:
+            headless: If True, the game runs as fast as possible instead of
+                being limited to FRAMES_PER_SECOND, and a QUIT event ends
+                Game.run instead of exiting the process. Listeners that draw
+                to the screen (e.g. a ViewManager) are not notified while a
+                headless game runs. Headless games should be run after
+                initialize_pygame(no_UI=True).
+        """
         super(Game, self).__init__()
         self.clock: pygame.Clock = pygame.time.Clock()
+        self._headless = headless
+        self._quit = False
 
         self.keyboard = Keyboard()
 
         self.scene_machine = SceneMachine()
 
     def notify(self, event: EventType) -> None:
-        if event == BasicEvents.QUIT:
+        if event is BasicEvents.QUIT:
+            if self._headless:
+                self._quit = True
+                return
             pygame.quit()
             sys.exit()
-        elif event == BasicEvents.TICK:
+        elif event is BasicEvents.TICK and not self._headless:
             # limits the redraw speed
             self.clock.tick(constants.FRAMES_PER_SECOND)
 
-    def run(self, scene_loader: Callable[[], Scene] = None) -> None:
+    def run(self, scene_loader: Optional[Callable[[], Scene]] = None,
+            max_ticks: Optional[int] = None,
+            until: Optional[Callable[[Scene], bool]] = None) -> int:
+        """Run the game loop.
+
+        Args:
+            scene_loader: (Optional) Zero-argument function returning the
+                first scene. Default is the loading scene.
+            max_ticks: (Optional) Maximum number of ticks to run. By default
+                there is no limit.
+            until: (Optional) Predicate on the current scene, checked after
+                every tick. The loop ends as soon as it returns True.
 
+        Returns:
+            The number of ticks that were run.
+        """
+        self._quit = False
+        drawers = []
+        if self._headless:
+            drawers = [l for l in EventManager.listeners if l.draws]
+            for listener in drawers:
+                EventManager.unregister(listener)
+        try:
+            return self._run_loop(scene_loader, max_ticks, until)
+        finally:
+            for listener in drawers:
+                EventManager.register(listener, listener.handled_events)
+
+    def _run_loop(self, scene_loader: Optional[Callable[[], Scene]],
+                  max_ticks: Optional[int],
+                  until: Optional[Callable[[Scene], bool]]) -> int:
         scene = loading_scene() if scene_loader is None else scene_loader()
         EventManager.post(NewSceneEvent(scene))
+        EventManager.drain_queue()
 
-        while True:
+        num_ticks = 0
+        while max_ticks is None or num_ticks < max_ticks:
             EventManager.post(BasicEvents.TICK)
+            # Deliver events posted during the tick (no-op unless the
+            # EventManager is in queued mode).
+            EventManager.drain_queue()
+            num_ticks += 1
+
+            if self._quit:
+                break
+            if until is not None and until(self.scene_machine.current_scene):
+                break
+        return num_ticks
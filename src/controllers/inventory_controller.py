@@ -9,6 +9,7 @@ from models.scenes.inventory_scene import (InventoryScene, SlotHeaderInfo,
 
 class InventoryController(Controller):
     """Handles user inputs for the inventory scene"""
+    handled_events = (InputEvent,)
 
     def __init__(self, scene: InventoryScene) -> None:
         super().__init__()
@@ -16,7 +17,7 @@ class InventoryController(Controller):
 
     def _notify(self, event: EventType) -> None:
         if isinstance(event, InputEvent):
-            if event.event_type == BasicEvents.MOUSE_CLICK:
+            if event.event_type is BasicEvents.MOUSE_CLICK:
                 self._handle_mouse_click(event)
 
     def _handle_mouse_click(self, event: InputEvent) -> None:
@@ -8,12 +8,14 @@ from events.events_base import (BasicEvents, EventListener, EventManager,
 
 
 class Keyboard(EventListener):
+    handled_events = (BasicEvents.TICK,)
+
     def __init__(self) -> None:
         super(Keyboard, self).__init__()
         self.bindings = Keybindings()
 
     def notify(self, event: EventType) -> None:
-        if event == BasicEvents.TICK:
+        if event is BasicEvents.TICK:
             self.handle_inputs()
 
     def handle_inputs(self) -> None:
@@ -31,7 +33,7 @@ class Keyboard(EventListener):
                 self.handle_mouse_click()
 
     def handle_keypress(self, key_name: str) -> None:
-        if self.get_binding(key_name) != BasicEvents.NONE:
+        if self.get_binding(key_name) is not BasicEvents.NONE:
             self.post_bound_event(key=key_name)
         else:
             input_event = InputEvent(event_type=BasicEvents.KEYPRESS,
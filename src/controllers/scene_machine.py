@@ -15,6 +15,7 @@ from models.scenes.settings_scene import SettingsScene
 
 class SceneMachine(EventListener):
     """Handles transitions between scenes."""
+    handled_events = (BasicEvents.SETTINGS, BasicEvents.TICK, NewSceneEvent)
 
     def __init__(self) -> None:
         super().__init__()
@@ -22,11 +23,15 @@ class SceneMachine(EventListener):
 
         self._current_game_scene: Optional[Scene] = None  # not SettingsScene.
         self._current_scene: Optional[Scene] = None
+        # Scene whose resolution has been applied. Its effects must not be
+        # applied again if the NewSceneEvent that follows is deferred to a
+        # later tick by a queued EventManager.
+        self._resolved_scene: Optional[Scene] = None
 
     def notify(self, event: EventType) -> None:
 
         # toggle between settings scene and game scene
-        if event == BasicEvents.SETTINGS:
+        if event is BasicEvents.SETTINGS:
             new_scene: Optional[Scene] = None
             # go to temp scene
             if self._current_scene is self._current_game_scene:
@@ -39,9 +44,11 @@ class SceneMachine(EventListener):
                 post_scene_change(new_scene)
 
         # Check for scene resolution:
-        if event == BasicEvents.TICK:
+        if event is BasicEvents.TICK:
             assert self._current_scene is not None, 'No scene loaded.'
-            if self._current_scene.is_resolved():
+            if (self._current_scene is not self._resolved_scene
+                    and self._current_scene.is_resolved()):
+                self._resolved_scene = self._current_scene
                 resolution = self._current_scene.get_resolution()
                 for effect in resolution.effects:
                     effect()
@@ -59,6 +66,7 @@ class SceneMachine(EventListener):
             if not isinstance(event.scene, (SettingsScene,)):
                 self._current_game_scene = event.scene
             self._current_scene = event.scene
+            self._resolved_scene = None
 
             # The previous controller may not disappear after a new controller
             # is assigned, so we must explicitly deactivate it.
@@ -66,6 +74,11 @@ class SceneMachine(EventListener):
                 self._current_controller.deactivate()
             self._current_controller = build_controller(event.scene)
 
+    @property
+    def current_scene(self) -> Scene:
+        assert self._current_scene is not None, 'No scene loaded.'
+        return self._current_scene
+
     @property
     def controller(self) -> Controller:
         assert self._current_controller is not None, 'No controller defined.'
@@ -3,6 +3,7 @@ from events.events_base import EventType
 
 
 class SettingsController(Controller):
+    handled_events = ()
 
     def __init__(self) -> None:
         super(SettingsController, self).__init__()
@@ -0,0 +1,125 @@
+import os
+from os.path import abspath, dirname
+
+from controllers.game import Game, initialize_pygame
+from events import event_utils
+from events.events_base import BasicEvents, EventListener, EventManager
+from models.scenes.decision_scene import DecisionOption, DecisionScene
+from models.scenes.scene_examples import loading_scene
+
+
+def setup_module(module):
+    # Ensure that working directory is sixth_corp
+    os.chdir(dirname(dirname(dirname(dirname(abspath(__file__))))))
+    initialize_pygame(no_UI=True)
+    EventManager.clear()
+
+
+def teardown_module(module):
+    EventManager.clear()
+
+
+class _ScriptedPlayer(EventListener):
+    """Presses a key on a given tick."""
+    handled_events = (BasicEvents.TICK,)
+
+    def __init__(self, key, tick):
+        super().__init__()
+        self._key = key
+        self._tick = tick
+        self._ticks = 0
+
+    def notify(self, event):
+        self._ticks += 1
+        if self._ticks == self._tick:
+            event_utils.simulate_key_press(self._key)
+
+
+class _Clock(object):
+    """Records calls to tick."""
+
+    def __init__(self):
+        self.num_ticks = 0
+
+    def tick(self, framerate=0):
+        self.num_ticks += 1
+
+
+class _Drawer(EventListener):
+    """Counts ticks, like a listener that redraws every frame."""
+    handled_events = (BasicEvents.TICK,)
+    draws = True
+
+    def __init__(self):
+        super().__init__()
+        self.num_ticks = 0
+
+    def notify(self, event):
+        self.num_ticks += 1
+
+
+class _Quitter(EventListener):
+    handled_events = (BasicEvents.TICK,)
+
+    def notify(self, event):
+        EventManager.post(BasicEvents.QUIT)
+
+
+def test_headless_game_runs_bounded_ticks_without_frame_limit():
+    game = Game(headless=True)
+    game.clock = _Clock()
+
+    num_ticks = game.run(loading_scene, max_ticks=60)
+
+    assert num_ticks == 60
+    assert game.clock.num_ticks == 0
+
+
+def test_game_limits_frame_rate_when_not_headless():
+    game = Game()
+    game.clock = _Clock()
+
+    game.run(loading_scene, max_ticks=3)
+
+    assert game.clock.num_ticks == 3
+
+
+def test_headless_game_does_not_notify_drawing_listeners():
+    game = Game(headless=True)
+    drawer = _Drawer()
+
+    game.run(loading_scene, max_ticks=5)
+
+    assert drawer.num_ticks == 0
+    # Drawing listeners are restored once the run ends.
+    assert drawer in EventManager.listeners
+    EventManager.post(BasicEvents.TICK)
+    assert drawer.num_ticks == 1
+
+
+def test_headless_game_runs_until_scene_predicate():
+    game = Game(headless=True)
+    player = _ScriptedPlayer('1', tick=5)  # noqa: F841
+
+    def final_scene():
+        return DecisionScene('final scene', {})
+
+    first_scene = DecisionScene('first scene',
+                                {'1': DecisionOption('next', final_scene)})
+
+    num_ticks = game.run(lambda: first_scene, max_ticks=100,
+                         until=lambda scene: scene is not first_scene)
+
+    # The scene resolves on the 5th tick and changes on the next.
+    assert num_ticks == 6
+    assert not game.scene_machine.current_scene.is_resolved()
+
+
+def test_quit_ends_headless_game():
+    game = Game(headless=True)
+    quitter = _Quitter()
+
+    assert game.run(loading_scene, max_ticks=100) == 1
+
+    EventManager.unregister(quitter)
+    assert game.run(loading_scene, max_ticks=10) == 10
@@ -15,7 +15,7 @@ os.chdir(dirname(dirname(dirname(dirname(os.path.abspath(__file__))))))
 
 # Errors in other test modules may cause the EventManager to not be empty.
 def setup_module(module):
-    EventManager.listeners.clear()
+    EventManager.clear()
 
 
 class BasicListener(EventListener):
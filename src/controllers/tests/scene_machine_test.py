@@ -1,9 +1,10 @@
 from controllers.controller_factory import build_controller
 from controllers.scene_machine import SceneMachine
 from controllers.settings_controller import SettingsController
-from events.events_base import BasicEvents, NewSceneEvent
+from events.events_base import BasicEvents, EventManager, NewSceneEvent
 from models.scenes.decision_scene import DecisionScene
 from models.scenes.scene_examples import loading_scene
+from models.scenes.scenes_base import BasicResolution
 
 
 def test_toggle_settings():
@@ -37,3 +38,20 @@ def test_toggler_settings_then_inventory_stays_settings():
 
     machine.notify(BasicEvents.INVENTORY)
     assert isinstance(machine.controller, SettingsController)
+
+
+def test_resolution_applied_once_until_scene_changes():
+    machine = SceneMachine()
+    effects = []
+    scene = DecisionScene('dummy scene', {})
+    machine.notify(NewSceneEvent(scene))
+
+    scene.is_resolved = lambda: True
+    scene.get_resolution = lambda: BasicResolution(
+        lambda: loading_scene(), (lambda: effects.append(1),))
+    # Scene change events are dropped, as if deferred by the queue.
+    EventManager.clear()
+    machine.notify(BasicEvents.TICK)
+    machine.notify(BasicEvents.TICK)
+
+    assert effects == [1]
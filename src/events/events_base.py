@@ -1,14 +1,25 @@
 import abc
 import logging
+from collections import deque
 from enum import Enum
-from typing import NamedTuple, Optional, Tuple, Union
-from weakref import WeakSet
+from typing import (Any, Deque, Dict, Iterable, NamedTuple, Optional, Tuple,
+                    Type, Union)
+from weakref import WeakSet, ref
 
 from models.characters.character_base import Character
 from models.characters.mods_base import Mod, SlotTypes
 from models.characters.moves_base import Move
 from models.scenes.scenes_base import Scene
 
+# Events are compared by identity, which requires that this module is loaded
+# exactly once. With both the project root and src/ on sys.path (as in some IDE
+# configurations), the module could also be imported as
+# 'src.events.events_base', creating a second, distinct set of BasicEvents.
+_MODULE_NAME = 'events.events_base'
+if __name__ != _MODULE_NAME:
+    raise ImportError('{} imported as {}. Import it as {} instead.'.format(
+        __file__, __name__, _MODULE_NAME))
+
 
 class BasicEvents(Enum):
     NONE = 'NONE'  # Null event, signifies nothing.
@@ -24,14 +35,6 @@ class BasicEvents(Enum):
     SETTINGS = 'SETTINGS'
     INVENTORY = 'INVENTORY'
 
-    # comparing enums gives wrong result without this
-    # has to do with this file being imported twice
-    # but i can't for the life of me figure out why/how/where
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, BasicEvents):
-            return self.value == other.value
-        return False
-
     def __str__(self) -> str:
         return self.value
 
@@ -105,28 +108,201 @@ EventType = Union[BasicEvents, InputEvent, NewSceneEvent, MoveExecutedEvent,
                   InventoryTransferEvent]
 
 
+# Listeners subscribe either to a BasicEvents member or to an event class.
+EventKey = Union[BasicEvents, Type[Any]]
+
+# Index key for listeners that are notified of every event.
+_ALL_EVENTS = None
+
+
+def event_key(event: EventType) -> EventKey:
+    """The key under which listeners of an event are indexed.
+
+    BasicEvents members are their own keys, all other events are keyed by their
+    exact class.
+    """
+    if isinstance(event, BasicEvents):
+        return event
+    return type(event)
+
+
+class EventQueueStats(NamedTuple):
+    """Counters describing the EventManager queue (see EventManager.queued).
+
+    Attributes:
+        depth: Number of events currently waiting in the queue.
+        peak_depth: Largest depth reached since the counters were reset.
+        num_queued: Total number of events added to the queue.
+        num_delivered: Total number of queued events delivered to listeners.
+        num_deferred: Total number of events left in the queue at the end of a
+            drain because the drain limit was reached.
+    """
+    depth: int = 0
+    peak_depth: int = 0
+    num_queued: int = 0
+    num_delivered: int = 0
+    num_deferred: int = 0
+
+
+DEFAULT_DRAIN_LIMIT = 256
+
+
 class EventManager(object):
     listeners: WeakSet = WeakSet()
+    # Weak references to listeners, indexed by the event keys they handle. The
+    # index is only rebuilt on register/unregister so that posting an event
+    # does not copy or scan listeners that do not handle it.
+    _subscribers: Dict[Optional[EventKey], Tuple[ref, ...]] = {}
+
+    # In queued mode, events posted while another event is being dispatched
+    # are buffered and delivered in FIFO order by drain_queue, instead of being
+    # dispatched recursively.
+    _queued: bool = False
+    _drain_limit: int = DEFAULT_DRAIN_LIMIT
+    _queue: Deque[EventType] = deque()
+    _dispatching: bool = False
+    # Queue counters (see EventQueueStats), kept as ints so that queueing an
+    # event does not allocate.
+    _peak_depth: int = 0
+    _num_queued: int = 0
+    _num_delivered: int = 0
+    _num_deferred: int = 0
 
     @classmethod
-    def register(cls, l: 'EventListener') -> None:
+    def register(cls, l: 'EventListener',
+                 handled_events: Optional[Iterable[EventKey]] = None) -> None:
+        """Register a listener.
+
+        Args:
+            l: The listener, which is only weakly referenced.
+            handled_events: (Optional) The BasicEvents members and event
+                classes passed to the listener's notify method. By default the
+                listener is notified of all events.
+        """
         cls.listeners.add(l)
+        keys = ((_ALL_EVENTS,) if handled_events is None
+                else tuple(handled_events))
+        listener_ref = ref(l)
+        for key in keys:
+            cls._subscribers[key] = cls._live_subscribers(key) + (listener_ref,)
         logging.debug('registered listener {0} {1}'.format(
             len(cls.listeners), l))
 
+    @classmethod
+    def unregister(cls, l: 'EventListener') -> None:
+        """Stop notifying a listener of any events."""
+        cls.listeners.discard(l)
+        for key in cls._subscribers:
+            cls._subscribers[key] = tuple(
+                r for r in cls._live_subscribers(key) if r() is not l)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all listeners and any events waiting in the queue."""
+        cls.listeners.clear()
+        cls._subscribers.clear()
+        cls._queue.clear()
+
+    @classmethod
+    def set_queued(cls, queued: bool,
+                   drain_limit: int = DEFAULT_DRAIN_LIMIT) -> None:
+        """Turn queued event delivery on or off.
+
+        Args:
+            queued: If True, events posted by listeners during dispatch are
+                queued until drain_queue is called. If False (default
+                behavior), all events are dispatched as soon as they are
+                posted. Turning the queue off delivers all remaining events.
+            drain_limit: Maximum number of queued events delivered by a single
+                call to drain_queue.
+        """
+        if drain_limit < 1:
+            raise ValueError('drain_limit must be positive.')
+        cls._drain_limit = drain_limit
+        cls._queued = queued
+        if not queued:
+            while cls._queue:
+                cls.drain_queue()
+
+    @classmethod
+    def queue_stats(cls) -> EventQueueStats:
+        return EventQueueStats(len(cls._queue), cls._peak_depth,
+                               cls._num_queued, cls._num_delivered,
+                               cls._num_deferred)
+
+    @classmethod
+    def reset_queue_stats(cls) -> None:
+        cls._peak_depth = len(cls._queue)
+        cls._num_queued = cls._num_delivered = cls._num_deferred = 0
+
     @classmethod
     def post(cls, event: EventType) -> None:
-        if not event == BasicEvents.TICK:
+        if cls._queued and cls._dispatching:
+            cls._queue.append(event)
+            cls._num_queued += 1
+            if len(cls._queue) > cls._peak_depth:
+                cls._peak_depth = len(cls._queue)
+            return
+
+        was_dispatching = cls._dispatching
+        cls._dispatching = True
+        try:
+            cls._dispatch(event)
+        finally:
+            cls._dispatching = was_dispatching
+
+    @classmethod
+    def drain_queue(cls) -> int:
+        """Deliver queued events in the order they were posted.
+
+        This should be called once per frame. Events posted while draining are
+        delivered in the same call, up to the drain limit. Any events remaining
+        after the limit is reached are kept for the next call.
+
+        Returns:
+            The number of events delivered.
+        """
+        num_delivered = 0
+        was_dispatching = cls._dispatching
+        cls._dispatching = True
+        try:
+            while cls._queue and num_delivered < cls._drain_limit:
+                cls._dispatch(cls._queue.popleft())
+                num_delivered += 1
+        finally:
+            cls._dispatching = was_dispatching
+            cls._num_delivered += num_delivered
+            cls._num_deferred += len(cls._queue)
+        return num_delivered
+
+    @classmethod
+    def _dispatch(cls, event: EventType) -> None:
+        if event is not BasicEvents.TICK:
             logging.debug('EVENT: {}'.format(str(event)))
 
-        for l in cls.listeners.copy():
-            l.notify(event)
+        subscribers = cls._subscribers
+        for listener_ref in (subscribers.get(event_key(event), ())
+                             + subscribers.get(_ALL_EVENTS, ())):
+            listener = listener_ref()
+            if listener is not None:
+                listener.notify(event)
+
+    @classmethod
+    def _live_subscribers(cls, key: Optional[EventKey]) -> Tuple[ref, ...]:
+        return tuple(r for r in cls._subscribers.get(key, ())
+                     if r() is not None)
 
 
 class EventListener(metaclass=abc.ABCMeta):
+    # The BasicEvents members and event classes handled by the listener. If
+    # None, the listener is notified of every event.
+    handled_events: Optional[Tuple[EventKey, ...]] = None
+    # Whether the listener draws to the screen. Headless games do not notify
+    # such listeners.
+    draws: bool = False
 
     def __init__(self) -> None:
-        EventManager.register(self)
+        EventManager.register(self, self.handled_events)
 
     @abc.abstractmethod
     def notify(self, event: EventType) -> None:
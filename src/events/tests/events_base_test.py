@@ -0,0 +1,48 @@
+"""Tests that event identities are unique and cheap to compare."""
+import importlib.util
+import sys
+from os.path import abspath, dirname, join
+
+import pytest
+
+import controllers.game  # noqa: F401
+import views.view_manager  # noqa: F401
+from events import events_base
+from events.events_base import BasicEvents, event_key
+
+
+def test_events_base_loaded_under_single_name():
+    # Import the whole game so that all modules depending on events_base are
+    # loaded.
+    events_file = abspath(events_base.__file__)
+    loaded_as = [name for name, module in list(sys.modules.items())
+                 if abspath(getattr(module, '__file__', None) or '')
+                 == events_file]
+
+    assert loaded_as == ['events.events_base']
+
+
+def test_importing_events_base_under_other_name_fails():
+    path = join(dirname(dirname(abspath(__file__))), 'events_base.py')
+    spec = importlib.util.spec_from_file_location('src.events.events_base',
+                                                  path)
+    module = importlib.util.module_from_spec(spec)
+
+    with pytest.raises(ImportError, match='events.events_base'):
+        spec.loader.exec_module(module)
+
+
+@pytest.mark.parametrize('event', list(BasicEvents))
+def test_basic_events_compared_by_identity(event):
+    assert BasicEvents.__eq__ is object.__eq__
+    assert event == BasicEvents(event.value)
+    assert event is BasicEvents[event.name]
+    assert all(event != other for other in BasicEvents if other is not event)
+
+
+def test_basic_events_hash_is_stable():
+    keys = {event: event.value for event in BasicEvents}
+
+    assert all(keys[BasicEvents(value)] == value for value in keys.values())
+    assert hash(BasicEvents.TICK) == hash(BasicEvents['TICK'])
+    assert event_key(BasicEvents.TICK) is BasicEvents.TICK
@@ -40,11 +40,11 @@ def setup_module(module):
     # Tests in other modules may change the bindings.
     Keybindings().load()
 
-    EventManager.listeners.clear()
+    EventManager.clear()
 
 
 def teardown_module(module):
-    EventManager.listeners.clear()
+    EventManager.clear()
     reset_player()
 
 
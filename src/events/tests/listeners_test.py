@@ -1,11 +1,14 @@
 import os
 from os.path import dirname
 
+import pytest
+
 from controllers.controller_factory import build_controller
 from controllers.game import Game
 from controllers.scene_machine import SceneMachine
 from events import event_utils
-from events.events_base import EventManager
+from events.events_base import (BasicEvents, EventListener, EventManager,
+                                InputEvent)
 from models.scenes.combat_scene import CombatScene
 from models.scenes.scene_examples import loading_scene
 
@@ -14,14 +17,14 @@ os.chdir(dirname(dirname(dirname(dirname(os.path.abspath(__file__))))))
 
 
 def test_initializing_game_adds_listeners():
-    EventManager.listeners.clear()  # Other test modules may populate
+    EventManager.clear()  # Other test modules may populate
     assert len(EventManager.listeners) == 0
     game = Game()  # noqa: F841
     assert len(EventManager.listeners) > 0
 
 
 def test_changing_scenes_removes_previous_listener():
-    EventManager.listeners.clear()  # Other tests/ modules may populate
+    EventManager.clear()  # Other tests/ modules may populate
     assert len(EventManager.listeners) == 0
     machine = SceneMachine()  # noqa: F841
     assert len(EventManager.listeners) == 1
@@ -45,3 +48,118 @@ def test_changing_scenes_removes_previous_listener():
                for l in EventManager.listeners)
     assert not any(isinstance(ctl, initial_controller_type)
                    for ctl in EventManager.listeners)
+
+
+class _RecordingListener(EventListener):
+
+    def __init__(self, handled_events=None):
+        self.handled_events = handled_events
+        super().__init__()
+        self.events = []
+
+    def notify(self, event):
+        self.events.append(event)
+
+
+def test_subscribed_listener_only_notified_of_handled_events():
+    EventManager.clear()
+    tick_listener = _RecordingListener((BasicEvents.TICK,))
+    input_listener = _RecordingListener((InputEvent,))
+    all_listener = _RecordingListener()
+
+    input_event = InputEvent(BasicEvents.KEYPRESS, key='a')
+    for event in (BasicEvents.TICK, input_event, BasicEvents.DEBUG):
+        EventManager.post(event)
+
+    assert tick_listener.events == [BasicEvents.TICK]
+    assert input_listener.events == [input_event]
+    assert all_listener.events == [BasicEvents.TICK, input_event,
+                                   BasicEvents.DEBUG]
+
+
+def test_unregistered_listener_not_notified():
+    EventManager.clear()
+    listener = _RecordingListener((BasicEvents.TICK,))
+    EventManager.unregister(listener)
+
+    EventManager.post(BasicEvents.TICK)
+
+    assert not listener.events
+    assert listener not in EventManager.listeners
+
+
+def test_deleted_listener_not_notified():
+    EventManager.clear()
+    listener = _RecordingListener((BasicEvents.TICK,))
+    del listener
+
+    EventManager.post(BasicEvents.TICK)
+
+    assert len(EventManager.listeners) == 0
+
+
+class _PostingListener(EventListener):
+    """Posts a fixed sequence of events whenever it is notified of a TICK."""
+    handled_events = (BasicEvents.TICK,)
+
+    def __init__(self, to_post):
+        super().__init__()
+        self._to_post = to_post
+
+    def notify(self, event):
+        for other in self._to_post:
+            EventManager.post(other)
+
+
+@pytest.fixture()
+def queued_manager():
+    EventManager.clear()
+    EventManager.set_queued(True, drain_limit=3)
+    EventManager.reset_queue_stats()
+    yield EventManager
+    EventManager.set_queued(False)
+    EventManager.clear()
+
+
+def test_queued_events_delivered_on_drain_in_order(queued_manager):
+    to_post = [BasicEvents.DEBUG, BasicEvents.SETTINGS]
+    poster = _PostingListener(to_post)  # noqa: F841
+    listener = _RecordingListener((BasicEvents.DEBUG, BasicEvents.SETTINGS))
+
+    queued_manager.post(BasicEvents.TICK)
+    assert not listener.events
+    assert queued_manager.queue_stats().depth == 2
+
+    assert queued_manager.drain_queue() == 2
+    assert listener.events == to_post
+    assert queued_manager.queue_stats().depth == 0
+
+
+def test_drain_limit_defers_remaining_events(queued_manager):
+    to_post = [BasicEvents.DEBUG] * 5
+    poster = _PostingListener(to_post)  # noqa: F841
+    listener = _RecordingListener((BasicEvents.DEBUG,))
+
+    queued_manager.post(BasicEvents.TICK)
+
+    assert queued_manager.drain_queue() == 3
+    assert len(listener.events) == 3
+    stats = queued_manager.queue_stats()
+    assert stats.depth == 2
+    assert stats.num_deferred == 2
+
+    assert queued_manager.drain_queue() == 2
+    stats = queued_manager.queue_stats()
+    assert stats.depth == 0
+    assert stats.peak_depth == 5
+    assert stats.num_queued == stats.num_delivered == 5
+
+
+def test_turning_off_queue_delivers_remaining_events(queued_manager):
+    poster = _PostingListener([BasicEvents.DEBUG] * 5)  # noqa: F841
+    listener = _RecordingListener((BasicEvents.DEBUG,))
+
+    queued_manager.post(BasicEvents.TICK)
+    queued_manager.set_queued(False)
+
+    assert len(listener.events) == 5
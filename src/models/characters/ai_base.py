@@ -5,6 +5,7 @@ from models.characters.moves_base import Move
 
 if TYPE_CHECKING:
     from models.characters.character_base import Character  # noqa: F401
+    from models.combat.combat_logic import CombatLogic  # noqa: F401
 
 
 class AI(object):
@@ -18,3 +19,9 @@ class AI(object):
     @abstractmethod
     def set_user(self, user: 'Character') -> None:
         """Assign a user (state) to the AI."""
+
+    def start_combat(self, combat: 'CombatLogic') -> None:
+        """Called when the AI's user enters a combat.
+
+        By default this does nothing.
+        """
@@ -1,9 +1,8 @@
 """Basic class for player and enemies."""
 
-from functools import partial
-from typing import Callable, Iterable, Sequence
-
-from pygame.rect import Rect
+from random import Random
+from typing import (Any, Callable, Dict, FrozenSet, Iterable, NamedTuple,
+                    Optional, Sequence)
 
 from models.characters.ai_base import AI
 from models.characters.character_base import Character
@@ -14,7 +13,8 @@ from models.characters.inventory import InventoryBase
 from models.characters.mods_base import Mod, build_mod
 from models.characters.states import (Attributes, AttributeType, State, Status,
                                       StatusEffect)
-from models.characters.status import BasicStatus
+from models.characters.status import (BasicStatus, BoundedStatus,
+                                      PopulationStatus, StatusPopulation)
 from models.combat.ai_impl import AIType, build_ai
 
 
@@ -22,13 +22,14 @@ class _CharacterImpl(Character):
     """Stateful object with states and attributes affected by mods."""
 
     def __init__(self, chassis: Chassis, ai: AI, image_path: str,
-                 name: str = 'unnamed Character') -> None:
+                 name: str = 'unnamed Character',
+                 population: StatusPopulation = None) -> None:
         super().__init__()
 
         self._chassis: Chassis = chassis
-        self._status = _CombinedStatus(self._chassis)
+        base_status = None if population is None else population.add_status()
+        self._status = _CombinedStatus(self._chassis, base_status)
         self._image_path = image_path
-        self._rect: Rect = None
         self._ai: AI = ai
         self._name = name
 
@@ -55,58 +56,148 @@ class _CharacterImpl(Character):
         return self._name
 
 
+class AttributeCacheStats(NamedTuple):
+    """Counters of attribute lookups in a character's status.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to be computed from the base status and
+            inventory.
+    """
+    hits: int = 0
+    misses: int = 0
+
+
 class _CombinedStatus(Status):
     """In-game state deriving from a BasisStatus and an Inventory.
 
     The mods in the inventory augment the states and attributes of the basic
     status.
+
+    Snapshots are copy-on-write: a snapshot of the base status is kept until
+    the base status changes, so that snapshots of an unchanged status share
+    it, and restoring the status to it does nothing.
+
+    Attribute values and the states granted by the inventory are cached. The
+    cache is cleared whenever the base status changes or the inventory version
+    differs from the one the cache was filled with.
     """
 
-    def __init__(self, inventory: InventoryBase) -> None:
-        self._base_status = BasicStatus()
+    def __init__(self, inventory: InventoryBase,
+                 base_status: Optional[BoundedStatus] = None) -> None:
+        """
+
+        Args:
+            inventory: Inventory whose mods augment the base status.
+            base_status: (Optional) Initially empty base status. Default is a
+                new BasicStatus.
+        """
+        if base_status is None:
+            base_status = BasicStatus()
+        self._base_status = base_status
         self._inventory = inventory
 
-        # We use attribute getters for the composite object to set health and
-        # CPU bounds. The base status is used to compute bounds.
+        self._attribute_cache: Dict[AttributeType, int] = {}
+        self._states_granted: Optional[FrozenSet[State]] = None
+        self._cache_version = inventory.version
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Snapshot of the base status, if it has not changed since.
+        self._snapshot: Optional[Any] = None
+
+        population_status = base_status.population_status()
+        if population_status is not None:
+            population_status.set_owner(self.get_attribute)
+
+        # Health and CPU are bounded by the (cached) maximum values of the
+        # composite object, read through attribute reference bounds.
+        self._base_status.set_bound_source(self)
         self._base_status.set_attribute_bounds(
-            Attributes.HEALTH, None,
-            partial(self.get_attribute, Attributes.MAX_HEALTH))
+            Attributes.HEALTH, None, Attributes.MAX_HEALTH)
         self._base_status.set_attribute_bounds(
-            Attributes.CPU_AVAILABLE, None,
-            partial(self.get_attribute, Attributes.MAX_CPU))
+            Attributes.CPU_AVAILABLE, None, Attributes.MAX_CPU)
         self._base_status.set_attribute_bounds(Attributes.SHIELD, 0, 1000000)
 
     def has_state(self, state: State) -> bool:
-        return (self._base_status.has_state(state)
-                or self._inventory.grants_state(state))
+        if self._base_status.has_state(state):
+            return True
+        self._check_inventory_version()
+        if self._states_granted is None:
+            self._states_granted = frozenset(
+                s for m in self._inventory.all_active_mods()
+                for s in m.states_granted())
+        return state in self._states_granted
 
     def set_state(self, state: State, value: bool) -> None:
         self._base_status.set_state(state, value)
+        self._snapshot = None
 
     def get_attribute(self, attribute: AttributeType) -> int:
+        self._check_inventory_version()
+        value = self._attribute_cache.get(attribute)
+        if value is not None:
+            self._cache_hits += 1
+            return value
+        self._cache_misses += 1
+
         modifier = self._inventory.total_modifier(attribute)
         value = self._base_status.get_attribute(attribute) + modifier
-        return self._base_status.value_in_bounds(value, attribute)
+        value = self._base_status.value_in_bounds(value, attribute)
+        self._attribute_cache[attribute] = value
+        return value
 
     def increment_attribute(self, attribute: AttributeType, delta: int) -> None:
         self._base_status.increment_attribute(attribute, delta)
+        self._base_changed()
 
     def add_status_effect(self, effect: StatusEffect) -> None:
         self._base_status.add_status_effect(effect)
+        self._base_changed()
 
     def remove_status_effect(self, effect: StatusEffect) -> None:
         self._base_status.remove_status_effect(effect)
+        self._base_changed()
 
     def active_effects(self, check: Callable[[StatusEffect], bool] = None
                        ) -> Sequence[StatusEffect]:
         return self._base_status.active_effects(check)
 
+    def population_status(self) -> Optional[PopulationStatus]:
+        return self._base_status.population_status()
+
+    def snapshot(self) -> Any:
+        if self._snapshot is None:
+            self._snapshot = self._base_status.snapshot()
+        return self._snapshot
+
+    def restore(self, snapshot: Any) -> None:
+        if snapshot is self._snapshot:
+            return
+        self._base_status.restore(snapshot)
+        self._base_changed()
+        self._snapshot = snapshot
+
+    def cache_stats(self) -> AttributeCacheStats:
+        return AttributeCacheStats(self._cache_hits, self._cache_misses)
+
+    def _base_changed(self) -> None:
+        self._attribute_cache.clear()
+        self._snapshot = None
+
+    def _check_inventory_version(self) -> None:
+        if self._cache_version != self._inventory.version:
+            self._attribute_cache.clear()
+            self._states_granted = None
+            self._cache_version = self._inventory.version
+
 
 def build_character(chassis: Chassis = None, ai_type: AIType = AIType.No_AI,
                     mods: Iterable[Mod] = (),
                     name: str = 'unnamed Character',
                     image_path: str = 'src/data/images/drone.png',
-                    data: CharacterData = None) -> _CharacterImpl:
+                    data: CharacterData = None,
+                    rng: Optional[Random] = None,
+                    population: StatusPopulation = None) -> _CharacterImpl:
     """Factory function for Characters.
 
     Args:
@@ -118,7 +209,13 @@ def build_character(chassis: Chassis = None, ai_type: AIType = AIType.No_AI,
         name: Character name.
         image_path: Path to character image. Default is drone image.
         data: (Optional) A CharacterData object containing all desired
-            properties. If this is passed, other arguments are ignored.
+            properties. If this is passed, other arguments (except rng) are
+            ignored.
+        rng: (Optional) Random number generator used by the character's AI.
+            If not given, the global state of the random module is used.
+        population: (Optional) Population storing the character's attributes,
+            so that they can be evaluated in bulk with those of other
+            characters. By default, the character has its own storage.
 
     Returns:
         A Character with the specified properties.
@@ -127,12 +224,14 @@ def build_character(chassis: Chassis = None, ai_type: AIType = AIType.No_AI,
         chassis = Chassis.from_data(data.chassis_data)
         mods = (build_mod(data=m_data) for m_data in data.mods)
         return build_character(chassis, data.ai_type, mods, data.name,
-                               data.image_path)
+                               data.image_path, rng=rng,
+                               population=population)
 
-    ai = build_ai(ai_type)
+    ai = build_ai(ai_type, rng)
     if chassis is None:
         chassis = Chassis.from_data(ChassisTypes.DRONE.data)
-    char = _CharacterImpl(chassis, ai, image_path, name=name)
+    char = _CharacterImpl(chassis, ai, image_path, name=name,
+                          population=population)
     ai.set_user(char)
 
     for mod in mods:
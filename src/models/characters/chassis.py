@@ -1,7 +1,6 @@
 """Implementation of the Chassis"""
 import logging
-from functools import reduce
-from typing import Dict, Iterable, List, NamedTuple, Tuple
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
 
 from models.characters.inventory import InventoryBase
 from models.characters.mods_base import Mod, SlotTypes, build_mod
@@ -9,6 +8,17 @@ from models.characters.states import AttributeType, State
 from models.characters.subroutines_base import Subroutine
 
 
+class ChassisSnapshot(NamedTuple):
+    """Immutable record of the mods stored in each slot of a Chassis.
+
+    Attributes:
+        version: Inventory version of the chassis when the snapshot was taken.
+        stored_mods: (slot, mods stored in the slot) for each slot.
+    """
+    version: int
+    stored_mods: Tuple[Tuple[SlotTypes, Tuple[Mod, ...]], ...]
+
+
 class Chassis(InventoryBase):
     """An inventory which determines storage based on slots."""
 
@@ -21,6 +31,7 @@ class Chassis(InventoryBase):
                 unspecified it is assumed to have zero capacity.
             base_mod: Fixed mod that is granted by the chassis.
         """
+        super().__init__()
         self._slot_capacities: Dict[SlotTypes, int] = slot_capacities.copy()
         self._slot_capacities.update({slot: 0 for slot in SlotTypes
                                       if slot not in slot_capacities})
@@ -28,6 +39,13 @@ class Chassis(InventoryBase):
                                                          SlotTypes}
         self._base_mod = base_mod
 
+        # Index of the slots holding each stored mod, and cached sets of
+        # stored mods (keyed by active_only), rebuilt after mods change.
+        self._mod_slots: Dict[Mod, List[SlotTypes]] = {}
+        self._mod_sets: Dict[bool, FrozenSet[Mod]] = {}
+        # Latest snapshot, reused while the chassis version is unchanged.
+        self._snapshot: Optional[ChassisSnapshot] = None
+
     @classmethod
     def from_data(cls, data: 'ChassisData') -> 'Chassis':
         base_mod = build_mod(data.states_granted, data.attribute_modifiers,
@@ -52,14 +70,14 @@ class Chassis(InventoryBase):
         self.remove_mod(mod)
         logging.debug(
             'Transferring mod {} to {}'.format(mod, target_slot.value))
-        self._stored_mods[target_slot].append(mod)
+        self._add_to_slot(mod, target_slot)
 
     def can_store(self, mod: Mod) -> bool:
         available_slots = self._open_slots(mod.valid_slots())
         if not available_slots:
             return False
-        return all(
-            mod not in self._stored_mods[slot] for slot in available_slots)
+        mod_slots = self._mod_slots.get(mod, ())
+        return all(slot not in mod_slots for slot in available_slots)
 
     def slot_full(self, slot: SlotTypes) -> bool:
         return len(self._stored_mods[slot]) == self._slot_capacities[slot]
@@ -73,11 +91,44 @@ class Chassis(InventoryBase):
         # We don't remove the base mod because it can cause the player's health
         # to go to zero.
 
+        mod_slots = self._mod_slots.get(mod)
+        if not mod_slots:
+            return
         for slot in mod.valid_slots():
-            if mod in self._stored_mods[slot]:
+            if slot in mod_slots:
                 self._stored_mods[slot].remove(mod)
+                mod_slots.remove(slot)
                 logging.debug(
                     'INVENTORY: Mod removed from slot {}'.format(slot.value))
+        if not mod_slots:
+            del self._mod_slots[mod]
+        self._mods_changed()
+
+    def snapshot(self) -> ChassisSnapshot:
+        """An immutable record of the mod placement. See restore."""
+        if self._snapshot is None or self._snapshot.version != self.version:
+            self._snapshot = ChassisSnapshot(
+                self.version, tuple((slot, tuple(mods)) for slot, mods
+                                    in self._stored_mods.items()))
+        return self._snapshot
+
+    def restore(self, snapshot: ChassisSnapshot) -> None:
+        """Return to the mod placement of an earlier snapshot.
+
+        Nothing is done if the placement has not changed since the snapshot.
+        """
+        current = self._snapshot
+        if (current is not None and current.version == self.version
+                and current.stored_mods is snapshot.stored_mods):
+            return
+        self._stored_mods = {slot: list(mods)
+                             for slot, mods in snapshot.stored_mods}
+        self._mod_slots = {}
+        for slot, mods in snapshot.stored_mods:
+            for mod in mods:
+                self._mod_slots.setdefault(mod, []).append(slot)
+        self._mods_changed()
+        self._snapshot = ChassisSnapshot(self.version, snapshot.stored_mods)
 
     def all_mods(self) -> Iterable[Mod]:
         return self._all_mods(active_only=False)
@@ -86,16 +137,25 @@ class Chassis(InventoryBase):
         return self._all_mods(active_only=True)
 
     def _all_mods(self, active_only: bool = True) -> Iterable[Mod]:
-        # noinspection PyTypeChecker
-        checked_slots = set(self._stored_mods.keys())
-        if active_only:
-            checked_slots.remove(SlotTypes.STORAGE)
-        mods = reduce(set.union,  # type: ignore
-                      (set(self._stored_mods[slot])
-                       for slot in checked_slots))  # type: ignore
-        if self._base_mod is not None:
-            mods.add(self._base_mod)
-        return mods
+        # Cached sets are replaced rather than modified, so callers may change
+        # the chassis while iterating over them.
+        if active_only not in self._mod_sets:
+            mods = {mod for mod, slots in self._mod_slots.items()
+                    if not active_only
+                    or any(s is not SlotTypes.STORAGE for s in slots)}
+            if self._base_mod is not None:
+                mods.add(self._base_mod)
+            self._mod_sets[active_only] = frozenset(mods)
+        return self._mod_sets[active_only]
+
+    def _mods_changed(self) -> None:
+        super()._mods_changed()
+        self._mod_sets.clear()
+
+    def _add_to_slot(self, mod: Mod, slot: SlotTypes) -> None:
+        self._stored_mods[slot].append(mod)
+        self._mod_slots.setdefault(mod, []).append(slot)
+        self._mods_changed()
 
     def _open_slots(self, slots: Iterable[SlotTypes]) -> List[SlotTypes]:
         return [s for s in slots if self._slot_vacant(s)]
@@ -111,7 +171,7 @@ class Chassis(InventoryBase):
         else:
             slot = SlotTypes.STORAGE
 
-        self._stored_mods[slot].append(mod)
+        self._add_to_slot(mod, slot)
         logging.debug('INVENTORY: Storing mod in slot {}.'.format(slot.value))
 
 
@@ -1,6 +1,7 @@
-from typing import Any, Callable, NamedTuple, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
 
 from models.characters.states import Attributes, Stateful
+from models.characters.status import StatusPopulation
 
 BoolFun = Callable[[Stateful], bool]
 
@@ -60,6 +61,29 @@ is_dead = status_condition(
 is_alive = ~ is_dead
 
 
+def are_dead(targets: Sequence[Stateful]) -> List[bool]:
+    """Evaluate is_dead for many targets.
+
+    Targets whose statuses are backed by a StatusPopulation are evaluated with
+    one bulk call per population.
+    """
+    dead = [False] * len(targets)
+    population_rows: Dict[StatusPopulation, List[Tuple[int, int]]] = {}
+    for i, target in enumerate(targets):
+        row_status = target.status.population_status()
+        if row_status is None:
+            dead[i] = is_dead(target)
+        else:
+            population_rows.setdefault(row_status.population, []).append(
+                (i, row_status.row))
+
+    for population, index_rows in population_rows.items():
+        rows_dead = population.is_dead([row for _, row in index_rows])
+        for (i, _), row_dead in zip(index_rows, rows_dead):
+            dead[i] = row_dead
+    return dead
+
+
 def _is_hurt(target: Stateful) -> bool:
     value = target.status.get_attribute
     return value(Attributes.HEALTH) < value(Attributes.MAX_HEALTH)
@@ -1,7 +1,7 @@
 """Basic implementation of character inventory."""
 import abc
 import logging
-from typing import Callable, Iterable, List, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
 
 from models.characters.mods_base import Mod
 from models.characters.states import AttributeType, State
@@ -13,8 +13,38 @@ def _subroutine_stats(subroutine: Subroutine) -> Tuple[int, int, str]:
             subroutine.description())
 
 
+class SubroutineCacheStats(NamedTuple):
+    """Counters of all_subroutines calls on an inventory.
+
+    Attributes:
+        hits: Calls answered from the cache.
+        misses: Calls that collected and sorted the subroutines.
+    """
+    hits: int = 0
+    misses: int = 0
+
+
 class InventoryBase(metaclass=abc.ABCMeta):
 
+    def __init__(self) -> None:
+        self._version = 0
+        # active_only -> (inventory version, sorted subroutines)
+        self._subroutine_cache: Dict[
+            bool, Tuple[int, Tuple[Subroutine, ...]]] = {}
+        self._subroutine_cache_hits = 0
+        self._subroutine_cache_misses = 0
+
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever the stored mods change.
+
+        Implementations must call _mods_changed after changing their mods.
+        """
+        return self._version
+
+    def _mods_changed(self) -> None:
+        self._version += 1
+
     @abc.abstractmethod
     def can_store(self, mod: Mod) -> bool:
         """Whether a mod can be stored."""
@@ -31,6 +61,7 @@ class InventoryBase(metaclass=abc.ABCMeta):
         if self.can_store(mod):
             logging.debug('{} picking up {}'.format(self, mod_type))
             self._store(mod)
+            self._mods_changed()
         else:
             logging.debug(
                 '{} attempted to pickup {} but was unable.'.format(self,
@@ -65,22 +96,37 @@ class InventoryBase(metaclass=abc.ABCMeta):
     def all_subroutines(self, active_only: bool = True) -> Sequence[Subroutine]:
         """All subroutines granted by all mods
 
+        The result is cached until the inventory version changes, so
+        subroutines are sorted by their stats at the time of caching.
+
         Args:
             active_only: Whether to only consider active mods (not in storage
                 slot).
 
         Returns:
-            A list of all subroutines sorted by description, cpu slots, and
+            A tuple of all subroutines sorted by description, cpu slots, and
             time slots.
 
         """
+        cached = self._subroutine_cache.get(active_only)
+        if cached is not None and cached[0] == self._version:
+            self._subroutine_cache_hits += 1
+            return cached[1]
+        self._subroutine_cache_misses += 1
+
         mods_with_subroutines = self.mods(
             lambda m: bool(m.subroutines_granted()),
             active_only=active_only)
         subroutines: List[Subroutine] = []
         for mod in mods_with_subroutines:
             subroutines.extend(mod.subroutines_granted())
-        return sorted(subroutines, key=_subroutine_stats)
+        result = tuple(sorted(subroutines, key=_subroutine_stats))
+        self._subroutine_cache[active_only] = (self._version, result)
+        return result
+
+    def subroutine_cache_stats(self) -> SubroutineCacheStats:
+        return SubroutineCacheStats(self._subroutine_cache_hits,
+                                    self._subroutine_cache_misses)
 
 
 class BasicInventory(InventoryBase):
@@ -90,6 +136,7 @@ class BasicInventory(InventoryBase):
     """
 
     def __init__(self) -> None:
+        super().__init__()
         self._mods: List[Mod] = []
 
     def can_store(self, mod: Mod) -> bool:
@@ -101,6 +148,7 @@ class BasicInventory(InventoryBase):
     def remove_mod(self, mod: Mod) -> None:
         assert mod in self._mods, 'mod {} not in inventory.'.format(mod)
         self._mods.remove(mod)
+        self._mods_changed()
 
     def all_mods(self) -> Iterable[Mod]:
         return (m for m in self._mods)
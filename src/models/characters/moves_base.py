@@ -5,9 +5,20 @@ from models.characters.subroutines_base import Subroutine
 
 
 class Move(NamedTuple):
+    """A subroutine used by one character on another.
+
+    Attributes:
+        subroutine: Subroutine being used.
+        user: Character using the subroutine.
+        target: Target of the subroutine.
+        instance_id: Distinguishes moves with the same subroutine, user and
+            target once they are in combat. Moves selected by AIs have id 0,
+            and CombatLogic assigns a unique id to each move it receives.
+    """
     subroutine: Subroutine
     user: Character
     target: Character
+    instance_id: int = 0
 
     def execute(self) -> None:
         self.subroutine.use(self.user, self.target)
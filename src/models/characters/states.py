@@ -1,11 +1,14 @@
 """Abstract implementation of states and conditions."""
 from abc import ABCMeta, abstractmethod
 from enum import Enum
-from typing import (Callable, Dict, FrozenSet, Iterable, NamedTuple, Sequence,
-                    Union, cast)
+from typing import (TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable,
+                    NamedTuple, Optional, Sequence, Union, cast)
 
 from frozendict import frozendict
 
+if TYPE_CHECKING:
+    from models.characters.status import PopulationStatus  # noqa: F401
+
 
 class State(Enum):
     """Label for basic state condition requiring no internal logic to check.
@@ -153,6 +156,33 @@ class Status(metaclass=ABCMeta):
          if check is None, then all status effects are returned.
          """
 
+    def snapshot(self) -> Any:
+        """An opaque copy of the attribute values, states and status effects.
+
+        Attribute bounds are not included. See restore. This is optional for
+        Status implementations, and required to simulate combats with
+        CombatLogic.snapshot (e.g. by search_ai.SearchAI).
+        """
+        raise NotImplementedError(
+            '{} does not support snapshots.'.format(type(self).__name__))
+
+    def restore(self, snapshot: Any) -> None:
+        """Return to the values, states and effects of an earlier snapshot.
+
+        Args:
+            snapshot: Value returned by snapshot() on this object.
+        """
+        raise NotImplementedError(
+            '{} does not support snapshots.'.format(type(self).__name__))
+
+    def population_status(self) -> Optional['PopulationStatus']:
+        """The StatusPopulation row backing this status, if any.
+
+        Statuses backed by a population can be evaluated in bulk (see
+        status.StatusPopulation).
+        """
+        return None
+
 
 class Stateful(metaclass=ABCMeta):
     """An in-game object with an in-game state."""
@@ -1,40 +1,137 @@
-"""Implementation of  BasicStatus"""
-import math
-from collections import defaultdict
-from functools import reduce
-from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+"""Implementations of BasicStatus and its compact variants"""
+import abc
+from array import array
+from collections import Counter, defaultdict
+from typing import (Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional,
+                    Sequence, Set, Tuple, Union)
 
-from models.characters.states import (Attributes, AttributeType, State, Status,
-                                      StatusEffect)
+from models.characters.states import (Attributes, AttributeType, Skills, State,
+                                      Status, StatusEffect)
 
 _BoundFun = Callable[[], int]
 _BoundType = Optional[Union[int, AttributeType, _BoundFun]]
 
 
-class BasicStatus(Status):
+class _Bounds(NamedTuple):
+    """Lower and upper bounds of an attribute.
+
+    Each bound is None (unbounded), an int, an attribute whose value is the
+    bound, or a zero-argument function returning the bound.
+    """
+    lower: _BoundType
+    upper: _BoundType
+    constant: bool  # Whether both bounds are None or ints.
+
+
+def _is_constant(bound: _BoundType) -> bool:
+    return bound is None or isinstance(bound, int)
+
+
+class _BasicSnapshot(NamedTuple):
+    """Contents of a BasicStatus, excluding attribute bounds."""
+    states: FrozenSet[State]
+    status_effects: Tuple[StatusEffect, ...]
+    states_from_effects: FrozenSet[State]
+    states_prevented: FrozenSet[State]
+    granted_counts: Tuple[Tuple[State, int], ...]
+    prevented_counts: Tuple[Tuple[State, int], ...]
+    attributes: Tuple[Tuple[AttributeType, int], ...]
+
+
+class _BitmaskSnapshot(NamedTuple):
+    """Contents of a _BitmaskStatus, excluding attribute bounds."""
+    status_effects: Tuple[StatusEffect, ...]
+    state_bits: int
+    effect_state_bits: int
+    prevented_bits: int
+    granted_bit_counts: Tuple[int, ...]
+    prevented_bit_counts: Tuple[int, ...]
+    values: Tuple[int, ...]
+    modifiers: Tuple[int, ...]
+
+
+class BoundedStatus(Status):
+    """A Status whose attribute values can be kept within bounds.
+
+    Bounds can be set by passing numbers, references to other attributes, or
+    no_argument functions.
+    """
+
+    def __init__(self) -> None:
+        self._attribute_bounds: Dict[AttributeType, _Bounds] = {}
+        # Status whose attribute values are used by attribute reference bounds.
+        self._bound_source: Status = self
+
+    def set_bound_source(self, source: Status) -> None:
+        """Read attribute reference bounds from another status.
+
+        This lets a status wrapping this one (e.g. adding mod modifiers) bound
+        attributes by its own values, without a function call per bound.
+        """
+        self._bound_source = source
+
+    def set_attribute_bounds(
+            self, attribute: AttributeType,
+            lower: _BoundType,
+            upper: _BoundType) -> None:
+        """Set increment bounds for an attribute.
+        """
+        if isinstance(lower, int) and isinstance(upper, int):
+            assert lower <= upper
+
+        self._attribute_bounds[attribute] = _Bounds(
+            lower, upper, _is_constant(lower) and _is_constant(upper))
+
+    def _bound_value(self, bound: _BoundType) -> Optional[int]:
+        if _is_constant(bound):
+            return bound  # type: ignore
+        if isinstance(bound, (Attributes, Skills)):
+            return self._bound_source.get_attribute(bound)
+        return bound()  # type: ignore
+
+    def value_in_bounds(self, value: int, attribute: AttributeType) -> int:
+        """Bracket a given value within the bounds of a given attribute."""
+        bounds = self._attribute_bounds.get(attribute)
+        if bounds is None:
+            return value
+
+        lower, upper, constant = bounds
+        # Constant bounds are compared directly, without function calls.
+        if not constant:
+            lower = self._bound_value(lower)
+            upper = self._bound_value(upper)
+            assert lower is None or upper is None or lower <= upper
+        if lower is not None and value < lower:  # type: ignore
+            value = lower  # type: ignore
+        if upper is not None and value > upper:  # type: ignore
+            value = upper  # type: ignore
+        return value
+
+
+class BasicStatus(BoundedStatus):
     """A Stateful object implemented using sets and dictionaries.
 
-    Also included is the ability to set bounds for attributes. This can be
-    done by passing numbers, references to other attributes, or no_argument
-    functions.
+    Also included is the ability to set bounds for attributes (see
+    BoundedStatus).
 
     This implementation also satisfies the contract specified for StatusEffect.
     """
 
     def __init__(self) -> None:
+        super().__init__()
         self._states: Set[State] = set()
         self._status_effects: List[StatusEffect] = []
         self._states_from_effects: Set[State] = set()
         self._states_prevented: Set[State] = set()
+        # Number of active effects granting / preventing each state.
+        self._granted_counts: Counter = Counter()
+        self._prevented_counts: Counter = Counter()
         self._attributes: defaultdict = defaultdict(lambda: 0)
-        self._attribute_bounds: Dict[
-            AttributeType, Tuple[_BoundFun, _BoundFun]] = {}
 
     def has_state(self, state: State) -> bool:
         """Whether object has a given state.
 
         If not otherwise set, default is False."""
-        assert not (self._states_from_effects & self._states_prevented)
         return state in self._states or state in self._states_from_effects
 
     def set_state(self, state: State, value: bool) -> None:
@@ -58,79 +155,355 @@ class BasicStatus(Status):
                          for effect in self._status_effects)
         return self.value_in_bounds(value, attribute)
 
-    def set_attribute_bounds(
-            self, attribute: AttributeType,
-            lower: _BoundType,
-            upper: _BoundType) -> None:
-        """Set increment bounds for an attribute.
+    def increment_attribute(self, attribute: AttributeType, delta: int) -> None:
+        new_val = self._attributes[attribute] + delta
+        new_val = self.value_in_bounds(new_val, attribute)
+        self._attributes[attribute] = new_val
+
+    def set_attribute(self, attribute: AttributeType, value: int) -> None:
+        value = self.value_in_bounds(value, attribute)
+        self._attributes[attribute] = value
+
+    def _update_effect_states(self, effect: StatusEffect, sign: int) -> None:
+        """Account for an effect being added (sign=1) or removed (sign=-1).
+
+        Only the states of the given effect are updated.
         """
-        if isinstance(lower, int) and isinstance(upper, int):
-            assert lower <= upper
+        self._granted_counts.update({s: sign for s in effect.states_granted})
+        self._prevented_counts.update(
+            {s: sign for s in effect.states_prevented})
 
-        lower = self._parse_bound(lower, True)
-        upper = self._parse_bound(upper, False)
+        for state in effect.states_granted | effect.states_prevented:
+            if self._prevented_counts[state]:
+                self._states_prevented.add(state)
+                self._states_from_effects.discard(state)
+                self._states.discard(state)
+                continue
+            self._states_prevented.discard(state)
+            if self._granted_counts[state]:
+                self._states_from_effects.add(state)
+            else:
+                self._states_from_effects.discard(state)
 
-        self._attribute_bounds[attribute] = (lower, upper)
+    def add_status_effect(self, effect: StatusEffect) -> None:
+        self._status_effects.append(effect)
+        self._update_effect_states(effect, 1)
 
-    def _parse_bound(self, bound: _BoundType, is_lower: bool) -> _BoundFun:
-        if bound is None:
-            bound = -math.inf if is_lower else math.inf  # type:ignore
+    def remove_status_effect(self, effect: StatusEffect) -> None:
+        assert effect in self._status_effects, ('object does not have effect '
+                                                '{}'.format(effect))
+        self._status_effects.remove(effect)
+        self._update_effect_states(effect, -1)
 
-            def int_fun() -> int:
-                return bound  # type:ignore
-        elif isinstance(bound, int):
-            def int_fun() -> int:
-                return bound  # type: ignore
-        elif isinstance(bound, Attributes):
-            def int_fun() -> int:
-                return self.get_attribute(bound)  # type: ignore
-        else:
-            int_fun = bound  # type: ignore
+    def active_effects(self, check: Callable[[StatusEffect], bool] = None
+                       ) -> Sequence[StatusEffect]:
+        if check is None:
+            return self._status_effects.copy()
+        return [effect for effect in self._status_effects if check(effect)]
 
-        return int_fun
+    def snapshot(self) -> Any:
+        return _BasicSnapshot(frozenset(self._states),
+                              tuple(self._status_effects),
+                              frozenset(self._states_from_effects),
+                              frozenset(self._states_prevented),
+                              tuple(self._granted_counts.items()),
+                              tuple(self._prevented_counts.items()),
+                              tuple(self._attributes.items()))
 
-    def value_in_bounds(self, value: int, attribute: AttributeType) -> int:
-        """Bracket a given value within the bounds of a given attribute."""
-        if attribute in self._attribute_bounds:
-            lower, upper = self._attribute_bounds[attribute]
-            l_val, u_val = lower(), upper()
-            assert l_val <= u_val
-            value = max(l_val, value)
-            value = min(u_val, value)
-        return value
+    def restore(self, snapshot: Any) -> None:
+        self._states = set(snapshot.states)
+        self._status_effects = list(snapshot.status_effects)
+        self._states_from_effects = set(snapshot.states_from_effects)
+        self._states_prevented = set(snapshot.states_prevented)
+        self._granted_counts = Counter(dict(snapshot.granted_counts))
+        self._prevented_counts = Counter(dict(snapshot.prevented_counts))
+        self._attributes.clear()
+        self._attributes.update(snapshot.attributes)
 
-    def increment_attribute(self, attribute: AttributeType, delta: int) -> None:
-        new_val = self._attributes[attribute] + delta
-        new_val = self.value_in_bounds(new_val, attribute)
-        self._attributes[attribute] = new_val
 
-    def set_attribute(self, attribute: AttributeType, value: int) -> None:
-        value = self.value_in_bounds(value, attribute)
-        self._attributes[attribute] = value
+# Fixed positions of attributes in attribute arrays and of states in state
+# bitmasks.
+_ATTRIBUTE_INDICES: Dict[AttributeType, int] = {
+    att: i for i, att in enumerate(tuple(Attributes) + tuple(Skills))}
+_STATE_BITS: Dict[State, int] = {state: 1 << i
+                                 for i, state in enumerate(State)}
+
 
-    def _update_effect_states(self) -> None:
-        self._states_prevented = reduce(set.union,
-                                        (set(eff.states_prevented)
-                                         for eff in self._status_effects),
-                                        set())
-        self._states_from_effects = reduce(set.union,
-                                           (set(eff.states_granted) for eff in
-                                            self._status_effects), set())
-        self._states_from_effects -= self._states_prevented
-        self._states -= self._states_prevented
+class _BitmaskStatus(BoundedStatus):
+    """A status with states kept in integer bitmasks.
+
+    The states granted and prevented by status effects are counted per state,
+    so that adding or removing an effect does not revisit the other effects.
+    Subclasses store attribute values and the modifiers of status effects.
+    Only the bounds are shared with BasicStatus, so that instances do not
+    allocate its sets and dictionaries.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._status_effects: List[StatusEffect] = []
+        self._state_bits = 0
+        self._effect_state_bits = 0
+        self._prevented_bits = 0
+        self._granted_bit_counts = [0] * len(_STATE_BITS)
+        self._prevented_bit_counts = [0] * len(_STATE_BITS)
+
+    def has_state(self, state: State) -> bool:
+        bit = _STATE_BITS[state]
+        return bool((self._state_bits | self._effect_state_bits) & bit)
+
+    def set_state(self, state: State, value: bool) -> None:
+        bit = _STATE_BITS[state]
+        if bit & (self._prevented_bits | self._effect_state_bits):
+            return  # state cannot be changed
+
+        if value:
+            self._state_bits |= bit
+        else:
+            self._state_bits &= ~bit
 
     def add_status_effect(self, effect: StatusEffect) -> None:
         self._status_effects.append(effect)
-        self._update_effect_states()
+        self._apply_effect_modifiers(effect, 1)
+        self._apply_effect_states(effect, 1)
 
     def remove_status_effect(self, effect: StatusEffect) -> None:
         assert effect in self._status_effects, ('object does not have effect '
                                                 '{}'.format(effect))
         self._status_effects.remove(effect)
-        self._update_effect_states()
+        self._apply_effect_modifiers(effect, -1)
+        self._apply_effect_states(effect, -1)
 
     def active_effects(self, check: Callable[[StatusEffect], bool] = None
                        ) -> Sequence[StatusEffect]:
         if check is None:
             return self._status_effects.copy()
         return [effect for effect in self._status_effects if check(effect)]
+
+    def snapshot(self) -> Any:
+        values, modifiers = self._attribute_rows()
+        return _BitmaskSnapshot(tuple(self._status_effects), self._state_bits,
+                                self._effect_state_bits, self._prevented_bits,
+                                tuple(self._granted_bit_counts),
+                                tuple(self._prevented_bit_counts),
+                                values, modifiers)
+
+    def restore(self, snapshot: Any) -> None:
+        self._status_effects = list(snapshot.status_effects)
+        self._state_bits = snapshot.state_bits
+        self._effect_state_bits = snapshot.effect_state_bits
+        self._prevented_bits = snapshot.prevented_bits
+        self._granted_bit_counts = list(snapshot.granted_bit_counts)
+        self._prevented_bit_counts = list(snapshot.prevented_bit_counts)
+        self._set_attribute_rows(snapshot.values, snapshot.modifiers)
+
+    @abc.abstractmethod
+    def _apply_effect_modifiers(self, effect: StatusEffect, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) the modifiers of an effect."""
+
+    @abc.abstractmethod
+    def _attribute_rows(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Base values and effect modifiers of all attributes, by index."""
+
+    @abc.abstractmethod
+    def _set_attribute_rows(self, values: Sequence[int],
+                            modifiers: Sequence[int]) -> None:
+        """Set all base values and effect modifiers, by attribute index."""
+
+    def _apply_effect_states(self, effect: StatusEffect, sign: int) -> None:
+        if not (effect.states_granted or effect.states_prevented):
+            return
+        granted, prevented = 0, 0
+        for i, state in enumerate(_STATE_BITS):
+            if state in effect.states_granted:
+                self._granted_bit_counts[i] += sign
+            if state in effect.states_prevented:
+                self._prevented_bit_counts[i] += sign
+            if self._granted_bit_counts[i]:
+                granted |= _STATE_BITS[state]
+            if self._prevented_bit_counts[i]:
+                prevented |= _STATE_BITS[state]
+
+        self._prevented_bits = prevented
+        self._effect_state_bits = granted & ~prevented
+        self._state_bits &= ~prevented
+
+
+class CompactStatus(_BitmaskStatus):
+    """A status storing attributes in integer arrays and states as bits.
+
+    Base attribute values and the summed modifiers of all status effects are
+    kept in two array('i') vectors indexed by attribute, so that get_attribute
+    does not iterate over status effects. States are kept in integer bitmasks,
+    with per-state counts of the effects granting and preventing them.
+    Attribute values must fit in a C int.
+
+    Bounds behave as in BasicStatus.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        num_attributes = len(_ATTRIBUTE_INDICES)
+        self._values = array('i', [0] * num_attributes)
+        self._modifiers = array('i', [0] * num_attributes)
+
+    def get_attribute(self, attribute: AttributeType) -> int:
+        index = _ATTRIBUTE_INDICES[attribute]
+        value = self._values[index] + self._modifiers[index]
+        return self.value_in_bounds(value, attribute)
+
+    def increment_attribute(self, attribute: AttributeType, delta: int) -> None:
+        index = _ATTRIBUTE_INDICES[attribute]
+        new_val = self.value_in_bounds(self._values[index] + delta, attribute)
+        self._values[index] = new_val
+
+    def set_attribute(self, attribute: AttributeType, value: int) -> None:
+        index = _ATTRIBUTE_INDICES[attribute]
+        self._values[index] = self.value_in_bounds(value, attribute)
+
+    def _apply_effect_modifiers(self, effect: StatusEffect, sign: int) -> None:
+        for attribute, modifier in effect.attribute_modifiers.items():
+            self._modifiers[_ATTRIBUTE_INDICES[attribute]] += sign * modifier
+
+    def _attribute_rows(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        return tuple(self._values), tuple(self._modifiers)
+
+    def _set_attribute_rows(self, values: Sequence[int],
+                            modifiers: Sequence[int]) -> None:
+        self._values = array('i', values)
+        self._modifiers = array('i', modifiers)
+
+
+class StatusPopulation(object):
+    """Struct-of-arrays storage for the attributes of many statuses.
+
+    Each attribute has a column of base values and a column of summed status
+    effect modifiers, with one row per status. Rows are presented as
+    PopulationStatus objects, created with add_status. Bulk operations on many
+    rows work directly on the columns. Attribute values must fit in a C int.
+    """
+
+    def __init__(self) -> None:
+        num_attributes = len(_ATTRIBUTE_INDICES)
+        self._values = [array('i') for _ in range(num_attributes)]
+        self._modifiers = [array('i') for _ in range(num_attributes)]
+        self._statuses: List['PopulationStatus'] = []
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def add_status(self) -> 'PopulationStatus':
+        """Add a row to the population and return the status presenting it."""
+        for column in self._values + self._modifiers:
+            column.append(0)
+        status = PopulationStatus(self, len(self._statuses))
+        self._statuses.append(status)
+        return status
+
+    def status(self, row: int) -> 'PopulationStatus':
+        return self._statuses[row]
+
+    def attribute_values(self, attribute: AttributeType,
+                         rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Values of an attribute for many rows.
+
+        Each value is what get_attribute returns for the owner of the row (see
+        PopulationStatus.set_owner), or for the row itself if it has no owner.
+        Owners are asked for their values, so that any caching they do is
+        used.
+
+        Args:
+            attribute: Attribute to evaluate.
+            rows: (Optional) Rows to evaluate. Default is all rows.
+        """
+        if rows is None:
+            rows = range(len(self))
+        index = _ATTRIBUTE_INDICES[attribute]
+        values, modifiers = self._values[index], self._modifiers[index]
+
+        result = []
+        for row in rows:
+            status = self._statuses[row]
+            if status.owner_attribute is not None:
+                result.append(status.owner_attribute(attribute))
+            else:
+                result.append(status.value_in_bounds(
+                    values[row] + modifiers[row], attribute))
+        return result
+
+    def is_dead(self, rows: Optional[Sequence[int]] = None) -> List[bool]:
+        """Whether health is not positive, for many rows.
+
+        Args:
+            rows: (Optional) Rows to evaluate. Default is all rows.
+        """
+        return [health <= 0
+                for health in self.attribute_values(Attributes.HEALTH, rows)]
+
+
+class PopulationStatus(_BitmaskStatus):
+    """A status presenting one row of a StatusPopulation.
+
+    Use StatusPopulation.add_status to create these. Bounds and states behave
+    as in BasicStatus.
+    """
+
+    def __init__(self, population: StatusPopulation, row: int) -> None:
+        super().__init__()
+        self._population = population
+        self._row = row
+        self.owner_attribute: Optional[Callable[[AttributeType], int]] = None
+
+    @property
+    def population(self) -> StatusPopulation:
+        return self._population
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def population_status(self) -> Optional['PopulationStatus']:
+        return self
+
+    def set_owner(self, get_attribute: Callable[[AttributeType], int]
+                  ) -> None:
+        """Register a status that presents this one with extra modifiers.
+
+        Args:
+            get_attribute: Attribute getter of the owner (e.g. including mod
+                modifiers), used for the row's values in bulk evaluation.
+        """
+        self.owner_attribute = get_attribute
+
+    def get_attribute(self, attribute: AttributeType) -> int:
+        index = _ATTRIBUTE_INDICES[attribute]
+        value = (self._population._values[index][self._row]
+                 + self._population._modifiers[index][self._row])
+        return self.value_in_bounds(value, attribute)
+
+    def increment_attribute(self, attribute: AttributeType, delta: int) -> None:
+        column = self._population._values[_ATTRIBUTE_INDICES[attribute]]
+        column[self._row] = self.value_in_bounds(column[self._row] + delta,
+                                                 attribute)
+
+    def set_attribute(self, attribute: AttributeType, value: int) -> None:
+        column = self._population._values[_ATTRIBUTE_INDICES[attribute]]
+        column[self._row] = self.value_in_bounds(value, attribute)
+
+    def _apply_effect_modifiers(self, effect: StatusEffect, sign: int) -> None:
+        for attribute, modifier in effect.attribute_modifiers.items():
+            column = self._population._modifiers[_ATTRIBUTE_INDICES[attribute]]
+            column[self._row] += sign * modifier
+
+    def _attribute_rows(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        row = self._row
+        return (tuple(column[row] for column in self._population._values),
+                tuple(column[row] for column in self._population._modifiers))
+
+    def _set_attribute_rows(self, values: Sequence[int],
+                            modifiers: Sequence[int]) -> None:
+        row = self._row
+        for column, value in zip(self._population._values, values):
+            column[row] = value
+        for column, modifier in zip(self._population._modifiers, modifiers):
+            column[row] = modifier
@@ -34,6 +34,11 @@ def same_team(user: Character, target: Character) -> bool:
     return user.status.has_state(is_plyr) == target.status.has_state(is_plyr)
 
 
+def different_team(user: Character, target: Character) -> bool:
+    """Returns True if user and target are on different teams."""
+    return not same_team(user, target)
+
+
 def repair(amount: int) -> Subroutine:
     """Self repair subroutine.
 
@@ -102,9 +107,11 @@ def adjust_attribute(attribute: Attributes, amount: int = 0,
             return not same_team(user, target)
 
     def after_effect(user: Character, target: Character) -> None:
-        # If some other subroutine removes the effect first, this can cause
-        # an error.
-        target.status.remove_status_effect(effect)
+        # The after-effect is also invoked when the move is removed before it
+        # resolved (e.g. because the target died), in which case the effect
+        # was never added.
+        if effect in target.status.active_effects():
+            target.status.remove_status_effect(effect)
 
     if cpu_slots is None:
         cpu_slots = abs(amount)
@@ -179,14 +186,11 @@ def direct_damage(damage: int, cpu_slots: int = None,
     def use_fun(user: Character, target: Character) -> None:
         damage_target(damage, target)
 
-    def can_use_fun(user: Character, target: Character) -> bool:
-        return not same_team(user, target)
-
     description = '{} damage'.format(damage, time_to_resolve)
     if label:
         description = label + ' ' + description
-    return build_subroutine(use_fun, can_use_fun, cpu_slots, time_to_resolve,
-                            description)
+    return build_subroutine(use_fun, different_team, cpu_slots,
+                            time_to_resolve, description)
 
 
 def damage_over_time(damage_per_round: int, num_rounds: int = 2,
@@ -224,12 +228,9 @@ def damage_over_time(damage_per_round: int, num_rounds: int = 2,
     def use_fun(user: Character, target: Character) -> None:
         damage_target(damage_per_round, target)
 
-    def can_use_fun(user: Character, target: Character) -> bool:
-        return not same_team(user, target)
-
     description = '{} damage/{} turns'.format(damage_per_round * num_rounds,
                                               num_rounds)
     if label:
         description = label + ' ' + description
-    return build_subroutine(use_fun, can_use_fun, cpu_slots, time_to_resolve,
-                            description, num_rounds - 1, multi_use=True)
+    return build_subroutine(use_fun, different_team, cpu_slots,
+                            time_to_resolve, description, num_rounds - 1, multi_use=True)
@@ -16,6 +16,8 @@ class Subroutine(object):
 
     """
 
+    __slots__ = ()
+
     def _use(self, user: Character, target: Character) -> None:
         """Internal implementation of use method, must be overridden."""
         pass
@@ -62,6 +64,15 @@ class Subroutine(object):
     def description(self) -> str:
         """"Description of the subroutine."""
 
+    def target_predicate(self) -> Union[bool, Callable[[Character, Character],
+                                                       bool]]:
+        """The (user, target) predicate used by can_use, or a constant bool.
+
+        Subroutines returning the same predicate may have it evaluated once
+        per target on their behalf. By default this is the can_use method.
+        """
+        return self.can_use
+
     @abc.abstractmethod
     def copy(self) -> 'Subroutine':
         """Return a copy of the subroutine.
@@ -98,6 +109,9 @@ class _SubroutineImpl(Subroutine):
     def can_use(self, user: Character, target: Character) -> bool:
         return self._can_use_fun(user, target)
 
+    def target_predicate(self) -> Callable[[Character, Character], bool]:
+        return self._can_use_fun
+
     def cpu_slots(self) -> int:
         return self._cpu_slot_fun()
 
@@ -125,6 +139,73 @@ class _SubroutineImpl(Subroutine):
     copy = __copy__
 
 
+class _ConstantSubroutine(Subroutine):
+    """Subroutine whose cpu slots, timings and description are constant.
+
+    Constant values are stored directly in slots rather than wrapped in
+    no-argument functions, so that they are cheap to read and to copy.
+    """
+
+    __slots__ = ('_use_fun', '_can_use', '_can_use_fun', '_cpu_slots',
+                 '_time_to_resolve', '_description', '_duration', '_multi_use',
+                 '_after_effect_fun')
+
+    def __init__(self, use_fun: Callable[[Character, Character], None],
+                 can_use: Union[bool, Callable[[Character, Character], bool]],
+                 cpu_slots: int, time_to_resolve: int, description: str,
+                 duration: int, multi_use: bool,
+                 after_effect_fun: Callable[[Character, Character], None]
+                 ) -> None:
+        self._use_fun = use_fun
+        self._can_use = can_use
+        # Constant predicates are resolved once, so that can_use is one call.
+        self._can_use_fun: Callable[[Character, Character], bool] = (
+            partial(_can_use_constant, value=can_use)
+            if isinstance(can_use, bool) else can_use)
+        self._cpu_slots = cpu_slots
+        self._time_to_resolve = time_to_resolve
+        self._description = description
+        self._duration = duration
+        self._multi_use = multi_use
+        self._after_effect_fun = after_effect_fun
+
+    def use(self, user: Character, target: Character) -> None:
+        self._use_fun(user, target)
+
+    def can_use(self, user: Character, target: Character) -> bool:
+        return self._can_use_fun(user, target)
+
+    def target_predicate(self) -> Union[bool, Callable[[Character, Character],
+                                                       bool]]:
+        return self._can_use
+
+    def cpu_slots(self) -> int:
+        return self._cpu_slots
+
+    def time_to_resolve(self) -> int:
+        return self._time_to_resolve
+
+    def description(self) -> str:
+        return self._description
+
+    def duration(self) -> int:
+        return self._duration
+
+    def multi_use(self) -> bool:
+        return self._multi_use
+
+    def after_effect(self, user: Character, target: Character) -> None:
+        self._after_effect_fun(user, target)
+
+    def __copy__(self) -> Subroutine:
+        return _ConstantSubroutine(self._use_fun, self._can_use,
+                                   self._cpu_slots, self._time_to_resolve,
+                                   self._description, self._duration,
+                                   self._multi_use, self._after_effect_fun)
+
+    copy = __copy__
+
+
 def _do_nothing(user: Character, target: Character) -> None:
     pass
 
@@ -170,11 +251,26 @@ def build_subroutine(
             boolean.
         after_effect: Function invoked when the subroutine duration expires. By
             default no effect occurs.
+
+    If num_cpu, time_to_resolve, description, duration and multi_use are all
+    constants, the returned subroutine stores them directly instead of
+    wrapping them in functions.
     """
 
     use_fun = _do_nothing if use_fun is None else use_fun
     after_effect = _do_nothing if after_effect is None else after_effect
 
+    if (isinstance(num_cpu, int) and isinstance(time_to_resolve, int)
+            and isinstance(description, str) and isinstance(duration, int)
+            and isinstance(multi_use, bool)):
+        if num_cpu < 0:
+            raise ValueError('non-negative num_cpu only.')
+        if time_to_resolve < 0:
+            raise ValueError('non-negative time_to_resolve only.')
+        return _ConstantSubroutine(use_fun, can_use, num_cpu, time_to_resolve,
+                                   description, duration, multi_use,
+                                   after_effect)
+
     if isinstance(can_use, bool):
         can_use = partial(_can_use_constant, value=can_use)
 
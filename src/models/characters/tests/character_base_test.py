@@ -3,20 +3,22 @@ from unittest import TestCase
 from models.characters.character_examples import CharacterData
 from models.characters.character_impl import build_character
 from models.characters.chassis import ChassisData
-from models.characters.conditions import is_dead
+from models.characters.conditions import are_dead, is_dead
 from models.characters.mods_base import SlotTypes, build_mod
-from models.characters.states import Attributes, State
-from models.characters.subroutine_examples import direct_damage
+from models.characters.states import Attributes, State, StatusEffect
+from models.characters.status import StatusPopulation
+from models.characters.subroutine_examples import damage_target, direct_damage
 
 _ACTIVE_SLOT = SlotTypes.ARMS
 
 
 class CharacterTest(TestCase):
 
-    def _character(self):
+    def _character(self, population=None):
         chassis = ChassisData({SlotTypes.STORAGE: 10, _ACTIVE_SLOT: 10},
                               attribute_modifiers={Attributes.MAX_HEALTH: 10})
-        return build_character(data=CharacterData(chassis))
+        return build_character(data=CharacterData(chassis),
+                               population=population)
 
     def test_character_has_attributes(self):
         char = self._character()
@@ -66,3 +68,87 @@ class CharacterTest(TestCase):
             build_mod(subroutines_granted=subroutine,
                       valid_slots=_ACTIVE_SLOT))
         assert subroutine in char.chassis.all_subroutines()
+
+    def test_repeated_attribute_lookups_hit_cache(self):
+        char = self._character()
+        char.status.get_attribute(Attributes.MAX_HEALTH)
+        stats = char.status.cache_stats()
+
+        char.status.get_attribute(Attributes.MAX_HEALTH)
+
+        assert char.status.cache_stats().hits == stats.hits + 1
+        assert char.status.cache_stats().misses == stats.misses
+
+    def test_mod_changes_invalidate_attribute_cache(self):
+        char = self._character()
+        max_health = char.status.get_attribute(Attributes.MAX_HEALTH)
+        mod = build_mod(attribute_modifiers={Attributes.MAX_HEALTH: 5},
+                        states_granted=State.ON_FIRE,
+                        valid_slots=_ACTIVE_SLOT)
+        assert not char.status.has_state(State.ON_FIRE)
+
+        char.chassis.attempt_store(mod)
+        assert char.status.get_attribute(
+            Attributes.MAX_HEALTH) == max_health + 5
+        assert char.status.has_state(State.ON_FIRE)
+
+        char.chassis.transfer_mod(mod, SlotTypes.STORAGE)
+        assert char.status.get_attribute(Attributes.MAX_HEALTH) == max_health
+        assert not char.status.has_state(State.ON_FIRE)
+
+        char.chassis.transfer_mod(mod, _ACTIVE_SLOT)
+        char.chassis.remove_mod(mod)
+        assert char.status.get_attribute(Attributes.MAX_HEALTH) == max_health
+        assert not char.status.has_state(State.ON_FIRE)
+
+    def test_status_effects_invalidate_attribute_cache(self):
+        char = self._character()
+        max_health = char.status.get_attribute(Attributes.MAX_HEALTH)
+        effect = StatusEffect.build(
+            attribute_modifiers={Attributes.MAX_HEALTH: 3})
+
+        char.status.add_status_effect(effect)
+        assert char.status.get_attribute(
+            Attributes.MAX_HEALTH) == max_health + 3
+
+        char.status.remove_status_effect(effect)
+        assert char.status.get_attribute(Attributes.MAX_HEALTH) == max_health
+
+    def test_population_values_include_mods(self):
+        population = StatusPopulation()
+        shield_mod = build_mod(attribute_modifiers={Attributes.SHIELD: 2},
+                               valid_slots=_ACTIVE_SLOT)
+        chars = [self._character(population) for _ in range(2)]
+        chars[1].chassis.attempt_store(shield_mod)
+
+        assert population.attribute_values(Attributes.SHIELD) == [
+            char.status.get_attribute(Attributes.SHIELD) for char in chars]
+
+    def test_are_dead_mixes_population_and_other_characters(self):
+        population = StatusPopulation()
+        chars = [self._character(population), self._character(),
+                 self._character(population)]
+        for char in chars[1:]:
+            health = char.status.get_attribute(Attributes.HEALTH)
+            char.status.increment_attribute(Attributes.HEALTH, -health)
+
+        assert are_dead(chars) == [False, True, True]
+        assert are_dead(chars) == [is_dead(c) for c in chars]
+
+    def test_status_snapshots_are_shared_until_status_changes(self):
+        population = StatusPopulation()
+        char = self._character(population)
+        snapshot = char.status.snapshot()
+        assert char.status.snapshot() is snapshot
+
+        damage_target(3, char)
+        damaged = char.status.snapshot()
+        assert damaged is not snapshot
+
+        char.status.restore(snapshot)
+        assert char.status.snapshot() is snapshot
+        self.assertEqual(char.status.get_attribute(Attributes.HEALTH),
+                         char.status.get_attribute(Attributes.MAX_HEALTH))
+        char.status.restore(damaged)
+        self.assertEqual(char.status.get_attribute(Attributes.HEALTH),
+                         char.status.get_attribute(Attributes.MAX_HEALTH) - 3)
@@ -63,3 +63,71 @@ def test_chassis_base_mod_is_active():
     mod = build_mod()
     chassis = Chassis({}, base_mod=mod)
     assert mod in chassis.all_active_mods()
+
+
+def test_chassis_mod_sets_follow_transfers():
+    chassis = Chassis({SlotTypes.ARMS: 1, SlotTypes.STORAGE: 2})
+    mod = build_mod(valid_slots=SlotTypes.ARMS)
+    other_mod = build_mod(valid_slots=SlotTypes.ARMS)
+    chassis.attempt_store(mod)
+    chassis.attempt_store(other_mod)
+    assert set(chassis.all_active_mods()) == {mod}
+    assert set(chassis.all_mods()) == {mod, other_mod}
+
+    chassis.transfer_mod(mod, SlotTypes.STORAGE)
+    chassis.transfer_mod(other_mod, SlotTypes.ARMS)
+    assert set(chassis.all_active_mods()) == {other_mod}
+    assert chassis.mods_in_slot(SlotTypes.STORAGE) == (mod,)
+
+    for stored_mod in chassis.all_mods():
+        chassis.remove_mod(stored_mod)
+    assert not list(chassis.all_mods())
+    assert chassis.can_store(mod)
+    assert not any(chassis.mods_in_slot(slot) for slot in SlotTypes)
+
+
+def test_chassis_subroutines_cached_until_mods_change():
+    chassis = Chassis({SlotTypes.ARMS: 1, SlotTypes.STORAGE: 1})
+    laser = direct_damage(1)
+    mod = build_mod(subroutines_granted=laser, valid_slots=SlotTypes.ARMS)
+    chassis.attempt_store(mod)
+
+    def misses():
+        return chassis.subroutine_cache_stats().misses
+
+    assert chassis.all_subroutines() == (laser,)
+    assert chassis.all_subroutines(active_only=False) == (laser,)
+    assert misses() == 2
+    assert chassis.all_subroutines() == (laser,)
+    assert chassis.subroutine_cache_stats().hits == 1
+    assert misses() == 2
+
+    chassis.transfer_mod(mod, SlotTypes.STORAGE)
+    assert chassis.all_subroutines() == ()
+    assert chassis.all_subroutines(active_only=False) == (laser,)
+    assert misses() == 4
+
+    chassis.remove_mod(mod)
+    assert chassis.all_subroutines(active_only=False) == ()
+    assert misses() == 5
+
+
+def test_chassis_restore_returns_mods_to_snapshot_slots():
+    chassis = Chassis({SlotTypes.ARMS: 1, SlotTypes.STORAGE: 2})
+    mod = build_mod(states_granted=State.ON_FIRE, valid_slots=SlotTypes.ARMS)
+    other_mod = build_mod()
+    chassis.attempt_store(mod)
+    snapshot = chassis.snapshot()
+    assert chassis.snapshot() is snapshot
+
+    chassis.transfer_mod(mod, SlotTypes.STORAGE)
+    chassis.attempt_store(other_mod)
+    assert not chassis.grants_state(State.ON_FIRE)
+
+    chassis.restore(snapshot)
+    assert chassis.mods_in_slot(SlotTypes.ARMS) == (mod,)
+    assert chassis.mods_in_slot(SlotTypes.STORAGE) == ()
+    assert chassis.grants_state(State.ON_FIRE)
+    assert chassis.can_store(other_mod)
+    chassis.remove_mod(mod)
+    assert not list(chassis.all_mods())
@@ -1,6 +1,8 @@
 """Tests for states.py"""
 
-from models.characters.states import Attributes, State
+import pytest
+
+from models.characters.states import Attributes, State, Status
 from models.characters.status import BasicStatus
 
 
@@ -26,3 +28,37 @@ def test_basic_status_attribute_bounds():
     assert status.get_attribute(Attributes.HEALTH) == health_min
     status.set_attribute(Attributes.HEALTH, health_min - 10)
     assert status.get_attribute(Attributes.HEALTH) == health_min
+
+
+class _MinimalStatus(Status):
+    """Implements only the abstract methods of Status."""
+
+    def has_state(self, state):
+        return False
+
+    def set_state(self, state, value):
+        pass
+
+    def get_attribute(self, attribute):
+        return 0
+
+    def increment_attribute(self, attribute, delta):
+        pass
+
+    def add_status_effect(self, effect):
+        pass
+
+    def remove_status_effect(self, effect):
+        pass
+
+    def active_effects(self, check=None):
+        return []
+
+
+def test_snapshots_are_optional_for_status_implementations():
+    status = _MinimalStatus()
+
+    with pytest.raises(NotImplementedError):
+        status.snapshot()
+    with pytest.raises(NotImplementedError):
+        status.restore(None)
@@ -2,11 +2,21 @@
 import pytest
 
 from models.characters.states import Attributes, Skills, State, StatusEffect
-from models.characters.status import BasicStatus
+from models.characters.status import (BasicStatus, CompactStatus,
+                                      StatusPopulation)
 
 
-def test_basic_status_states():
-    status = BasicStatus()
+def _population_status():
+    return StatusPopulation().add_status()
+
+
+@pytest.fixture(params=[BasicStatus, CompactStatus, _population_status])
+def status_type(request):
+    return request.param
+
+
+def test_basic_status_states(status_type):
+    status = status_type()
 
     state = State.ON_FIRE
     assert not status.has_state(state)
@@ -23,8 +33,8 @@ def test_basic_status_states():
 
 @pytest.mark.parametrize('att', [Attributes.HEALTH, Skills.MECHANICS])
 @pytest.mark.parametrize('bound', [2, Attributes.MAX_HEALTH, lambda: 2])
-def test_basis_status_attribute_increment_bounds(att, bound):
-    status = BasicStatus()
+def test_basis_status_attribute_increment_bounds(att, bound, status_type):
+    status = status_type()
 
     att = Attributes.HEALTH
 
@@ -46,8 +56,8 @@ def test_basis_status_attribute_increment_bounds(att, bound):
     assert actual == expected
 
 
-def test_status_effect_adds_state():
-    status = BasicStatus()
+def test_status_effect_adds_state(status_type):
+    status = status_type()
 
     state = State.ON_FIRE
     fire_effect = StatusEffect.build('fire', states_granted=state)
@@ -58,8 +68,8 @@ def test_status_effect_adds_state():
     assert status.has_state(state)
 
 
-def test_status_effect_prevents_state():
-    status = BasicStatus()
+def test_status_effect_prevents_state(status_type):
+    status = status_type()
 
     state = State.ON_FIRE
     status.set_state(state, True)
@@ -73,8 +83,8 @@ def test_status_effect_prevents_state():
     assert not status.has_state(state)
 
 
-def test_status_effect_prevents_status_effect_state():
-    status = BasicStatus()
+def test_status_effect_prevents_status_effect_state(status_type):
+    status = status_type()
 
     state = State.ON_FIRE
 
@@ -89,8 +99,8 @@ def test_status_effect_prevents_status_effect_state():
     assert status.has_state(state)
 
 
-def test_status_effect_attribute_increments_stack():
-    status = BasicStatus()
+def test_status_effect_attribute_increments_stack(status_type):
+    status = status_type()
 
     att = Attributes.HEALTH
     assert status.get_attribute(att) == 0
@@ -107,8 +117,8 @@ def test_status_effect_attribute_increments_stack():
     assert status.get_attribute(att) == expected
 
 
-def test_status_effect_attribute_increments_stay_in_bounds():
-    status = BasicStatus()
+def test_status_effect_attribute_increments_stay_in_bounds(status_type):
+    status = status_type()
 
     att = Attributes.HEALTH
     lower, initial, upper = 0, 1, 2
@@ -131,8 +141,8 @@ def test_status_effect_attribute_increments_stay_in_bounds():
     assert len(status.active_effects()) == 3
 
 
-def test_status_effect_partial_bounds():
-    status = BasicStatus()
+def test_status_effect_partial_bounds(status_type):
+    status = status_type()
 
     att = Attributes.HEALTH
     lower, initial, upper = None, 1, 2
@@ -146,3 +156,134 @@ def test_status_effect_partial_bounds():
 
     status.increment_attribute(att, -upper - 1)
     assert status.get_attribute(att) == -1
+
+
+@pytest.mark.parametrize('status_type', [CompactStatus, _population_status])
+def test_compact_status_matches_basic_status(status_type):
+    effects = [
+        StatusEffect.build('fire', states_granted=State.ON_FIRE,
+                           attribute_modifiers={Attributes.SHIELD: 2}),
+        StatusEffect.build('frozen', states_granted=State.FROZEN,
+                           states_prevented=State.ON_FIRE),
+        StatusEffect.build('focus', attribute_modifiers={Skills.STEALTH: -1,
+                                                         Attributes.SHIELD: 1})]
+    statuses = [BasicStatus(), status_type()]
+
+    def assert_equal_statuses():
+        basic, compact = statuses
+        for state in State:
+            assert basic.has_state(state) == compact.has_state(state)
+        for att in tuple(Attributes) + tuple(Skills):
+            assert basic.get_attribute(att) == compact.get_attribute(att)
+        assert basic.active_effects() == compact.active_effects()
+
+    for status in statuses:
+        status.set_attribute_bounds(Attributes.SHIELD, 0, 4)
+        status.set_state(State.SLEEPY, True)
+        status.increment_attribute(Attributes.SHIELD, 1)
+    assert_equal_statuses()
+
+    for effect in effects + effects[:1]:
+        for status in statuses:
+            status.add_status_effect(effect)
+            status.set_state(State.ON_FIRE, True)
+        assert_equal_statuses()
+
+    for effect in effects:
+        for status in statuses:
+            status.remove_status_effect(effect)
+            status.set_state(State.FROZEN, False)
+        assert_equal_statuses()
+
+
+def test_population_rows_are_independent():
+    population = StatusPopulation()
+    first, second = population.add_status(), population.add_status()
+
+    first.increment_attribute(Attributes.HEALTH, 3)
+    second.add_status_effect(
+        StatusEffect.build(attribute_modifiers={Attributes.HEALTH: -1}))
+
+    assert len(population) == 2
+    assert population.status(1) is second
+    assert population.attribute_values(Attributes.HEALTH) == [3, -1]
+    assert population.is_dead() == [False, True]
+    assert population.is_dead([0]) == [False]
+
+
+def test_attribute_reference_bound_follows_attribute(status_type):
+    status = status_type()
+    status.set_attribute_bounds(Attributes.HEALTH, None, Skills.MECHANICS)
+    status.increment_attribute(Skills.MECHANICS, 3)
+
+    status.increment_attribute(Attributes.HEALTH, 5)
+    assert status.get_attribute(Attributes.HEALTH) == 3
+
+    status.increment_attribute(Skills.MECHANICS, -2)
+    assert status.get_attribute(Attributes.HEALTH) == 1
+
+
+def test_attribute_reference_bound_read_from_bound_source(status_type):
+    status, source = status_type(), status_type()
+    status.set_bound_source(source)
+    status.set_attribute_bounds(Attributes.HEALTH, None, Attributes.MAX_HEALTH)
+    source.increment_attribute(Attributes.MAX_HEALTH, 4)
+
+    status.increment_attribute(Attributes.HEALTH, 10)
+    assert status.get_attribute(Attributes.HEALTH) == 4
+
+
+def test_state_granted_until_last_granting_effect_removed(status_type):
+    status = status_type()
+    fire = StatusEffect.build('fire', states_granted=State.ON_FIRE)
+    other_fire = StatusEffect.build('other fire', states_granted=State.ON_FIRE)
+    no_fire = StatusEffect.build('no fire', states_prevented=State.ON_FIRE)
+
+    for effect in (fire, other_fire, fire, no_fire, no_fire):
+        status.add_status_effect(effect)
+    assert not status.has_state(State.ON_FIRE)
+
+    status.remove_status_effect(no_fire)
+    assert not status.has_state(State.ON_FIRE)
+    status.remove_status_effect(no_fire)
+    assert status.has_state(State.ON_FIRE)
+
+    for effect in (fire, fire):
+        status.remove_status_effect(effect)
+        assert status.has_state(State.ON_FIRE)
+    status.remove_status_effect(other_fire)
+    assert not status.has_state(State.ON_FIRE)
+
+
+def test_restore_returns_to_snapshot(status_type):
+    status = status_type()
+    status.set_attribute_bounds(Attributes.SHIELD, 0, 5)
+    status.increment_attribute(Attributes.SHIELD, 3)
+    status.set_state(State.SLEEPY, True)
+    fire = StatusEffect.build('fire', states_granted=State.ON_FIRE,
+                              attribute_modifiers={Attributes.HEALTH: -1})
+    status.add_status_effect(fire)
+    snapshot = status.snapshot()
+
+    status.increment_attribute(Attributes.SHIELD, -3)
+    status.set_state(State.SLEEPY, False)
+    status.remove_status_effect(fire)
+    status.add_status_effect(
+        StatusEffect.build('no fire', states_prevented=State.ON_FIRE))
+    status.restore(snapshot)
+
+    assert status.get_attribute(Attributes.SHIELD) == 3
+    assert status.get_attribute(Attributes.HEALTH) == -1
+    assert status.has_state(State.SLEEPY)
+    assert status.has_state(State.ON_FIRE)
+    assert status.active_effects() == [fire]
+    status.remove_status_effect(fire)
+    assert not status.has_state(State.ON_FIRE)
+    assert status.get_attribute(Attributes.HEALTH) == 0
+
+
+def test_compact_statuses_do_not_allocate_basic_status_storage():
+    for status in (CompactStatus(), _population_status()):
+        assert not isinstance(status, BasicStatus)
+        assert not hasattr(status, '_attributes')
+        assert not hasattr(status, '_granted_counts')
@@ -6,7 +6,9 @@ from models.characters.character_impl import build_character
 from models.characters.chassis_examples import ChassisTypes
 from models.characters.conditions import at_full_health
 from models.characters.states import Attributes, State
-from models.characters.subroutine_examples import direct_damage, repair
+from models.characters.subroutine_examples import (damage_over_time,
+                                                   direct_damage, repair,
+                                                   shield_buff)
 from models.characters.subroutines_base import build_subroutine
 
 
@@ -42,3 +44,23 @@ def test_subroutine_eq():
     sub = build_subroutine()
     assert sub == sub
     assert sub != sub.copy()
+
+
+@pytest.mark.parametrize('sub', [direct_damage(4), damage_over_time(2, 3),
+                                 shield_buff(2, 2), build_subroutine()])
+def test_constant_subroutines_are_slotted(sub):
+    assert not hasattr(sub, '__dict__')
+    copy = sub.copy()
+    assert copy != sub
+    assert hash(sub) == hash(sub)
+    for attr in ('cpu_slots', 'time_to_resolve', 'description', 'duration',
+                 'multi_use'):
+        assert getattr(copy, attr)() == getattr(sub, attr)()
+
+
+def test_dynamic_subroutine_fields_are_evaluated_on_use():
+    cpu = [1]
+    sub = build_subroutine(num_cpu=lambda: cpu[0], description='dynamic')
+    cpu[0] = 3
+    assert sub.cpu_slots() == 3
+    assert sub.copy().cpu_slots() == 3
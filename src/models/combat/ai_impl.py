@@ -1,14 +1,15 @@
 import random
 from enum import Enum
-from itertools import product
+from functools import partial
 from random import choice
-from typing import Callable, Optional, Sequence, Set
+from typing import Callable, Dict, Optional, Sequence, Set
 
 from models.characters.ai_base import AI
 from models.characters.character_base import Character
 from models.characters.moves_base import Move
-from models.characters.states import Attributes
 from models.characters.subroutines_base import build_subroutine
+from models.combat.move_generation import available_moves
+from models.combat.search_ai import SearchAI
 
 SelectionFun = Callable[[Sequence[Move]], Move]
 
@@ -35,13 +36,7 @@ class _AIImpl(AI):
         assert self._user is not None, 'User not specified.'
         # Valid moves are those which can be used immediately and do not cost
         # more cpu_slots than available.
-        slots = self._user.status.get_attribute(Attributes.CPU_AVAILABLE)
-        valid_subs = (sub for sub in self._user.chassis.all_subroutines()
-                      if sub.cpu_slots() <= slots)
-
-        moves = [Move(sub, self._user, target)
-                 for sub, target in product(valid_subs, targets)
-                 if sub.can_use(self._user, target)]
+        moves = available_moves(self._user, targets)
 
         if moves:
             return self._select_move_fun(moves)
@@ -55,36 +50,53 @@ class _AIImpl(AI):
 class AIType(Enum):
     Random = 'Random'
     Shuffle = 'Shuffle'
+    Search = 'Search'
     No_AI = 'No AI'
 
-    def selection_fun(self) -> SelectionFun:
-        return _selectors[self]()
+    def selection_fun(self, rng: Optional[random.Random] = None) -> SelectionFun:
+        """A new move selection function of this type.
+
+        The Search type has no selection function, see search_ai.SearchAI.
+
+        Args:
+            rng: (Optional) Random number generator used to select moves. If
+                not given, the global state of the random module is used.
+        """
+        if self not in _selectors:
+            raise ValueError('{} has no selection function, use build_ai '
+                             'instead.'.format(self))
+        return _selectors[self](rng)
 
 
-def build_ai(ai_type: AIType) -> AI:
-    return _AIImpl(ai_type.selection_fun())
+def build_ai(ai_type: AIType, rng: Optional[random.Random] = None) -> AI:
+    if ai_type is AIType.Search:
+        return SearchAI(rng=rng)
+    return _AIImpl(ai_type.selection_fun(rng))
 
 
 def _raise_error(moves: Sequence[Move]) -> Move:
     raise NotImplementedError('No AI has no moves.')
 
 
-def _random_choice(moves: Sequence[Move]) -> Move:
+def _random_choice(moves: Sequence[Move], rng: Optional[random.Random] = None) -> Move:
     if not moves:
         raise ValueError('No moves available.')
-    return choice(moves)
+    if rng is None:
+        return choice(moves)
+    return rng.choice(moves)
 
 
 class _MoveIterator(object):
     """Runs through all moves once before repeating."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
         self._used_moves: Set[Move] = set()
+        self._shuffle = random.shuffle if rng is None else rng.shuffle
 
     def next_move(self, moves: Sequence[Move]) -> Move:
 
         unchecked_moves = list(moves)
-        random.shuffle(unchecked_moves)
+        self._shuffle(unchecked_moves)
         while unchecked_moves:
             move = unchecked_moves.pop()
             if move not in self._used_moves:
@@ -96,6 +108,7 @@ class _MoveIterator(object):
         return self.next_move(moves)
 
 
-_selectors = {AIType.Random: lambda: _random_choice,
-              AIType.Shuffle: lambda: _MoveIterator().next_move,
-              AIType.No_AI: lambda: _raise_error}
+_selectors: Dict[AIType, Callable[[Optional[random.Random]], SelectionFun]] = {
+    AIType.Random: lambda rng: partial(_random_choice, rng=rng),
+    AIType.Shuffle: lambda rng: _MoveIterator(rng).next_move,
+    AIType.No_AI: lambda rng: _raise_error}
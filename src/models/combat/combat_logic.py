@@ -1,11 +1,29 @@
 """Implementation of the CombatLogic class."""
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
 
 from models.characters.character_base import Character
+from models.characters.chassis import ChassisSnapshot
 from models.characters.conditions import is_alive, is_dead
 from models.characters.moves_base import Move
 from models.characters.states import Attributes
-from models.combat.combat_stack import CombatStack
+from models.combat.combat_stack import CombatStack, StackSnapshot
+
+
+class CombatSnapshot(NamedTuple):
+    """Immutable copy of the state of a combat. See CombatLogic.snapshot.
+
+    Character statuses and chassis are copied on write, so successive
+    snapshots share the records of characters that did not change.
+    """
+    stack: StackSnapshot
+    # (move, rounds existed, total rounds) for each tracked move.
+    move_lifetimes: Tuple[Tuple[Move, int, int], ...]
+    cpu_reserved: Tuple[Tuple[Character, int], ...]
+    active_characters: Tuple[Character, ...]
+    next_move_id: int
+    # Status and chassis snapshots of the combat characters, in order.
+    statuses: Tuple[Any, ...]
+    chassis: Tuple[ChassisSnapshot, ...]
 
 
 class CombatLogic(object):
@@ -16,6 +34,9 @@ class CombatLogic(object):
     that moves are implemented correctly during combat. See combat_notes.txt
     for a summary of the combat logic.
     """
+    # If True, incrementally tracked CPU reservations are checked against a
+    # full recount of the moves in progress every round. Meant for tests.
+    verify_cpu_reserved = False
 
     def __init__(self, characters: Sequence[Character]) -> None:
         super().__init__()
@@ -23,13 +44,22 @@ class CombatLogic(object):
         self._active_characters = tuple(c for c in self._characters
                                         if is_alive(c))
         self._combat_stack = CombatStack()
+        # Next unique move instance id. Some moves may appear on the stack
+        # more than once with the exact same time left, and must be distinct
+        # for proper rendering.
+        self._next_move_id = 1
 
         # For moves with multi-turn durations, we need to keep track of how many
         # rounds they have existed so that we can return the CPU to the user
         # exactly when the final execution has occurred. We also apply any
         # possible after-effects at this time.
         self._move_lifetime_registry: Dict[Move, List[int]] = {}
+        # CPU slots held by each character's moves in progress.
+        self._cpu_reserved: Dict[Character, int] = {c: 0 for c in
+                                                    self._characters}
         self._initialize_characters(self._characters)
+        for char in self._characters:
+            char.ai.start_combat(self)
 
     @property
     def stack(self) -> CombatStack:
@@ -45,7 +75,9 @@ class CombatLogic(object):
             self._move_lifetime_registry[move][0] += 1
 
         # Process and add new moves to the stack.
-        moves = [_make_unique(m) for m in moves]  # See _make_unique docstring
+        moves = [m._replace(instance_id=self._next_move_id + i)
+                 for i, m in enumerate(moves)]
+        self._next_move_id += len(moves)
 
         for move in moves:
             self._register_move(move)
@@ -73,6 +105,7 @@ class CombatLogic(object):
         for move in finished_moves:
             move.subroutine.after_effect(move.user, move.target)
             self._move_lifetime_registry.pop(move)
+            self._cpu_reserved[move.user] -= move.subroutine.cpu_slots()
         self._combat_stack.remove_moves(
             lambda m: is_dead(m.user) or is_dead(m.target))
 
@@ -93,22 +126,76 @@ class CombatLogic(object):
     def active_characters(self) -> Tuple[Character, ...]:
         return self._active_characters
 
+    def characters(self) -> Tuple[Character, ...]:
+        """All characters in the combat, alive or not."""
+        return self._characters
+
+    def snapshot(self) -> CombatSnapshot:
+        """An immutable copy of the combat state.
+
+        This includes the stack, the moves in progress, and the statuses and
+        mod placement of the combat characters. Snapshots may be restored any
+        number of times and in any order, e.g. to undo rounds or to replay
+        them with different moves.
+        """
+        return CombatSnapshot(
+            self._combat_stack.snapshot(),
+            tuple((move, rounds, max_rounds) for move, (rounds, max_rounds)
+                  in self._move_lifetime_registry.items()),
+            tuple(self._cpu_reserved.items()), self._active_characters,
+            self._next_move_id,
+            tuple(char.status.snapshot() for char in self._characters),
+            tuple(char.chassis.snapshot() for char in self._characters))
+
+    def restore(self, snapshot: CombatSnapshot) -> None:
+        """Return the combat to the state of an earlier snapshot.
+
+        Args:
+            snapshot: Value returned by snapshot() on this object.
+        """
+        self._combat_stack.restore(snapshot.stack)
+        self._move_lifetime_registry = {
+            move: [rounds, max_rounds]
+            for move, rounds, max_rounds in snapshot.move_lifetimes}
+        self._cpu_reserved = dict(snapshot.cpu_reserved)
+        self._active_characters = snapshot.active_characters
+        self._next_move_id = snapshot.next_move_id
+        for char, status, chassis in zip(self._characters, snapshot.statuses,
+                                         snapshot.chassis):
+            char.chassis.restore(chassis)
+            char.status.restore(status)
+
     def _register_move(self, move: Move) -> None:
         duration = move.subroutine.duration()
         time_to_resolve = move.subroutine.time_to_resolve()
         self._move_lifetime_registry[move] = [0, duration + time_to_resolve]
+        self._cpu_reserved[move.user] = (self._cpu_reserved.get(move.user, 0)
+                                         + move.subroutine.cpu_slots())
 
     def _update_cpu_available(self, characters: Iterable[Character]) -> None:
+        """Set available CPU to max CPU minus the CPU held by moves."""
+        if self.verify_cpu_reserved:
+            self._check_cpu_reserved()
+
         cpu_att = Attributes.CPU_AVAILABLE
-        # Start with all CPU at max value.
         for char in characters:
+            # Start with all CPU at max value.
             max_cpu = char.status.get_attribute(Attributes.MAX_CPU)
             char.status.increment_attribute(cpu_att, max_cpu)
 
-        # Decrement CPU values for moves in progress.
+            reserved = self._cpu_reserved.get(char, 0)
+            if reserved:
+                char.status.increment_attribute(cpu_att, -reserved)
+
+    def _check_cpu_reserved(self) -> None:
+        expected: Dict[Character, int] = {}
         for mv in self._move_lifetime_registry:
-            mv.user.status.increment_attribute(cpu_att,
-                                               -mv.subroutine.cpu_slots())
+            expected[mv.user] = (expected.get(mv.user, 0)
+                                 + mv.subroutine.cpu_slots())
+        actual = {c: cpu for c, cpu in self._cpu_reserved.items() if cpu}
+        expected = {c: cpu for c, cpu in expected.items() if cpu}
+        assert actual == expected, (
+            'CPU reserved is inconsistent: {} != {}'.format(actual, expected))
 
     def _initialize_characters(self, characters: Iterable[Character]) -> None:
         """Initialize character statuses for combat."""
@@ -118,15 +205,3 @@ class CombatLogic(object):
             char.status.increment_attribute(Attributes.SHIELD, -shield)
 
         self._update_cpu_available(characters)
-
-
-def _make_unique(move: Move) -> Move:
-    """Make a move distinct under equality from the input.
-
-    We do this because some moves may appear on the stack more than once with
-    the exact same time left. We must have them distinct for proper rendering.
-    """
-    # subroutine copies are distinct, so replace the move's subroutine.
-    move_copy = move._replace(subroutine=move.subroutine.copy())
-    assert move != move_copy
-    return move_copy
@@ -1,12 +1,15 @@
 """Implementation of the combat stack."""
-from typing import Callable, List, NamedTuple, Tuple
+from typing import Callable, Dict, List, NamedTuple, Tuple
 
 from models.characters.moves_base import Move
 
 
-class _TimedMove(NamedTuple):
-    move: Move
-    time_left: int
+class StackSnapshot(NamedTuple):
+    """Immutable copy of the contents of a CombatStack."""
+    round: int
+    timeline: Tuple[Tuple[int, Tuple[Move, ...]], ...]
+    just_resolved: Tuple[Move, ...]
+    resolved_moves_called: bool
 
 
 class CombatStack(object):
@@ -21,10 +24,14 @@ class CombatStack(object):
 
     advance_time: Increments time by one unit.
 
+    Internally, moves are stored in a timeline keyed by the (absolute) round in
+    which they resolve, so that advancing time does not touch unresolved moves.
     """
 
     def __init__(self) -> None:
-        self._stack: List[_TimedMove] = []
+        self._round = 0
+        # Resolution round -> moves resolving in that round, in order.
+        self._timeline: Dict[int, List[Move]] = {}
         self._just_resolved: Tuple[Move, ...] = ()
         self._resolved_moves_called = True
 
@@ -47,7 +54,9 @@ class CombatStack(object):
 
         """
 
-        return [(tm.move, tm.time_left) for tm in self._stack]
+        return [(move, resolve_round - self._round)
+                for resolve_round in sorted(self._timeline)
+                for move in self._timeline[resolve_round]]
 
     def advance_time(self) -> None:
         """Advance time by one round.
@@ -68,19 +77,9 @@ class CombatStack(object):
                              'successive calls to advance_time.')
         self._resolved_moves_called = False
 
-        # 2. Update time_left for each move and separate resolved moves.
-        just_resolved = []
-        new_stack: List[_TimedMove] = []
-
-        for timed_move in self._stack:
-            assert timed_move.time_left > 0
-            if timed_move.time_left == 1:
-                just_resolved.append(timed_move.move)
-            else:
-                new_stack.append(
-                    timed_move._replace(time_left=timed_move.time_left - 1))
-        self._stack = new_stack
-        self._just_resolved = tuple(just_resolved)
+        # 2. Advance the round and extract the moves resolving in it.
+        self._round += 1
+        self._just_resolved = tuple(self._timeline.pop(self._round, ()))
 
     def add_move(self, move: Move, time_left: int) -> None:
         """Add a move to the stack.
@@ -101,24 +100,37 @@ class CombatStack(object):
             self._just_resolved = (move,) + self._just_resolved
             return
 
-        index = -1
-        for index, _ in enumerate(tm for tm in self._stack
-                                  if tm.time_left <= time_left):
-            pass
-
-        new_stack = []
-        if index >= 0:
-            new_stack.extend(self._stack[:(index + 1)])
-        new_stack.append(_TimedMove(move, time_left))
-        new_stack.extend(self._stack[(index + 1):])
-
-        self._stack = new_stack
+        resolve_round = self._round + time_left
+        if resolve_round in self._timeline:
+            self._timeline[resolve_round].append(move)
+        else:
+            self._timeline[resolve_round] = [move]
 
     def remove_moves(self, condition: Callable[[Move], bool]) -> None:
         """Remove all moves from the stack satisfying a given condition.
 
         This does not affect resolved moves.
         """
-        to_remove = [mt for mt in self._stack if condition(mt.move)]
-        for mt in to_remove:
-            self._stack.remove(mt)
+        for resolve_round in list(self._timeline):
+            remaining = [m for m in self._timeline[resolve_round]
+                         if not condition(m)]
+            if remaining:
+                self._timeline[resolve_round] = remaining
+            else:
+                del self._timeline[resolve_round]
+
+    def snapshot(self) -> StackSnapshot:
+        """An immutable copy of the stack contents. See restore."""
+        return StackSnapshot(self._round,
+                             tuple((resolve_round, tuple(moves))
+                                   for resolve_round, moves
+                                   in self._timeline.items()),
+                             self._just_resolved, self._resolved_moves_called)
+
+    def restore(self, snapshot: StackSnapshot) -> None:
+        """Return the stack to the contents of an earlier snapshot."""
+        self._round = snapshot.round
+        self._timeline = {resolve_round: list(moves)
+                          for resolve_round, moves in snapshot.timeline}
+        self._just_resolved = snapshot.just_resolved
+        self._resolved_moves_called = snapshot.resolved_moves_called
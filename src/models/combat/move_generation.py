@@ -0,0 +1,97 @@
+"""Generation of the valid moves of a character in combat."""
+from bisect import bisect_right
+from itertools import accumulate
+from typing import (Callable, Dict, Iterator, List, Sequence, Tuple, Union,
+                    overload)
+
+from models.characters.character_base import Character
+from models.characters.moves_base import Move
+from models.characters.states import Attributes
+from models.characters.subroutines_base import Subroutine
+
+_Predicate = Union[bool, Callable[[Character, Character], bool]]
+
+
+class MoveCandidates(Sequence[Move]):
+    """Valid moves of a user, built only when accessed.
+
+    Moves are ordered by subroutine, then by target, as in
+    itertools.product(subroutines, targets).
+    """
+
+    def __init__(self, user: Character,
+                 groups: Sequence[Tuple[Subroutine, Sequence[Character]]]
+                 ) -> None:
+        self._user = user
+        self._groups = [group for group in groups if group[1]]
+        # _ends[i] = number of moves in groups 0, ..., i.
+        self._ends = list(accumulate(len(targets) for _, targets in
+                                     self._groups))
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    @overload
+    def __getitem__(self, index: int) -> Move:
+        pass
+
+    @overload  # noqa: F811
+    def __getitem__(self, index: slice) -> Sequence[Move]:
+        pass
+
+    def __getitem__(self, index: Union[int, slice]  # noqa: F811
+                    ) -> Union[Move, Sequence[Move]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('move index out of range.')
+        group_index = bisect_right(self._ends, index)
+        start = self._ends[group_index - 1] if group_index else 0
+        sub, targets = self._groups[group_index]
+        return Move(sub, self._user, targets[index - start])
+
+    def __iter__(self) -> Iterator[Move]:
+        for sub, targets in self._groups:
+            for target in targets:
+                yield Move(sub, self._user, target)
+
+
+def valid_moves(user: Character, subroutines: Sequence[Subroutine],
+                targets: Sequence[Character]) -> MoveCandidates:
+    """The moves using subroutines on targets whose subroutines can be used.
+
+    Subroutines sharing a target predicate (see Subroutine.target_predicate)
+    have the predicate evaluated only once per target.
+
+    Args:
+        user: Character using the subroutines.
+        subroutines: Subroutines to consider. These are not filtered by CPU.
+        targets: Possible targets of the subroutines.
+    """
+    valid_targets: Dict[_Predicate, List[Character]] = {}
+    groups = []
+    for sub in subroutines:
+        predicate = sub.target_predicate()
+        if predicate not in valid_targets:
+            valid_targets[predicate] = _filter_targets(user, predicate,
+                                                       targets)
+        groups.append((sub, valid_targets[predicate]))
+    return MoveCandidates(user, groups)
+
+
+def available_moves(user: Character, targets: Sequence[Character]
+                    ) -> MoveCandidates:
+    """Valid moves of a user whose subroutines fit in its available CPU."""
+    slots = user.status.get_attribute(Attributes.CPU_AVAILABLE)
+    subs = [sub for sub in user.chassis.all_subroutines()
+            if sub.cpu_slots() <= slots]
+    return valid_moves(user, subs, targets)
+
+
+def _filter_targets(user: Character, predicate: _Predicate,
+                    targets: Sequence[Character]) -> List[Character]:
+    if isinstance(predicate, bool):
+        return list(targets) if predicate else []
+    return [target for target in targets if predicate(user, target)]
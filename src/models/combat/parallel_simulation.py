@@ -0,0 +1,148 @@
+"""Seeded combat simulations spread over a pool of processes.
+
+Combats are grouped into fixed-size chunks, and each chunk draws its moves
+from its own random number generator, seeded from the master seed and the
+chunk index. Because neither the chunks nor their seeds depend on the number
+of workers, the merged summary is the same for any number of processes.
+
+Workers are started with the 'spawn' method, so they never inherit the state
+of a parent that may be running pygame. As a consequence, teams are specified
+by picklable members: CharacterTypes, or module-level functions returning
+CharacterData.
+"""
+import multiprocessing
+import os
+from random import Random
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from models.characters.character_examples import CharacterData, CharacterTypes
+from models.combat.ai_impl import AIType
+from models.combat.simulation import (DEFAULT_MAX_ROUNDS, SimulationSummary,
+                                      simulate_combats)
+
+DEFAULT_CHUNK_SIZE = 25
+
+TeamMember = Union[CharacterTypes, Callable[[], CharacterData]]
+
+# CharacterTypes members pickle by value, which holds closures, so they are
+# sent to workers by name.
+_PicklableMember = Union[str, Callable[[], CharacterData]]
+
+
+class _SimulationSpec(NamedTuple):
+    """Arguments shared by all chunks of a parallel simulation."""
+    player_team: Sequence[_PicklableMember]
+    enemy_team: Sequence[_PicklableMember]
+    player_ai: Optional[AIType]
+    enemy_ai: Optional[AIType]
+    max_rounds: int
+
+
+# Chunk = (number of combats, seed of the chunk's random number generator)
+_Chunk = Tuple[int, int]
+
+# Set in each worker process by _init_worker.
+_worker_spec: Optional[_SimulationSpec] = None
+
+
+def simulate_combats_parallel(num_combats: int,
+                              player_team: Sequence[TeamMember],
+                              enemy_team: Sequence[TeamMember],
+                              player_ai: Optional[AIType] = AIType.Random,
+                              enemy_ai: Optional[AIType] = None,
+                              max_rounds: int = DEFAULT_MAX_ROUNDS,
+                              seed: int = 0,
+                              num_workers: int = None,
+                              chunk_size: int = DEFAULT_CHUNK_SIZE
+                              ) -> SimulationSummary:
+    """Run many seeded combats over a process pool and summarize the results.
+
+    The global state of the random module is neither used nor modified.
+
+    Args:
+        num_combats: Total number of combats to simulate.
+        player_team: Members of the player team. Each member is a
+            CharacterTypes or a module-level function returning the member's
+            CharacterData, so that it can be sent to worker processes.
+        enemy_team: Members of the enemy team, as for player_team.
+        player_ai: See simulation.simulate_combat.
+        enemy_ai: See simulation.simulate_combat.
+        max_rounds: See simulation.simulate_combat.
+        seed: Master seed. Equal seeds give equal summaries.
+        num_workers: Number of worker processes. Default is the number of
+            CPUs. With a single worker, combats are run in the calling process.
+        chunk_size: Number of combats sent to a worker at a time.
+
+    Returns:
+        The summary of all combats.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive, got {}.'.format(
+            chunk_size))
+    spec = _SimulationSpec(tuple(_picklable(m) for m in player_team),
+                           tuple(_picklable(m) for m in enemy_team),
+                           player_ai, enemy_ai, max_rounds)
+    chunks = _build_chunks(num_combats, chunk_size, seed)
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = min(num_workers, len(chunks))
+
+    if num_workers <= 1:
+        summaries = [_simulate_chunk(chunk, spec) for chunk in chunks]
+    else:
+        context = multiprocessing.get_context('spawn')
+        pool = context.Pool(num_workers, initializer=_init_worker,
+                            initargs=(spec,))
+        try:
+            summaries = pool.map(_simulate_worker_chunk, chunks)
+        finally:
+            pool.close()
+            pool.join()
+
+    # Merge in chunk order, independent of which worker ran which chunk.
+    summary = SimulationSummary()
+    for chunk_summary in summaries:
+        summary = summary.merge(chunk_summary)
+    return summary
+
+
+def _build_chunks(num_combats: int, chunk_size: int, seed: int
+                  ) -> List[_Chunk]:
+    seeds = Random(seed)
+    sizes = [chunk_size] * (num_combats // chunk_size)
+    if num_combats % chunk_size:
+        sizes.append(num_combats % chunk_size)
+    return [(size, seeds.getrandbits(64)) for size in sizes]
+
+
+def _simulate_chunk(chunk: _Chunk, spec: _SimulationSpec
+                    ) -> SimulationSummary:
+    num_combats, chunk_seed = chunk
+    player_team = [_member_data(member) for member in spec.player_team]
+    enemy_team = [_member_data(member) for member in spec.enemy_team]
+    return simulate_combats(num_combats, player_team, enemy_team,
+                            spec.player_ai, spec.enemy_ai, spec.max_rounds,
+                            rng=Random(chunk_seed))
+
+
+def _picklable(member: TeamMember) -> _PicklableMember:
+    if isinstance(member, CharacterTypes):
+        return member.name
+    return member
+
+
+def _member_data(member: _PicklableMember) -> CharacterData:
+    if isinstance(member, str):
+        return CharacterTypes[member].data
+    return member()
+
+
+def _init_worker(spec: _SimulationSpec) -> None:
+    global _worker_spec
+    _worker_spec = spec
+
+
+def _simulate_worker_chunk(chunk: _Chunk) -> SimulationSummary:
+    assert _worker_spec is not None, 'Worker not initialized.'
+    return _simulate_chunk(chunk, _worker_spec)
@@ -0,0 +1,206 @@
+"""AI selecting moves by Monte-Carlo search over simulated combat rounds."""
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from models.characters.ai_base import AI
+from models.characters.character_base import Character
+from models.characters.conditions import is_dead
+from models.characters.moves_base import Move
+from models.characters.states import Attributes
+from models.characters.subroutine_examples import same_team
+from models.characters.subroutines_base import Subroutine, build_subroutine
+from models.combat.move_generation import available_moves
+
+if TYPE_CHECKING:
+    from models.combat.combat_logic import CombatLogic  # noqa: F401
+
+DEFAULT_BUDGET_MS = 50.0
+DEFAULT_DEPTH = 3
+
+_wait = build_subroutine(num_cpu=0, time_to_resolve=1, description='wait')
+
+# Exploration constant of the UCB1 rule.
+_EXPLORATION = math.sqrt(2)
+# Weight kept by the statistics of earlier rounds when the tree is reused.
+_REUSE_DECAY = 0.5
+
+# Move statistics are keyed by (subroutine, target), so that they are shared
+# by the equal moves of successive rounds.
+_MoveKey = Tuple[Subroutine, Character]
+
+
+class _MoveStats(object):
+    """Number of rollouts of a move and the sum of their values."""
+
+    def __init__(self) -> None:
+        self.visits = 0.0
+        self.total = 0.0
+
+    def mean(self) -> float:
+        return self.total / self.visits if self.visits else 0.0
+
+
+class SearchAI(AI):
+    """AI that evaluates its candidate moves by simulating the combat ahead.
+
+    Each rollout restores the combat from a snapshot, plays the candidate move
+    along with random moves of the other characters, continues with random
+    moves for a fixed number of rounds, and scores the result from the
+    perspective of the user's team. Candidates are chosen for rollouts with
+    the UCB1 rule, and the candidate with the best mean score is selected.
+
+    The AI must be told of its combat through start_combat (as CombatLogic
+    does). Outside of a combat, it selects random moves.
+    """
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS,
+                 depth: int = DEFAULT_DEPTH,
+                 max_rollouts: Optional[int] = None, reuse_tree: bool = False,
+                 rng: Optional[random.Random] = None) -> None:
+        """
+        Args:
+            budget_ms: Time allowed for the search of each move, in
+                milliseconds. Once it has expired, no rollout is started and
+                the current rollout is cut short after its round.
+            depth: Number of rounds simulated by each rollout.
+            max_rollouts: (Optional) Maximum number of rollouts per move. With
+                an ample time budget, this makes move selection reproducible.
+            reuse_tree: Whether the move statistics gathered in a round are
+                kept, with decaying weight, for the same moves in later rounds
+                of the combat.
+            rng: (Optional) Random number generator used for rollouts. If not
+                given, the global state of the random module is used.
+        """
+        if depth < 1:
+            raise ValueError('depth must be positive, got {}.'.format(depth))
+        self._budget_ms = budget_ms
+        self._depth = depth
+        self._max_rollouts = max_rollouts
+        self._reuse_tree = reuse_tree
+        self._choice = random.choice if rng is None else rng.choice
+        self._user: Optional[Character] = None
+        self._combat: Optional['CombatLogic'] = None
+        self._stats: Dict[_MoveKey, _MoveStats] = {}
+
+    def set_user(self, user: Character) -> None:
+        self._user = user
+
+    def start_combat(self, combat: 'CombatLogic') -> None:
+        self._combat = combat
+        self._stats = {}
+
+    def select_move(self, targets: Sequence[Character]) -> Move:
+        assert self._user is not None, 'User not specified.'
+        candidates = list(available_moves(self._user, targets))
+        if not candidates:
+            return Move(_wait, self._user, self._user)
+        if self._combat is None or len(candidates) == 1:
+            return self._choice(candidates)
+
+        if self._reuse_tree:
+            for move_stats in self._stats.values():
+                move_stats.visits *= _REUSE_DECAY
+                move_stats.total *= _REUSE_DECAY
+        else:
+            self._stats = {}
+        stats = [self._stats.setdefault((m.subroutine, m.target), _MoveStats())
+                 for m in candidates]
+
+        deadline = time.perf_counter() + self._budget_ms / 1000
+        rollouts = 0
+        while time.perf_counter() < deadline and (
+                self._max_rollouts is None or rollouts < self._max_rollouts):
+            index = _ucb_index(stats)
+            stats[index].total += self._rollout(candidates[index], deadline)
+            stats[index].visits += 1
+            rollouts += 1
+
+        if not any(s.visits for s in stats):
+            return self._choice(candidates)
+        best = max(range(len(candidates)),
+                   key=lambda i: (stats[i].visits > 0, stats[i].mean()))
+        return candidates[best]
+
+    def _rollout(self, move: Move, deadline: float) -> float:
+        """Simulate the combat after a move, then restore it.
+
+        No round is started after the deadline (a perf_counter value).
+        """
+        combat = self._combat
+        assert combat is not None and self._user is not None
+        snapshot = combat.snapshot()
+        try:
+            self._play_round(combat, {self._user: move})
+            for _ in range(self._depth - 1):
+                if (self._combat_over(combat)
+                        or time.perf_counter() >= deadline):
+                    break
+                self._play_round(combat, {})
+            return self._score(combat)
+        finally:
+            combat.restore(snapshot)
+
+    def _play_round(self, combat: 'CombatLogic',
+                    chosen: Dict[Character, Move]) -> None:
+        active = combat.active_characters()
+        combat.start_round([chosen[c] if c in chosen
+                            else self._random_move(c, active)
+                            for c in active])
+        combat.end_round()
+
+    def _random_move(self, user: Character,
+                     targets: Sequence[Character]) -> Move:
+        moves = available_moves(user, targets)
+        if not moves:
+            return Move(_wait, user, user)
+        return self._choice(moves)
+
+    def _combat_over(self, combat: 'CombatLogic') -> bool:
+        allies, enemies = self._teams(combat.active_characters())
+        return not allies or not enemies
+
+    def _score(self, combat: 'CombatLogic') -> float:
+        """Ally health fraction minus enemy health fraction, in [-1, 1]."""
+        allies, enemies = self._teams(combat.characters())
+        return _health_fraction(allies) - _health_fraction(enemies)
+
+    def _teams(self, characters: Sequence[Character]
+               ) -> Tuple[List[Character], List[Character]]:
+        user = self._user
+        assert user is not None
+        allies = [c for c in characters if same_team(user, c)]
+        enemies = [c for c in characters if not same_team(user, c)]
+        return allies, enemies
+
+
+def _ucb_index(stats: Sequence[_MoveStats]) -> int:
+    """Index of the move to explore next, by the UCB1 rule."""
+    for index, move_stats in enumerate(stats):
+        if not move_stats.visits:
+            return index
+    log_visits = math.log(max(sum(s.visits for s in stats), 1.0))
+
+    def upper_bound(index: int) -> float:
+        move_stats = stats[index]
+        return move_stats.mean() + _EXPLORATION * math.sqrt(
+            log_visits / move_stats.visits)
+
+    return max(range(len(stats)), key=upper_bound)
+
+
+def _health_fraction(characters: Sequence[Character]) -> float:
+    """Mean fraction of maximum health (plus shields) left."""
+    if not characters:
+        return 0.0
+    total = 0.0
+    for char in characters:
+        if is_dead(char):
+            continue
+        status = char.status
+        max_health = max(status.get_attribute(Attributes.MAX_HEALTH), 1)
+        health = (status.get_attribute(Attributes.HEALTH)
+                  + status.get_attribute(Attributes.SHIELD))
+        total += min(health / max_health, 1.0)
+    return total / len(characters)
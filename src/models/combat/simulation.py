@@ -0,0 +1,180 @@
+"""Batch combat simulation without scenes, views or events.
+
+Combats are run directly on CombatLogic, with every character (including the
+player team) selecting moves through its AI. This is intended for balance and
+regression testing of characters and subroutines.
+"""
+from enum import Enum
+from random import Random
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from models.characters.character_base import Character
+from models.characters.character_examples import CharacterData
+from models.characters.character_impl import build_character
+from models.characters.conditions import is_alive
+from models.characters.states import Attributes, State
+from models.combat.ai_impl import AIType
+from models.combat.combat_logic import CombatLogic
+
+DEFAULT_MAX_ROUNDS = 100
+
+
+class Teams(Enum):
+    PLAYER = 'player'
+    ENEMY = 'enemy'
+
+
+class CombatResult(NamedTuple):
+    """Outcome of a single simulated combat.
+
+    Attributes:
+        winner: The only team with characters left alive, or None if the round
+            limit was reached or both teams died.
+        num_rounds: Number of rounds played.
+        damage_to_player_team: Net health lost by the player team, summed
+            over rounds. Within a round, healing offsets damage, but rounds in
+            which a character gains health do not reduce this number.
+        damage_to_enemy_team: Net health lost by the enemy team, as above.
+    """
+    winner: Optional[Teams]
+    num_rounds: int
+    damage_to_player_team: int
+    damage_to_enemy_team: int
+
+
+class SimulationSummary(NamedTuple):
+    """Aggregate statistics of many simulated combats."""
+    num_combats: int = 0
+    player_wins: int = 0
+    enemy_wins: int = 0
+    total_rounds: int = 0
+    damage_to_player_team: int = 0
+    damage_to_enemy_team: int = 0
+
+    @property
+    def draws(self) -> int:
+        return self.num_combats - self.player_wins - self.enemy_wins
+
+    @property
+    def player_win_rate(self) -> float:
+        return self._per_combat(self.player_wins)
+
+    @property
+    def enemy_win_rate(self) -> float:
+        return self._per_combat(self.enemy_wins)
+
+    @property
+    def mean_rounds(self) -> float:
+        return self._per_combat(self.total_rounds)
+
+    def add(self, result: CombatResult) -> 'SimulationSummary':
+        """A new summary that also accounts for a single combat result."""
+        return SimulationSummary(
+            self.num_combats + 1,
+            self.player_wins + (result.winner is Teams.PLAYER),
+            self.enemy_wins + (result.winner is Teams.ENEMY),
+            self.total_rounds + result.num_rounds,
+            self.damage_to_player_team + result.damage_to_player_team,
+            self.damage_to_enemy_team + result.damage_to_enemy_team)
+
+    def merge(self, other: 'SimulationSummary') -> 'SimulationSummary':
+        """A new summary combining the combats of both summaries."""
+        return SimulationSummary(*(a + b for a, b in zip(self, other)))
+
+    def _per_combat(self, total: int) -> float:
+        if not self.num_combats:
+            return 0.0
+        return total / self.num_combats
+
+
+def simulate_combat(player_team: Sequence[CharacterData],
+                    enemy_team: Sequence[CharacterData],
+                    player_ai: Optional[AIType] = AIType.Random,
+                    enemy_ai: Optional[AIType] = None,
+                    max_rounds: int = DEFAULT_MAX_ROUNDS,
+                    rng: Optional[Random] = None) -> CombatResult:
+    """Run a single combat to completion.
+
+    Args:
+        player_team: Data of the characters on the player team. These are
+            given the IS_PLAYER state, which determines teams.
+        enemy_team: Data of the characters on the enemy team.
+        player_ai: AI used by the player team. If None, the AI type of each
+            character's data is used.
+        enemy_ai: AI used by the enemy team. If None (default), the AI type of
+            each character's data is used.
+        max_rounds: Maximum number of rounds before the combat is a draw.
+        rng: (Optional) Random number generator used by all character AIs. If
+            not given, the global state of the random module is used.
+
+    Returns:
+        The combat result.
+    """
+    players = [_build_combatant(data, player_ai, True, rng)
+               for data in player_team]
+    enemies = [_build_combatant(data, enemy_ai, False, rng)
+               for data in enemy_team]
+    teams = {Teams.PLAYER: players, Teams.ENEMY: enemies}
+    logic = CombatLogic(players + enemies)
+
+    damage = {team: 0 for team in Teams}
+    num_rounds = 0
+    while num_rounds < max_rounds and len(_teams_alive(teams)) == 2:
+        active_chars = logic.active_characters()
+        health_before = _team_healths(teams)
+
+        logic.start_round([c.ai.select_move(active_chars)
+                           for c in active_chars])
+        logic.end_round()
+        num_rounds += 1
+
+        for team, healths in _team_healths(teams).items():
+            damage[team] += sum(max(before - after, 0) for before, after
+                                in zip(health_before[team], healths))
+
+    alive = _teams_alive(teams)
+    winner = alive[0] if len(alive) == 1 else None
+    return CombatResult(winner, num_rounds,
+                        damage[Teams.PLAYER], damage[Teams.ENEMY])
+
+
+def simulate_combats(num_combats: int, player_team: Sequence[CharacterData],
+                     enemy_team: Sequence[CharacterData],
+                     player_ai: Optional[AIType] = AIType.Random,
+                     enemy_ai: Optional[AIType] = None,
+                     max_rounds: int = DEFAULT_MAX_ROUNDS,
+                     rng: Optional[Random] = None) -> SimulationSummary:
+    """Run many independent combats and summarize the results.
+
+    See simulate_combat for argument details.
+    """
+    summary = SimulationSummary()
+    for _ in range(num_combats):
+        summary = summary.add(simulate_combat(player_team, enemy_team,
+                                              player_ai, enemy_ai, max_rounds,
+                                              rng))
+    return summary
+
+
+def _build_combatant(data: CharacterData, ai_type: Optional[AIType],
+                     is_player: bool, rng: Optional[Random]) -> Character:
+    if ai_type is not None:
+        data = data._replace(ai_type=ai_type)
+    if data.ai_type is AIType.No_AI:
+        raise ValueError('{} has no AI to select moves.'.format(data.name))
+
+    char = build_character(data=data, rng=rng)
+    if is_player:
+        char.status.set_state(State.IS_PLAYER, True)
+    return char
+
+
+def _team_healths(teams: Dict[Teams, List[Character]]
+                  ) -> Dict[Teams, List[int]]:
+    return {team: [c.status.get_attribute(Attributes.HEALTH) for c in chars]
+            for team, chars in teams.items()}
+
+
+def _teams_alive(teams: Dict[Teams, List[Character]]) -> List[Teams]:
+    return [team for team, chars in teams.items()
+            if any(is_alive(c) for c in chars)]
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+import pytest
 from parameterized import parameterized
 
 from models.characters.character_examples import CharacterData
@@ -8,7 +9,7 @@ from models.characters.chassis import ChassisData
 from models.characters.subroutines_base import build_subroutine
 from models.combat.ai_impl import AIType, build_ai
 
-AI_TYPES = [[AIType.Random], [AIType.Shuffle]]
+AI_TYPES = [[AIType.Random], [AIType.Shuffle], [AIType.Search]]
 
 
 class AITest(TestCase):
@@ -32,3 +33,8 @@ class AITest(TestCase):
             move_comps.add(components)
 
         assert len(move_comps) == 1
+
+
+def test_search_type_has_no_selection_function():
+    with pytest.raises(ValueError):
+        AIType.Search.selection_fun()
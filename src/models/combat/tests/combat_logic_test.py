@@ -4,14 +4,22 @@ from models.characters.character_examples import CharacterTypes
 from models.characters.character_impl import build_character
 from models.characters.chassis import Chassis
 from models.characters.chassis_examples import ChassisTypes
+from models.characters.conditions import is_dead
+from models.characters.mods_base import SlotTypes, build_mod
 from models.characters.moves_base import Move
 from models.characters.states import Attributes, State
-from models.characters.subroutine_examples import (damage_over_time,
+from models.characters.subroutine_examples import (adjust_attribute,
+                                                   damage_over_time,
                                                    direct_damage)
 from models.characters.subroutines_base import build_subroutine
 from models.combat.combat_logic import CombatLogic
 
 
+@pytest.fixture(autouse=True)
+def verify_cpu_reserved(monkeypatch):
+    monkeypatch.setattr(CombatLogic, 'verify_cpu_reserved', True)
+
+
 @pytest.fixture()
 def player():
     # Player character with zero initial mods.
@@ -145,6 +153,22 @@ def test_after_effect_occurs_at_end_of_move(player, enemy, multi_use, duration,
     assert after_effect_calls
 
 
+def test_adjust_attribute_on_target_killed_before_resolution(player, enemy):
+    weaken = Move(adjust_attribute(Attributes.MAX_CPU, -1, duration=2,
+                                   time_to_resolve=2), enemy, player)
+    health = player.status.get_attribute(Attributes.HEALTH)
+    kill = Move(direct_damage(health, cpu_slots=0, time_to_resolve=0), enemy,
+                player)
+
+    logic = CombatLogic([player, enemy])
+    logic.start_round([weaken, kill])
+    logic.end_round()
+
+    assert is_dead(player)
+    assert not player.status.active_effects()
+    assert not logic.all_moves_present()
+
+
 @pytest.mark.parametrize('multi_use', [True, False])
 @pytest.mark.parametrize('duration', [0, 3])
 @pytest.mark.parametrize('time_to_resolve', [0, 2])
@@ -170,3 +194,98 @@ def test_move_disappears_after_expected_time(player, enemy, multi_use, duration,
 
     logic.end_round()
     assert move not in logic.all_moves_present()
+
+
+@pytest.mark.parametrize('multi_use', [True, False])
+def test_cpu_reserved_by_overlapping_moves(player, enemy, multi_use):
+    def move(cpu_slots, duration):
+        return Move(build_subroutine(num_cpu=cpu_slots, time_to_resolve=1,
+                                     duration=duration, multi_use=multi_use),
+                    player, enemy)
+
+    def get_cpu():
+        return player.status.get_attribute(Attributes.CPU_AVAILABLE)
+
+    logic = CombatLogic([player, enemy])
+    max_cpu = get_cpu()
+
+    logic.start_round([move(1, 0), move(2, 2)])
+    logic.end_round()
+    assert get_cpu() == max_cpu - 3
+
+    logic.start_round([])
+    logic.end_round()
+    assert get_cpu() == max_cpu - 2
+
+    for _ in range(2):
+        logic.start_round([])
+        logic.end_round()
+    assert get_cpu() == max_cpu
+
+
+def test_inconsistent_cpu_reserved_raises(player, enemy):
+    logic = CombatLogic([player, enemy])
+    logic._cpu_reserved[player] = 1
+
+    with pytest.raises(AssertionError, match='CPU reserved'):
+        logic.end_round()
+
+
+def test_repeated_moves_are_distinct_and_share_subroutine(player, enemy):
+    sub = build_subroutine(num_cpu=0, time_to_resolve=2)
+    move = Move(sub, player, enemy)
+
+    logic = CombatLogic([player, enemy])
+    logic.start_round([move, move])
+
+    moves = logic.all_moves_present()
+    assert len(moves) == 2
+    assert moves[0] != moves[1]
+    assert all(m.subroutine is sub for m in moves)
+    assert [m for m, _ in logic.stack.moves_times_remaining()] == list(moves)
+
+
+def test_restore_undoes_rounds(player, enemy):
+    logic = CombatLogic([player, enemy])
+    dot = damage_over_time(1, num_rounds=3, time_to_resolve=1)
+    logic.start_round([Move(dot, player, enemy)])
+    logic.end_round()
+
+    def combat_state():
+        return (logic.stack.moves_times_remaining(), logic.all_moves_present(),
+                logic.active_characters(),
+                [(c.status.get_attribute(att), c.status.active_effects())
+                 for c in (player, enemy) for att in Attributes])
+
+    before = combat_state()
+    snapshot = logic.snapshot()
+    for _ in range(3):
+        logic.start_round([Move(direct_damage(2), player, enemy)])
+        logic.end_round()
+    assert combat_state() != before
+
+    logic.restore(snapshot)
+    assert combat_state() == before
+    logic.start_round([])
+    logic.end_round()
+    assert enemy.status.get_attribute(Attributes.HEALTH) == (
+        enemy.status.get_attribute(Attributes.MAX_HEALTH) - 1)
+
+
+def test_restore_undoes_mod_changes(player, enemy):
+    logic = CombatLogic([player, enemy])
+    mod = build_mod(states_granted=State.ON_FIRE,
+                    attribute_modifiers={Attributes.MAX_HEALTH: 5},
+                    valid_slots=SlotTypes.ARMS)
+    snapshot = logic.snapshot()
+    max_health = player.status.get_attribute(Attributes.MAX_HEALTH)
+
+    player.chassis.attempt_store(mod)
+    assert player.status.has_state(State.ON_FIRE)
+    assert logic.snapshot().statuses[1] is snapshot.statuses[1]
+    assert logic.snapshot().chassis[1] is snapshot.chassis[1]
+
+    logic.restore(snapshot)
+    assert not player.status.has_state(State.ON_FIRE)
+    assert mod not in player.chassis.all_mods()
+    assert player.status.get_attribute(Attributes.MAX_HEALTH) == max_health
@@ -71,3 +71,43 @@ def test_update_stack_called_before_execute_resolved():
 
     with pytest.raises(ValueError, match='execute_resolved'):
         stack.advance_time()
+
+
+def test_moves_added_after_advancing_are_ordered_by_time_left():
+    stack = CombatStack()
+    stack.add_move(move_3_A, 3)
+    stack.resolved_moves()
+    stack.advance_time()
+
+    stack.add_move(move_1, 1)
+    stack.add_move(move_2, 2)
+    stack.add_move(move_3_B, 3)
+
+    actual = tuple(stack.moves_times_remaining())
+    expected = ((move_1, 1), (move_3_A, 2), (move_2, 2), (move_3_B, 3))
+    assert actual == expected
+
+
+def test_move_with_no_time_left_resolves_first():
+    stack = CombatStack()
+    stack.add_move(move_1, 1)
+    stack.advance_time()
+
+    stack.add_move(move_2, 0)
+
+    assert stack.resolved_moves() == (move_2, move_1)
+    assert stack.moves_times_remaining() == []
+
+
+def test_remove_moves_keeps_order_of_other_moves():
+    stack = CombatStack()
+    for m in [move_2, move_3_A, move_3_B, move_1]:
+        stack.add_move(m, m.subroutine.time_to_resolve())
+
+    stack.remove_moves(lambda m: m in (move_2, move_3_A))
+
+    actual = tuple(stack.moves_times_remaining())
+    assert actual == ((move_1, 1), (move_3_B, 3))
+
+    stack.remove_moves(lambda m: True)
+    assert stack.moves_times_remaining() == []
@@ -0,0 +1,61 @@
+from itertools import product
+
+from models.characters.character_examples import CharacterData
+from models.characters.character_impl import build_character
+from models.characters.chassis import ChassisData
+from models.characters.moves_base import Move
+from models.characters.states import State
+from models.characters.subroutine_examples import (damage_over_time,
+                                                   direct_damage, shield_buff,
+                                                   user_is_target)
+from models.characters.subroutines_base import build_subroutine
+from models.combat.move_generation import valid_moves
+
+
+def _character(is_player=False):
+    char = build_character(data=CharacterData(ChassisData()))
+    char.status.set_state(State.IS_PLAYER, is_player)
+    return char
+
+
+def test_valid_moves_match_product_of_subroutines_and_targets():
+    user = _character()
+    targets = [_character(), user, _character(True), _character(True)]
+    subs = [direct_damage(2), shield_buff(1), damage_over_time(1),
+            build_subroutine(can_use=False), build_subroutine(),
+            build_subroutine(can_use=user_is_target)]
+
+    moves = valid_moves(user, subs, targets)
+
+    expected = [Move(sub, user, target)
+                for sub, target in product(subs, targets)
+                if sub.can_use(user, target)]
+    assert list(moves) == expected
+    assert len(moves) == len(expected)
+    assert [moves[i] for i in range(len(moves))] == expected
+    assert moves[-1] == expected[-1]
+    assert moves[1:3] == expected[1:3]
+
+
+def test_shared_target_predicate_evaluated_once_per_target():
+    calls = []
+
+    def predicate(user, target):
+        calls.append(target)
+        return True
+
+    user = _character()
+    targets = [_character(), _character()]
+    subs = [build_subroutine(can_use=predicate) for _ in range(5)]
+
+    moves = valid_moves(user, subs, targets)
+
+    assert len(moves) == 10
+    assert calls == targets
+
+
+def test_no_valid_moves_is_empty():
+    user = _character()
+    moves = valid_moves(user, [build_subroutine(can_use=False)], [user])
+    assert not moves
+    assert list(moves) == []
@@ -0,0 +1,75 @@
+"""Tests for the multiprocess combat simulator."""
+import random
+
+import pytest
+
+from controllers.game import initialize_pygame
+from models.characters.character_examples import CharacterTypes
+from models.combat.parallel_simulation import (_build_chunks,
+                                               simulate_combats_parallel)
+from models.combat.tests.simulation_test import _fighter
+
+_PLAYERS = (CharacterTypes.HUMAN_PLAYER,)
+_ENEMIES = (CharacterTypes.DRONE, CharacterTypes.DRONE)
+
+
+def _strong_fighter():
+    return _fighter(10, 5)
+
+
+def _weak_fighter():
+    return _fighter(10, 1)
+
+
+def _simulate(seed, num_workers):
+    return simulate_combats_parallel(30, _PLAYERS, _ENEMIES, seed=seed,
+                                     num_workers=num_workers, chunk_size=4)
+
+
+def test_chunks_cover_all_combats():
+    chunks = _build_chunks(10, 4, seed=0)
+
+    assert [size for size, _ in chunks] == [4, 4, 2]
+    assert len({chunk_seed for _, chunk_seed in chunks}) == 3
+
+
+@pytest.mark.parametrize('num_workers', [2, 3])
+def test_summary_does_not_depend_on_worker_count(num_workers):
+    summary = _simulate(3, num_workers)
+
+    assert summary.num_combats == 30
+    assert summary == _simulate(3, 1)
+
+
+def test_summary_depends_on_seed():
+    summaries = {_simulate(seed, 1) for seed in range(5)}
+
+    assert len(summaries) > 1
+
+
+def test_team_members_from_functions():
+    summary = simulate_combats_parallel(6, [_strong_fighter],
+                                        [_weak_fighter], num_workers=2,
+                                        chunk_size=2)
+
+    assert summary.num_combats == 6
+    assert summary.player_win_rate == 1.0
+
+
+def test_workers_run_after_pygame_is_initialized():
+    initialize_pygame(no_UI=True)
+
+    assert _simulate(0, 2) == _simulate(0, 1)
+
+
+def test_global_random_state_is_untouched():
+    state = random.getstate()
+
+    _simulate(0, 1)
+
+    assert random.getstate() == state
+
+
+def test_invalid_chunk_size_raises():
+    with pytest.raises(ValueError):
+        simulate_combats_parallel(1, _PLAYERS, _ENEMIES, chunk_size=0)
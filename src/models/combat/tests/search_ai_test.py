@@ -0,0 +1,83 @@
+from random import Random
+
+import pytest
+
+from models.characters.character_examples import CharacterData
+from models.characters.character_impl import build_character
+from models.characters.chassis import ChassisData
+from models.characters.mods_base import SlotTypes
+from models.characters.moves_base import Move
+from models.characters.states import Attributes, State
+from models.characters.subroutine_examples import direct_damage
+from models.combat.combat_logic import CombatLogic
+from models.combat.search_ai import SearchAI
+
+
+def _character(subroutines, is_player=False):
+    chassis = ChassisData({SlotTypes.STORAGE: 1},
+                          attribute_modifiers={Attributes.MAX_HEALTH: 10,
+                                               Attributes.MAX_CPU: 5},
+                          subroutines_granted=tuple(subroutines))
+    char = build_character(data=CharacterData(chassis))
+    char.status.set_state(State.IS_PLAYER, is_player)
+    return char
+
+
+@pytest.fixture()
+def combat():
+    weak = direct_damage(1, cpu_slots=1, time_to_resolve=1, label='weak')
+    strong = direct_damage(9, cpu_slots=1, time_to_resolve=1, label='strong')
+    ai = SearchAI(budget_ms=10000, max_rollouts=40, rng=Random(3))
+    user = _character([weak, strong])
+    enemy = _character([direct_damage(1)], is_player=True)
+    logic = CombatLogic([user, enemy])
+    ai.set_user(user)
+    ai.start_combat(logic)
+    return logic, ai, user, strong
+
+
+def test_search_ai_prefers_stronger_move(combat):
+    logic, ai, user, strong = combat
+    move = ai.select_move(logic.active_characters())
+    assert move.subroutine is strong
+    assert move.user is user
+
+
+def test_search_leaves_combat_unchanged(combat):
+    logic, ai, _, _ = combat
+
+    def combat_state():
+        return (logic.stack.moves_times_remaining(), logic.all_moves_present(),
+                [c.status.get_attribute(att) for c in logic.characters()
+                 for att in Attributes])
+
+    before = combat_state()
+    ai.select_move(logic.active_characters())
+    assert combat_state() == before
+
+
+def test_search_stops_at_time_budget(combat):
+    logic, _, user, _ = combat
+    ai = SearchAI(budget_ms=0)
+    ai.set_user(user)
+    ai.start_combat(logic)
+    # No rollout is started, so the AI falls back to a random valid move.
+    move = ai.select_move(logic.active_characters())
+    assert move.user is user
+    assert move.is_usable()
+
+
+def test_rollout_plays_no_round_after_deadline(combat, monkeypatch):
+    logic, _, user, strong = combat
+    ai = SearchAI(depth=50)
+    ai.set_user(user)
+    ai.start_combat(logic)
+    rounds = []
+    start_round = logic.start_round
+    monkeypatch.setattr(logic, 'start_round',
+                        lambda moves: rounds.append(start_round(moves)))
+
+    enemy = logic.active_characters()[1]
+    ai._rollout(Move(strong, user, enemy), deadline=0.0)
+
+    assert len(rounds) == 1
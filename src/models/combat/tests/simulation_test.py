@@ -0,0 +1,82 @@
+"""Tests for the batch combat simulator."""
+import subprocess
+import sys
+from os.path import abspath, dirname
+
+import pytest
+
+from models.characters.character_examples import CharacterData, CharacterTypes
+from models.characters.chassis import ChassisData
+from models.characters.mods_base import ModData, SlotTypes
+from models.characters.states import Attributes
+from models.characters.subroutine_examples import direct_damage
+from models.combat.ai_impl import AIType
+from models.combat.simulation import (DEFAULT_MAX_ROUNDS, CombatResult,
+                                      SimulationSummary, Teams,
+                                      simulate_combat, simulate_combats)
+
+
+def _fighter(health, damage, name='fighter'):
+    mod = ModData(attribute_modifiers={Attributes.MAX_HEALTH: health},
+                  subroutines_granted=(direct_damage(damage, 0, 0),),
+                  valid_slots=(SlotTypes.ARMS,))
+    chassis = ChassisData({SlotTypes.ARMS: 1},
+                          attribute_modifiers={Attributes.MAX_CPU: 1})
+    return CharacterData(chassis, name, (mod,), ai_type=AIType.Random)
+
+
+def test_stronger_team_always_wins():
+    result = simulate_combat([_fighter(10, 5)], [_fighter(10, 1)])
+
+    # The strong fighter kills the weak one in two rounds, taking one damage
+    # per round.
+    assert result == CombatResult(Teams.PLAYER, 2, 2, 10)
+
+
+def test_round_limit_gives_draw():
+    result = simulate_combat([_fighter(100, 1)], [_fighter(100, 1)],
+                             max_rounds=5)
+
+    assert result.winner is None
+    assert result.num_rounds == 5
+
+
+def test_simulate_combats_summary():
+    summary = simulate_combats(10, [_fighter(10, 5)],
+                               [_fighter(10, 1), _fighter(10, 1)])
+
+    assert summary.num_combats == 10
+    assert summary.player_win_rate == 1.0
+    assert summary.enemy_win_rate == 0.0
+    assert summary.draws == 0
+    assert summary.mean_rounds == 4
+
+
+def test_example_characters_simulate_to_completion():
+    summary = simulate_combats(20, [CharacterTypes.HUMAN_PLAYER.data],
+                               [CharacterTypes.DRONE.data] * 2)
+
+    assert summary.num_combats == 20
+    assert summary.mean_rounds < DEFAULT_MAX_ROUNDS
+    assert summary.damage_to_player_team > 0
+
+
+def test_player_team_without_ai_raises():
+    with pytest.raises(ValueError, match='no AI'):
+        simulate_combat([CharacterTypes.HUMAN_PLAYER.data],
+                        [CharacterTypes.DRONE.data], player_ai=None)
+
+
+def test_empty_summary_rates_are_zero():
+    summary = SimulationSummary()
+
+    assert summary.player_win_rate == 0.0
+    assert summary.mean_rounds == 0.0
+
+
+def test_simulation_does_not_import_pygame():
+    src_dir = dirname(dirname(dirname(dirname(abspath(__file__)))))
+    code = ('import sys; import models.combat.simulation; '
+            'sys.exit("pygame" in sys.modules)')
+
+    assert subprocess.call([sys.executable, '-c', code], cwd=src_dir) == 0
@@ -1,4 +1,3 @@
-from itertools import product
 from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
 
 from data.constants import FRAMES_PER_SECOND, SCREEN_SIZE, BackgroundImages
@@ -13,6 +12,7 @@ from models.characters.player import get_player
 from models.characters.states import Attributes, StatusEffect
 from models.characters.subroutines_base import build_subroutine
 from models.combat.combat_logic import CombatLogic
+from models.combat.move_generation import available_moves
 from models.scenes.layouts import Layout
 from models.scenes.scenes_base import Resolution, Scene
 
@@ -25,14 +25,9 @@ ANIMATION = True  # Set to False during integration tests
 
 
 def _valid_moves(user: Character, targets: Sequence[Character]) -> List[Move]:
-    """All valid moves from a user to a sequence of targets, ignoring CPU slots.
+    """All valid moves from a user to a sequence of targets, within its CPU.
     """
-    return [Move(sub, user, target)
-            for sub, target in
-            product(user.chassis.all_subroutines(), targets)
-            if sub.can_use(user, target)
-            and sub.cpu_slots() <= user.status.get_attribute(
-            Attributes.CPU_AVAILABLE)]
+    return list(available_moves(user, targets))
 
 
 class MoveInfo(NamedTuple):
@@ -62,6 +57,8 @@ class CharacterInfo(NamedTuple):
 
 class CombatScene(EventListener, Scene):
     """Represents and updates all model data involved during a combat."""
+    handled_events = (SelectCharacterEvent, SelectPlayerMoveEvent,
+                      BasicEvents.TICK)
 
     def __init__(self, enemies: Sequence[Character] = None,
                  win_resolution: Resolution = None,
@@ -163,7 +160,7 @@ class CombatScene(EventListener, Scene):
             self._first_turn = False
 
         # Animation in progress
-        if event == BasicEvents.TICK and self._animation_progress is not None:
+        if event is BasicEvents.TICK and self._animation_progress is not None:
             self._animation_progress += 1.0 / _ticks_per_animation
             # Execute moves once animation is finished
             if self._animation_progress >= 1.0:
@@ -42,6 +42,7 @@ class DecisionInfo(NamedTuple):
 
 class DecisionScene(EventListener, Scene):
     """A Scene that is resolved by the player making a choice."""
+    handled_events = (DecisionEvent, BasicEvents.INVENTORY)
 
     def __init__(self, prompt: str, choices: Dict[str, DecisionOption],
                  background_image: str = None,
@@ -65,7 +66,7 @@ class DecisionScene(EventListener, Scene):
         if isinstance(event, DecisionEvent) and self is event.scene:
             assert event.choice in self.choices
             self._choice = self.choices[event.choice]
-        elif event == BasicEvents.INVENTORY:
+        elif event is BasicEvents.INVENTORY:
             self._select_inventory()
 
     @property
@@ -35,6 +35,8 @@ class SelectedModInfo(NamedTuple):
 
 
 class InventoryScene(Scene, EventListener):
+    handled_events = (InventorySelectionEvent, InventoryTransferEvent,
+                      BasicEvents.INVENTORY)
 
     def __init__(self, prev_scene_loader: Callable[[], Scene],
                  loot_mods: Callable[[], Iterable[Mod]] = None) -> None:
@@ -92,7 +94,7 @@ class InventoryScene(Scene, EventListener):
                 if self._selected_mod in self._mods_on_ground:
                     self._mods_on_ground.remove(self._selected_mod)
                 chassis.transfer_mod(self._selected_mod, new_slot)
-        if event == BasicEvents.INVENTORY:
+        if event is BasicEvents.INVENTORY:
             self._is_resolved = True
 
     @property
@@ -1,6 +1,7 @@
+from bisect import bisect_right
 from enum import Enum
 from itertools import accumulate
-from typing import Any, List, Sequence, Set, Tuple
+from typing import Any, Dict, List, Sequence, Set, Tuple
 
 from pygame.rect import Rect
 
@@ -52,6 +53,14 @@ class Layout(object):
                 [k.value for k in _LayoutDirections]))
 
         self._container: Rect = None
+        # Computed once the container is set: the rect of each element, all
+        # rects as returned by get_rects(self), and the rects of each element
+        # including those in child Layouts. Unhashable elements are kept
+        # apart, paired with their rects.
+        self._rects: Tuple[Rect, ...] = ()
+        self._all_rects: Tuple[Rect, ...] = ()
+        self._rects_by_element: Dict[Any, List[Rect]] = {}
+        self._unhashable_rects: List[Tuple[Any, Rect]] = []
         if dimensions is not None:
             self._set_container(Rect(0, 0, *dimensions))
 
@@ -98,7 +107,7 @@ class Layout(object):
         if isinstance(element, Layout):
             return element.rect_at(x, y)
 
-        return self._rect_for_index(index)
+        return self._rects[index].copy()
 
     def get_rects(self, element: Any) -> List[Rect]:
         """Get the Rects of an element in the Layout.
@@ -117,25 +126,16 @@ class Layout(object):
 
         assert self._container is not None
 
-        # All rects case
-        rects = []
         if element is self:
-            for index, candidate in enumerate(self._elements):
-                if isinstance(candidate, Layout):
-                    rects.extend(candidate.get_rects(candidate))
-                    rects.append(candidate._container)
-                else:
-                    rects.append(self._rect_for_index(index))
-            return rects
-
-        # Single element case
-        for index, candidate in enumerate(self._elements):
-            if element == candidate:
-                rects.append(self._rect_for_index(index))
-            elif isinstance(candidate, Layout):
-                rects.extend(candidate.get_rects(element))
-
-        return rects
+            return [rect.copy() for rect in self._all_rects]
+
+        try:
+            rects = self._rects_by_element.get(element, [])
+        except TypeError:  # unhashable element
+            rects = []
+        rects = rects + [rect for candidate, rect in self._unhashable_rects
+                         if element == candidate]
+        return [rect.copy() for rect in rects]
 
     def all_objects(self) -> List[Any]:
         """All objects stored in the layout.
@@ -183,24 +183,39 @@ class Layout(object):
             pos_weight = float(y - self._container.y) / self._container.height
         pos_weight *= self._total_weight
 
-        if pos_weight < self._cumulative_weights[0]:
-            return 0
-        # largest index of all weights less than pos_weight
-        index = 0
-        for index, _ in enumerate(w for w in self._cumulative_weights
-                                  if w <= pos_weight):
-            pass
-        return index + 1
+        return bisect_right(self._cumulative_weights, pos_weight)
 
     def _set_container(self, container: Rect) -> None:
         """Specify Layout container and containers for all child Layouts."""
         assert self._container is None, 'containers only specified once.'
         self._container = container
+        self._rects = tuple(self._rect_for_index(index)
+                            for index in range(len(self._elements)))
 
         layout_children: Set[Layout] = set()
-        for index, child in enumerate(self._elements):
+        for child, rect in zip(self._elements, self._rects):
             if isinstance(child, Layout):
                 if child in layout_children:
                     raise ValueError('Layout may only exist as one element.')
-                child._set_container(self._rect_for_index(index))
+                child._set_container(rect)
                 layout_children.add(child)
+
+        all_rects: List[Rect] = []
+        for child, rect in zip(self._elements, self._rects):
+            self._add_rect(child, rect)
+            if isinstance(child, Layout):
+                all_rects.extend(child._all_rects)
+                all_rects.append(child._container)
+                for element, rects in child._rects_by_element.items():
+                    self._rects_by_element.setdefault(element, []).extend(
+                        rects)
+                self._unhashable_rects.extend(child._unhashable_rects)
+            else:
+                all_rects.append(rect)
+        self._all_rects = tuple(all_rects)
+
+    def _add_rect(self, element: Any, rect: Rect) -> None:
+        try:
+            self._rects_by_element.setdefault(element, []).append(rect)
+        except TypeError:  # unhashable element
+            self._unhashable_rects.append((element, rect))
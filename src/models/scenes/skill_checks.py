@@ -3,7 +3,8 @@ import random
 from bisect import bisect_left
 from enum import Enum
 from itertools import accumulate
-from typing import Any, Sequence, Tuple
+from random import Random
+from typing import Any, Optional, Sequence, Tuple
 
 from models.characters.player import get_player
 from models.characters.states import AttributeType
@@ -60,7 +61,8 @@ _difficulty_probs = {k: v for k, v in
                      zip(Difficulty, [0, 1 / 8, 1 / 4, 1 / 2, 3 / 4, 7 / 8, 1])}
 
 
-def sample_weights(weighted_objects: Sequence[Tuple[Any, int]]) -> Any:
+def sample_weights(weighted_objects: Sequence[Tuple[Any, int]],
+                   rng: Optional[Random] = None) -> Any:
     """Return a probabilistic sample based on weights.
 
     Each possible outcome is given a positive weight. Its relative
@@ -68,6 +70,8 @@ def sample_weights(weighted_objects: Sequence[Tuple[Any, int]]) -> Any:
 
     Args:
         weighted_objects: A sequence of outcome,weight pairs.
+        rng: (Optional) Random number generator to sample from. If not given,
+            the global state of the random module is used.
     Returns:
         One of the outcomes in weighted_objects, with probability matching its
         relative weight.
@@ -80,7 +84,8 @@ def sample_weights(weighted_objects: Sequence[Tuple[Any, int]]) -> Any:
     # Sample outcomes according to weight.
     cum_weights = list(accumulate((rw[1] for rw in weighted_objects),
                                   lambda a, b: a + b))
-    num = random.randint(0, cum_weights[-1] - 1) + 1
+    randint = random.randint if rng is None else rng.randint
+    num = randint(0, cum_weights[-1] - 1) + 1
     index = bisect_left(cum_weights, num)
 
     assert index < len(weighted_objects), (num, index)
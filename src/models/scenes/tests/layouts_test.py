@@ -107,3 +107,23 @@ def test_get_rects_all():
         assert rect in expected
     for rect in expected:
         assert rect in actual
+
+
+def test_get_rects_nested_elements_in_order():
+    inner_layout = Layout([('A', 1), ('B', 1)], 'horizontal')
+    outer_layout = Layout([('A', 1), (inner_layout, 1), (['C'], 1)],
+                          'vertical', (6, 6))
+
+    assert outer_layout.get_rects('A') == [Rect(0, 0, 6, 2),
+                                           Rect(0, 2, 3, 2)]
+    assert outer_layout.get_rects(inner_layout) == [Rect(0, 2, 6, 2)]
+    assert outer_layout.get_rects(['C']) == [Rect(0, 4, 6, 2)]
+    assert outer_layout.get_rects('Z') == []
+
+
+def test_get_rects_returns_new_rects():
+    layout = Layout([('A', 1)], dimensions=(4, 4))
+
+    layout.get_rects('A')[0].move_ip(1, 1)
+
+    assert layout.get_rects('A') == [Rect(0, 0, 4, 4)]
@@ -6,6 +6,7 @@ from views.pygame_screen import Screen
 
 class BackgroundArtist(SceneArtist):
     """Draws the background image."""
+    static = True
 
     def __init__(self, scene: Scene) -> None:
         self._background_image: str = scene.background_image
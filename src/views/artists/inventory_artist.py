@@ -1,4 +1,4 @@
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 from pygame.rect import Rect
 
@@ -110,47 +110,72 @@ def _render_mod_property(x: int, spacing: int, label: str, lines: Sequence[str],
     return text_rect
 
 
-class InventoryArtist(SceneArtist):
+def _title_rects(screen: Screen) -> Tuple[Rect, Rect]:
+    # Rects of the scene title and exit key texts.
+    inv_key = Keybindings().keys_for_event(BasicEvents.INVENTORY)[0]
+    x, = rescale_horizontal(20)
+    y, = rescale_vertical(10)
+    title = screen.text_rect('Inventory', _OVERLAY_FONT_SIZE, x, y)
+    exit_key = screen.text_rect('{} - Return'.format(inv_key),
+                                _OVERLAY_FONT_SIZE, x, title.y + title.h)
+    return title, exit_key
+
+
+def _selected_mod_slots(scene: InventoryScene) -> List[SlotTypes]:
+    if scene.selected_mod is None:
+        return []
+    selected_mod_slots = scene.selected_mod.valid_slots()
+    selected_mod_slots.append(SlotTypes.GROUND)  # ground always valid
+    return selected_mod_slots
+
+
+class InventoryChromeArtist(SceneArtist):
+    """Draws the scene title, exit key and slot headers.
+
+    These only change when a mod is selected or moved, so they are drawn in a
+    static layer.
+    """
+    static = True
 
     def render(self, screen: Screen, scene: Scene) -> None:
         assert isinstance(scene, InventoryScene)
 
-        # Scene title, exit key, and error message
         inv_key = Keybindings().keys_for_event(BasicEvents.INVENTORY)[0]
-        x, = rescale_horizontal(20)
-        y_shift, = rescale_vertical(10)
-        y = y_shift
-        rect = screen.render_text('Inventory', _OVERLAY_FONT_SIZE, x, y, WHITE)
-        y = rect.y + rect.h
-        rect = screen.render_text('{} - Return'.format(inv_key),
-                                  _OVERLAY_FONT_SIZE, x, y, WHITE)
+        title, exit_key = _title_rects(screen)
+        screen.render_text('Inventory', _OVERLAY_FONT_SIZE, title.x, title.y,
+                           WHITE)
+        screen.render_text('{} - Return'.format(inv_key), _OVERLAY_FONT_SIZE,
+                           exit_key.x, exit_key.y, WHITE)
 
-        if scene.UI_error_message:
-            x = rect.x + rect.w + 50
-            h = y + rect.h - y_shift
-            y = y_shift
-            screen.render_text(scene.UI_error_message, _ERROR_FONT_SIZE, x, y,
-                               RED, h=h)
-
-        # Inventory slots, mods, and mod information
         layout = scene.layout
-        scene_objects = layout.all_objects()
+        selected_mod_slots = _selected_mod_slots(scene)
+        for obj in layout.all_objects():
+            if isinstance(obj, SlotHeaderInfo):
+                rects = layout.get_rects(obj)
+                assert len(rects) == 1
+                _render_slot_header(obj, rects[0], selected_mod_slots, screen)
 
-        if scene.selected_mod is not None:
-            selected_mod_slots = scene.selected_mod.valid_slots()
-            selected_mod_slots.append(SlotTypes.GROUND)  # ground always valid
-        else:
-            selected_mod_slots = []
 
-        for obj in scene_objects:
+class InventoryArtist(SceneArtist):
+    """Draws the error message, mod rows and selected mod information."""
+
+    def render(self, screen: Screen, scene: Scene) -> None:
+        assert isinstance(scene, InventoryScene)
+
+        if scene.UI_error_message:
+            title, exit_key = _title_rects(screen)
+            x = exit_key.x + exit_key.w + 50
+            h = exit_key.y + exit_key.h - title.y
+            screen.render_text(scene.UI_error_message, _ERROR_FONT_SIZE, x,
+                               title.y, RED, h=h)
+
+        layout = scene.layout
+        for obj in layout.all_objects():
             if obj is None:
                 continue
 
             rects = layout.get_rects(obj)
-            if isinstance(obj, SlotHeaderInfo):
-                assert len(rects) == 1
-                _render_slot_header(obj, rects[0], selected_mod_slots, screen)
-            elif isinstance(obj, SlotRowInfo):
+            if isinstance(obj, SlotRowInfo):
                 assert len(rects) == 1
                 _render_mod_slot(obj, rects[0], screen)
             elif isinstance(obj, SelectedModInfo):
@@ -0,0 +1,46 @@
+from typing import List, Optional, Sequence
+
+import pygame
+
+from data.constants import SCREEN_SIZE
+from models.scenes.scenes_base import Scene
+from views.artists.scene_artist_base import SceneArtist
+from views.pygame_screen import Screen, get_surface_screen
+from views.recording_screen import DrawCommand, RecordingScreen
+
+
+class LayerArtist(SceneArtist):
+    """Draws static artists pre-composited into an off-screen surface.
+
+    The artists are recorded every frame, which is cheap, but their drawing
+    is composited again only when the recorded commands change. Each
+    composite is a new surface, so that SceneView sees the change.
+    """
+
+    def __init__(self, artists: Sequence[SceneArtist]) -> None:
+        self._artists = tuple(artists)
+        self._commands: Optional[List[DrawCommand]] = None
+        self._surface: Optional[pygame.Surface] = None
+        self.num_composites = 0
+
+    def render(self, screen: Screen, scene: Scene) -> None:
+        recorder = RecordingScreen(screen)
+        for artist in self._artists:
+            artist.render(recorder, scene)
+
+        if self._surface is None or recorder.commands != self._commands:
+            self._surface = _composite(recorder.commands)
+            self._commands = recorder.commands
+            self.num_composites += 1
+        screen.render_surface(self._surface, 0, 0)
+
+
+def _composite(commands: Sequence[DrawCommand]) -> pygame.Surface:
+    surface = pygame.Surface(SCREEN_SIZE)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    layer_screen = get_surface_screen(surface)
+    layer_screen.clear()
+    for command in commands:
+        command.draw(layer_screen)
+    return surface
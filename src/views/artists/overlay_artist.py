@@ -9,6 +9,7 @@ _FONT_SIZE, = rescale_horizontal(28)
 
 class OverlayArtist(SceneArtist):
     """Draws basic overlay information, like player health."""
+    static = True
 
     def render(self, screen: Screen, scene: Scene) -> None:
 
@@ -5,6 +5,9 @@ from views.pygame_screen import Screen
 
 
 class SceneArtist(metaclass=abc.ABCMeta):
+    # Whether the artist draws the same thing until the scene or its layout
+    # changes, so that its drawing can be pre-composited (see SceneView).
+    static: bool = False
 
     @abc.abstractmethod
     def render(self, screen: Screen, scene: Scene) -> None:
@@ -3,8 +3,16 @@ from typing import Dict
 
 import pygame
 
+from views.surface_cache import CacheStats, SurfaceCache
+
 _IMAGE_CACHE: Dict[str, pygame.Surface] = {}
 
+# Scaled images take at most this much pixel memory. A full screen background
+# at 1600x1200 and 32 bits per pixel takes 7.5 MB.
+SCALED_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+_SCALED_IMAGE_CACHE = SurfaceCache(SCALED_IMAGE_CACHE_BYTES)
+
 
 def load_image(image_path: str) -> pygame.Surface:
     assert image_path is not None
@@ -13,3 +21,27 @@ def load_image(image_path: str) -> pygame.Surface:
         _IMAGE_CACHE[image_path] = pygame.image.load(image_path)
 
     return _IMAGE_CACHE[image_path]
+
+
+def load_scaled_image(image_path: str, w: int, h: int) -> pygame.Surface:
+    """An image scaled to width w and height h, ready for blitting.
+
+    Scaled images are cached. Once a display mode is set, they are converted
+    to the pixel format of the display, keeping per-pixel transparency.
+    """
+    return _SCALED_IMAGE_CACHE.get(
+        (image_path, w, h), lambda: _scale(load_image(image_path), w, h))
+
+
+def scaled_image_cache_stats() -> CacheStats:
+    return _SCALED_IMAGE_CACHE.stats()
+
+
+def _scale(image: pygame.Surface, w: int, h: int) -> pygame.Surface:
+    if image.get_size() != (w, h):
+        image = pygame.transform.scale(image, (w, h))
+    if pygame.display.get_surface() is None:
+        return image
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+    return image.convert()
@@ -1,13 +1,15 @@
 import os
 from abc import abstractmethod
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import pygame
 from pygame.rect import Rect
 
 from data import constants
 from data.colors import ColorType
-from views.pygame_images import load_image
+from views.pygame_images import load_image, load_scaled_image
+from views.surface_cache import CacheStats, LRUCache, SurfaceCache
 
 
 class Screen(object):
@@ -88,29 +90,77 @@ class Screen(object):
 
         """
 
+    @abstractmethod
+    def render_surface(self, surface: pygame.Surface, x: int, y: int) -> None:
+        """Draw a surface with its top left corner at (x, y)."""
+
     @abstractmethod
     def clear(self) -> None:
         """Removes everything from the screen."""
         pass
 
     @abstractmethod
-    def update(self) -> None:
-        """Makes sure any render/clear calls have been posted to the screen."""
+    def update(self, rects: Sequence[Rect] = None) -> None:
+        """Makes sure any render/clear calls have been posted to the screen.
+
+        Args:
+            rects: (Optional) Regions of the screen that changed. By default
+                the whole screen is posted.
+        """
         pass
 
+    @abstractmethod
+    def set_clip(self, rect: Optional[Rect]) -> None:
+        """Restrict drawing to a rect, or to the whole screen if None."""
+
+    @abstractmethod
+    def text_rect(self, text: str, font_size: int, x: int, y: int,
+                  w: int = None, h: int = None) -> Rect:
+        """The Rect that render_text would return, without rendering."""
+
+    @abstractmethod
+    def image_rect(self, image_path: str, x: int, y: int, w: int,
+                   h: int) -> Rect:
+        """The Rect that render_image would cover, without rendering."""
+
     @abstractmethod
     def render_line(self, start: Tuple[int, int], end: Tuple[int, int],
                     color: ColorType, thickness: int = 2) -> None:
         """Draw a line on the screen."""
 
 
+# Rasterized text takes at most this much pixel memory.
+TEXT_CACHE_BYTES = 16 * 1024 * 1024
+# Maximum number of cached results of fitting text into a rect.
+TEXT_FIT_CACHE_SIZE = 1024
+
+
+class _TextFit(NamedTuple):
+    """Text broken into lines to fit a rect, at a possibly reduced font size.
+    """
+    font_size: int
+    lines: Tuple[str, ...]
+    height: int  # Total height of the lines.
+
+
 class _PygameScreen(Screen):
     _screen: pygame.Surface = None
+    # Fonts and rendered text are shared by all screens.
+    _fonts: Dict[int, pygame.font.Font] = {}
+    _text_surfaces = SurfaceCache(TEXT_CACHE_BYTES)
+    _text_fits = LRUCache(TEXT_FIT_CACHE_SIZE)
+
+    def __init__(self, surface: pygame.Surface = None) -> None:
+        """
 
-    def __init__(self) -> None:
-        if self._screen is None:
+        Args:
+            surface: (Optional) Surface to draw on. By default, the display
+                is initialized and drawn on.
+        """
+        if surface is not None:
+            self._screen = surface
+        elif self._screen is None:
             self._initialize_screen()
-        self._fonts: Dict[int, pygame.font.Font] = {}
 
     def _font(self, size: int) -> pygame.font.Font:
         if size not in self._fonts:
@@ -131,26 +181,19 @@ class _PygameScreen(Screen):
             os.environ['SDL_AUDIODRIVER'] = 'dummy'
             self._screen = pygame.display.set_mode(constants.SCREEN_SIZE)
 
-    def update(self) -> None:
+    def update(self, rects: Sequence[Rect] = None) -> None:
         """Makes sure any render/clear calls have been posted to the screen."""
-        pygame.display.flip()
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
 
-    def render_texts(
-            self,
-            texts: List[str],
-            font_size: int,
-            x: int,
-            y: int,
-            color: ColorType,
-            spacing: int) -> None:
-        for text in texts:
-            self.render_text(text, font_size, x, y, color)
-            y += spacing
+    def set_clip(self, rect: Optional[Rect]) -> None:
+        self._screen.set_clip(rect)
 
-    def render_text(self, text: str, font_size: int, x: int, y: int,
-                    color: ColorType, w: int = None, h: int = None) -> Rect:
-        font = self._font(font_size)
-        rasterized = font.render(text, True, color)
+    def text_rect(self, text: str, font_size: int, x: int, y: int,
+                  w: int = None, h: int = None) -> Rect:
+        rect = Rect((0, 0), self._font(font_size).size(text))
 
         kwargs = {}
         if w is None:
@@ -163,9 +206,32 @@ class _PygameScreen(Screen):
         else:
             kwargs['centery'] = y + h // 2
 
-        rect = rasterized.get_rect(**kwargs)
+        for attribute, value in kwargs.items():
+            setattr(rect, attribute, value)
+        return rect
+
+    def image_rect(self, image_path: str, x: int, y: int, w: int,
+                   h: int) -> Rect:
+        if w <= 0 or h <= 0:
+            w, h = load_image(image_path).get_size()
+        return Rect(x, y, w, h)
 
-        self._screen.blit(rasterized, rect)
+    def render_texts(
+            self,
+            texts: List[str],
+            font_size: int,
+            x: int,
+            y: int,
+            color: ColorType,
+            spacing: int) -> None:
+        for text in texts:
+            self.render_text(text, font_size, x, y, color)
+            y += spacing
+
+    def render_text(self, text: str, font_size: int, x: int, y: int,
+                    color: ColorType, w: int = None, h: int = None) -> Rect:
+        rect = self.text_rect(text, font_size, x, y, w, h)
+        self._screen.blit(self._rasterize(text, font_size, color), rect)
         return rect
 
     def render_line(self, start: Tuple[int, int], end: Tuple[int, int],
@@ -175,6 +241,43 @@ class _PygameScreen(Screen):
     def render_text_in_rect(self, text: str, font_size: int, rect: Rect,
                             color: ColorType, center_x: bool = False,
                             center_y: bool = False) -> None:
+        rect = Rect(rect)
+        text_fit = self._text_fits.get(
+            (text, font_size, rect.w, rect.h),
+            partial(self._fit_text, text, font_size, rect.w, rect.h))
+
+        kwargs = {}
+        if center_x:
+            kwargs['centerx'] = rect.x + rect.w // 2
+        else:
+            kwargs['x'] = rect.x
+
+        y = rect.y
+        # If y centering, shift each line down
+        if center_y:
+            y += (rect.h - text_fit.height) // 2
+
+        for line in text_fit.lines:
+            line_surf = self._rasterize(line, text_fit.font_size, color)
+            kwargs['y'] = y
+            line_rect = line_surf.get_rect(**kwargs)
+            y += line_rect.h
+            self._screen.blit(line_surf, line_rect)
+
+    def text_cache_stats(self) -> Tuple[CacheStats, CacheStats]:
+        """Stats of the rasterized text cache and of the text fit cache."""
+        return self._text_surfaces.stats(), self._text_fits.stats()
+
+    def _rasterize(self, text: str, font_size: int,
+                   color: ColorType) -> pygame.Surface:
+        """Antialiased text surface, cached."""
+        return self._text_surfaces.get(
+            (text, font_size, color, True),
+            partial(self._font(font_size).render, text, True, color))
+
+    def _fit_text(self, text: str, font_size: int, w: int,
+                  h: int) -> _TextFit:
+        """Break text into lines of width w, shrinking it to fit height h."""
         font = self._font(font_size)
 
         # We break up all the text into words, then populate lines until no more
@@ -185,7 +288,7 @@ class _PygameScreen(Screen):
         current_line = ''
         while words:
             bigger_line = current_line + ' ' + words[-1]
-            if font.size(bigger_line)[0] < rect.w:  # word can be added to line
+            if font.size(bigger_line)[0] < w:  # word can be added to line
                 current_line = bigger_line
                 words.pop()
             else:  # make a new line
@@ -195,54 +298,23 @@ class _PygameScreen(Screen):
                 current_line = ''
         lines.append(current_line[1:])
 
-        # order all line surfaces paired with the rects that contain them
-        surfaces_rects: List[Tuple[pygame.Surface, Rect]] = []
-        y = rect.y
-
-        kwargs = {}
-        if center_x:
-            kwargs['centerx'] = rect.x + rect.w // 2
-        else:
-            kwargs['x'] = rect.x
-
-        for line in lines:
-            line_surf = font.render(line, True, color)
-
-            kwargs['y'] = y
-
-            line_rect = line_surf.get_rect(**kwargs)
-            y += line_rect.h
-            surfaces_rects.append((line_surf, line_rect))
-
-        # If text does not fit in rect, decrease font and call again
-        if y > rect.y + rect.h:
-            self.render_text_in_rect(text, font_size - 2, rect, color, center_x,
-                                     center_y)
-            return
-
-        # If y centering, shift each line down
-        if center_y:
-            text_height = y - rect.y
-            shift = (rect.h - text_height) // 2
-            for _, line_rect in surfaces_rects:
-                line_rect.y += shift
-
-        for line_surf, line_rect in surfaces_rects:
-            self._screen.blit(line_surf, line_rect)
+        height = sum(font.size(line)[1] for line in lines)
+        # If text does not fit in rect, decrease font and try again
+        if height > h:
+            return self._fit_text(text, font_size - 2, w, h)
+        return _TextFit(font_size, tuple(lines), height)
 
     def render_image(self, image_path: str, x: int, y: int, w: int,
                      h: int) -> None:
-        image = load_image(image_path)
-        rect = image.get_rect()
-        rect.x = x
-        rect.y = y
-        if w > 0 and h > 0:
-            image = pygame.transform.scale(image, (w, h))
-        self._screen.blit(image, rect)
+        rect = self.image_rect(image_path, x, y, w, h)
+        self._screen.blit(load_scaled_image(image_path, rect.w, rect.h), rect)
 
     def render_rect(self, rect: Rect, color: ColorType, width: int) -> None:
         pygame.draw.rect(self._screen, color, rect, width)
 
+    def render_surface(self, surface: pygame.Surface, x: int, y: int) -> None:
+        self._screen.blit(surface, (x, y))
+
     def clear(self) -> None:
         self._screen.fill((0, 0, 0))
 
@@ -255,3 +327,8 @@ def get_screen() -> Screen:
     if _screen is None:
         _screen = _PygameScreen()
     return _screen
+
+
+def get_surface_screen(surface: pygame.Surface) -> Screen:
+    """A screen drawing on an off-screen surface."""
+    return _PygameScreen(surface)
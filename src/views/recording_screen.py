@@ -0,0 +1,148 @@
+"""Recorded drawing commands and the screen regions they damage."""
+from collections import Counter
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+import pygame
+from pygame.rect import Rect
+
+from data.colors import ColorType
+from data.constants import SCREEN_SIZE
+from views.pygame_screen import Screen
+
+# Beyond this many damaged regions, their union is redrawn instead.
+_MAX_DAMAGED_RECTS = 8
+
+
+class DrawCommand(NamedTuple):
+    """A call of a Screen drawing method, with hashable arguments.
+
+    Rects and points are stored as tuples. Surfaces compare by identity.
+    """
+    method: str
+    args: Tuple[Any, ...]
+
+    def draw(self, screen: Screen) -> None:
+        getattr(screen, self.method)(*self.args)
+
+
+class RecordingScreen(Screen):
+    """Screen that records drawing calls instead of drawing.
+
+    Measurements are delegated to another screen, so that render_text returns
+    the same rect as on that screen.
+    """
+
+    def __init__(self, screen: Screen) -> None:
+        self._screen = screen
+        self.commands: List[DrawCommand] = []
+
+    def render_texts(self, texts: List[str], font_size: int, x: int, y: int,
+                     color: ColorType, spacing: int) -> None:
+        self._record('render_texts', tuple(texts), font_size, x, y, color,
+                     spacing)
+
+    def render_text(self, text: str, font_size: int, x: int, y: int,
+                    color: ColorType, w: int = None, h: int = None) -> Rect:
+        self._record('render_text', text, font_size, x, y, color, w, h)
+        return self._screen.text_rect(text, font_size, x, y, w, h)
+
+    def render_text_in_rect(self, text: str, font_size: int, rect: Rect,
+                            color: ColorType, center_x: bool = False,
+                            center_y: bool = False) -> None:
+        self._record('render_text_in_rect', text, font_size, tuple(rect),
+                     color, center_x, center_y)
+
+    def render_image(self, image_path: str, x: int, y: int, w: int,
+                     h: int) -> None:
+        self._record('render_image', image_path, x, y, w, h)
+
+    def render_rect(self, rect: Rect, color: ColorType, width: int) -> None:
+        self._record('render_rect', tuple(rect), color, width)
+
+    def render_line(self, start: Tuple[int, int], end: Tuple[int, int],
+                    color: ColorType, thickness: int = 2) -> None:
+        self._record('render_line', tuple(start), tuple(end), color,
+                     thickness)
+
+    def render_surface(self, surface: pygame.Surface, x: int, y: int) -> None:
+        self._record('render_surface', surface, x, y)
+
+    def clear(self) -> None:
+        self._record('clear')
+
+    def update(self, rects: Sequence[Rect] = None) -> None:
+        pass
+
+    def set_clip(self, rect: Optional[Rect]) -> None:
+        pass
+
+    def text_rect(self, text: str, font_size: int, x: int, y: int,
+                  w: int = None, h: int = None) -> Rect:
+        return self._screen.text_rect(text, font_size, x, y, w, h)
+
+    def image_rect(self, image_path: str, x: int, y: int, w: int,
+                   h: int) -> Rect:
+        return self._screen.image_rect(image_path, x, y, w, h)
+
+    def _record(self, method: str, *args: Any) -> None:
+        self.commands.append(DrawCommand(method, args))
+
+
+def command_bounds(command: DrawCommand, screen: Screen) -> Rect:
+    """Screen region a command may draw on.
+
+    Args:
+        command: Recorded command.
+        screen: Screen used to measure text and images.
+    """
+    method, args = command
+    if method == 'render_text':
+        text, font_size, x, y, _, w, h = args
+        return screen.text_rect(text, font_size, x, y, w, h)
+    if method == 'render_texts':
+        texts, font_size, x, y, _, spacing = args
+        rects = [screen.text_rect(text, font_size, x, y + i * spacing)
+                 for i, text in enumerate(texts)]
+        return rects[0].unionall(rects[1:]) if rects else Rect(x, y, 0, 0)
+    if method == 'render_text_in_rect':
+        return Rect(args[2])
+    if method == 'render_image':
+        return screen.image_rect(*args)
+    if method == 'render_rect':
+        rect, _, width = args
+        return Rect(rect).inflate(width, width)
+    if method == 'render_surface':
+        surface, x, y = args
+        return surface.get_rect(x=x, y=y)
+    if method == 'render_line':
+        start, end, _, thickness = args
+        left, top = min(start[0], end[0]), min(start[1], end[1])
+        rect = Rect(left, top, abs(start[0] - end[0]) + 1,
+                    abs(start[1] - end[1]) + 1)
+        return rect.inflate(thickness, thickness)
+    return Rect((0, 0), SCREEN_SIZE)
+
+
+def damaged_rects(previous: Sequence[DrawCommand],
+                  current: Sequence[DrawCommand],
+                  screen: Screen) -> List[Rect]:
+    """Screen regions that may differ between two frames of commands.
+
+    These are the bounds of commands present in one frame but not the other.
+    If only the order of the commands changed, the whole screen is damaged.
+    """
+    changed = Counter(previous)
+    changed.subtract(current)
+    commands = [command for command, count in changed.items() if count]
+    if not commands:
+        if list(previous) == list(current):
+            return []
+        return [Rect((0, 0), SCREEN_SIZE)]
+
+    screen_rect = Rect((0, 0), SCREEN_SIZE)
+    rects = [screen_rect.clip(command_bounds(command, screen))
+             for command in commands]
+    rects = [rect for rect in rects if rect.w and rect.h]
+    if len(rects) > _MAX_DAMAGED_RECTS:
+        return [rects[0].unionall(rects[1:])]
+    return rects
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Sequence
 
 from data.colors import GREEN
 from models.scenes.combat_scene import CombatScene
@@ -9,33 +9,67 @@ from models.scenes.settings_scene import SettingsScene
 from views.artists.background_artist import BackgroundArtist
 from views.artists.combat_artist import CombatArtist
 from views.artists.decision_artist import DecisionArtist
-from views.artists.inventory_artist import InventoryArtist
+from views.artists.inventory_artist import (InventoryArtist,
+                                            InventoryChromeArtist)
+from views.artists.layer_artist import LayerArtist
 from views.artists.overlay_artist import OverlayArtist
 from views.artists.scene_artist_base import SceneArtist
 from views.artists.settings_artist import SettingsArtist
 from views.pygame_screen import get_screen
+from views.recording_screen import DrawCommand, RecordingScreen, damaged_rects
 
 
 class SceneView(object):
-    """Manages all drawing on the screen for a given scene."""
+    """Manages all drawing on the screen for a given scene.
+
+    Artists draw into a RecordingScreen. Frames whose commands are unchanged
+    are not drawn. Otherwise, the frame is redrawn within the bounding box of
+    the regions damaged by changed commands, and only those regions are posted
+    to the display.
+
+    The leading static artists, such as the background, are pre-composited
+    into a single layer which is blitted each frame.
+    """
 
     def __init__(self, scene: Scene) -> None:
         self._scene = scene
         self._screen = get_screen()
-        self._artists = _build_scene_artists(scene)
+        self._artists = _layered(_build_scene_artists(scene))
         self._debug_mode = False
+        # Commands drawn in the last frame, None before the first frame.
+        self._previous_commands: Optional[List[DrawCommand]] = None
 
     def update(self) -> None:
-        self._screen.clear()
+        recorder = RecordingScreen(self._screen)
+        recorder.clear()
         for artist in self._artists:
-            artist.render(self._screen, self._scene)
+            artist.render(recorder, self._scene)
         if self._debug_mode and hasattr(self._scene, 'layout'):
             layout = self._scene.layout  # type: ignore
             for rect in layout.get_rects(layout):
-                self._screen.render_rect(rect, GREEN, 2)
+                recorder.render_rect(rect, GREEN, 2)
+
+        commands = recorder.commands
+        if self._previous_commands is None:
+            self._draw(commands)
+            # VERY IMPORTANT TO CALL UPDATE ONCE
+            self._screen.update()
+        else:
+            rects = damaged_rects(self._previous_commands, commands,
+                                  self._screen)
+            if not rects:
+                return
+            # The commands are replayed once, clipped to the bounding box of
+            # the damaged rects. Only the damaged rects are posted.
+            self._screen.set_clip(rects[0].unionall(rects[1:]))
+            self._draw(commands)
+            self._screen.set_clip(None)
+            self._screen.update(rects)
+        self._previous_commands = commands
 
-        # VERY IMPORTANT TO CALL UPDATE ONCE
-        self._screen.update()
+    def _draw(self, commands: Sequence[DrawCommand]) -> None:
+        for command in commands:
+            command.draw(self._screen)
 
     def toggle_debug(self) -> None:
         """Toggle DEBUG mode, where all layout rects are drawn."""
@@ -50,7 +84,18 @@ def _build_scene_artists(scene: Scene) -> List[SceneArtist]:
     elif isinstance(scene, SettingsScene):
         artists = [BackgroundArtist(scene), OverlayArtist(), SettingsArtist()]
     elif isinstance(scene, InventoryScene):
-        artists = [BackgroundArtist(scene), InventoryArtist()]
+        artists = [BackgroundArtist(scene), InventoryChromeArtist(),
+                   InventoryArtist()]
     else:
         raise ValueError('Unrecognized Scene {}'.format(scene))
     return artists
+
+
+def _layered(artists: Sequence[SceneArtist]) -> List[SceneArtist]:
+    """Artists with the leading static artists grouped into one layer."""
+    num_static = 0
+    while num_static < len(artists) and artists[num_static].static:
+        num_static += 1
+    if num_static < 2:
+        return list(artists)
+    return [LayerArtist(artists[:num_static])] + list(artists[num_static:])
@@ -0,0 +1,94 @@
+"""Least-recently-used caches with a size cap, mainly for pygame surfaces."""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+import pygame
+
+
+class CacheStats(NamedTuple):
+    """Counters of an LRUCache.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups whose value had to be created.
+        evictions: Values dropped to respect the size cap.
+        size: Total size of the values currently cached.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory used by a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def _unit_size(value: Any) -> int:
+    return 1
+
+
+class LRUCache(object):
+    """Values keyed by hashable keys, evicted least recently used.
+
+    The total size of cached values is kept below max_size. A value larger
+    than max_size is returned but not cached.
+    """
+
+    def __init__(self, max_size: int,
+                 size: Callable[[Any], int] = _unit_size) -> None:
+        """
+        Args:
+            max_size: Maximum total size of the cached values.
+            size: Function giving the size of a value. By default each value
+                has size 1, so that max_size is the number of values.
+        """
+        self._max_size = max_size
+        self._size = size
+        self._values: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._total_size = 0
+
+    def get(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """The value cached under key, created with create() if absent."""
+        value = self._values.get(key)
+        if value is not None:
+            self._values.move_to_end(key)
+            self._hits += 1
+            return value
+
+        value = create()
+        value_size = self._size(value)
+        self._misses += 1
+        if value_size > self._max_size:
+            return value
+
+        self._total_size += value_size
+        while self._total_size > self._max_size:
+            _, evicted = self._values.popitem(last=False)
+            self._total_size -= self._size(evicted)
+            self._evictions += 1
+        self._values[key] = value
+        return value
+
+    def clear(self) -> None:
+        """Remove all cached values. Counters other than size are kept."""
+        self._values.clear()
+        self._total_size = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions,
+                          self._total_size)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class SurfaceCache(LRUCache):
+    """LRUCache of surfaces whose total pixel memory is at most max_bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(max_bytes, surface_bytes)
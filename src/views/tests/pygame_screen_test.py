@@ -0,0 +1,35 @@
+import pytest
+from pygame.rect import Rect
+
+from controllers.game import initialize_pygame
+from data.colors import WHITE
+from views.pygame_screen import get_screen
+
+
+@pytest.fixture()
+def screen():
+    initialize_pygame(no_UI=True)
+    return get_screen()
+
+
+def test_text_in_rect_is_fitted_and_rasterized_once(screen):
+    text = 'a line of text long enough to wrap several times in the rect'
+    rect = Rect(0, 0, 120, 40)
+    screen.render_text_in_rect(text, 30, rect, WHITE, center_y=True)
+    surfaces_before, fits_before = screen.text_cache_stats()
+
+    screen.render_text_in_rect(text, 30, rect, WHITE, center_y=True)
+
+    surfaces, fits = screen.text_cache_stats()
+    assert fits.hits == fits_before.hits + 1
+    assert fits.misses == fits_before.misses
+    assert surfaces.misses == surfaces_before.misses
+    assert surfaces.hits > surfaces_before.hits
+
+
+def test_render_text_reuses_surface(screen):
+    first = screen.render_text('HP 10/10', 20, 5, 5, WHITE)
+    misses = screen.text_cache_stats()[0].misses
+    second = screen.render_text('HP 10/10', 20, 5, 5, WHITE)
+    assert first == second
+    assert screen.text_cache_stats()[0].misses == misses
@@ -0,0 +1,94 @@
+import pytest
+
+from controllers.game import initialize_pygame
+from data.colors import WHITE
+from data.constants import SCREEN_SIZE
+from models.scenes.settings_scene import SettingsScene
+from views.artists.layer_artist import LayerArtist
+from views.artists.scene_artist_base import SceneArtist
+from views.pygame_screen import _PygameScreen
+from views.scene_view import SceneView
+
+
+@pytest.fixture()
+def display_updates(monkeypatch):
+    initialize_pygame(no_UI=True)
+    updates = []
+    monkeypatch.setattr(_PygameScreen, 'update',
+                        lambda self, rects=None: updates.append(rects))
+    return updates
+
+
+def test_unchanged_frames_are_not_drawn(display_updates):
+    view = SceneView(SettingsScene())
+
+    view.update()
+    view.update()
+    view.update()
+
+    assert display_updates == [None]
+
+
+def test_changed_frames_update_damaged_rects(display_updates):
+    scene = SettingsScene()
+    view = SceneView(scene)
+    view.update()
+
+    scene.options = ('Settings!', 'Y: Return')
+    view.update()
+
+    assert len(display_updates) == 2
+    rects = display_updates[1]
+    assert rects
+    w, h = SCREEN_SIZE
+    assert all(rect.w < w and rect.h < h for rect in rects)
+
+
+class _TitleArtist(SceneArtist):
+    static = True
+
+    def __init__(self) -> None:
+        self.title = 'Title'
+
+    def render(self, screen, scene):
+        screen.render_text(self.title, 20, 10, 10, WHITE)
+
+
+def test_static_artists_are_layered():
+    view = SceneView(SettingsScene())
+
+    layer = view._artists[0]
+    assert isinstance(layer, LayerArtist)
+    assert not any(artist.static for artist in view._artists[1:])
+
+
+def test_layer_composited_only_when_changed(display_updates):
+    scene = SettingsScene()
+    title_artist = _TitleArtist()
+    layer = LayerArtist([title_artist])
+    view = SceneView(scene)
+    view._artists = [layer]
+
+    view.update()
+    view.update()
+    assert layer.num_composites == 1
+
+    title_artist.title = 'Other title'
+    view.update()
+    assert layer.num_composites == 2
+    assert len(display_updates) == 2
+
+
+def test_changed_frame_replayed_once(display_updates, monkeypatch):
+    scene = SettingsScene()
+    view = SceneView(scene)
+    view.update()
+    clips = []
+    monkeypatch.setattr(_PygameScreen, 'set_clip',
+                        lambda self, rect: clips.append(rect))
+
+    scene.options = ('Settings!', 'Y: Return', 'Z: Other')
+    view.update()
+
+    assert len(clips) == 2
+    assert clips[-1] is None
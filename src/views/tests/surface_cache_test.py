@@ -0,0 +1,46 @@
+import pygame
+
+from views.pygame_images import load_scaled_image, scaled_image_cache_stats
+from views.surface_cache import SurfaceCache, surface_bytes
+
+
+def _surface(w=10, h=10):
+    return pygame.Surface((w, h), depth=32)
+
+
+def test_surface_cache_evicts_least_recently_used():
+    size = surface_bytes(_surface())
+    cache = SurfaceCache(max_bytes=2 * size)
+    first, second = _surface(), _surface()
+    cache.get('first', lambda: first)
+    cache.get('second', lambda: second)
+    assert cache.get('first', _surface) is first  # first is now most recent
+
+    cache.get('third', _surface)
+
+    assert len(cache) == 2
+    assert cache.get('first', _surface) is first
+    assert cache.get('second', _surface) is not second
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 4)
+    assert stats.evictions == 2
+    assert stats.size == 2 * size
+
+
+def test_surface_cache_does_not_store_surfaces_over_cap():
+    cache = SurfaceCache(max_bytes=surface_bytes(_surface()) - 1)
+    surface = _surface()
+    assert cache.get('key', lambda: surface) is surface
+    assert not len(cache)
+    assert cache.stats().size == 0
+
+
+def test_scaled_images_are_cached_by_size():
+    path = 'src/data/images/drone.png'
+    image = load_scaled_image(path, 30, 20)
+    hits = scaled_image_cache_stats().hits
+
+    assert image.get_size() == (30, 20)
+    assert load_scaled_image(path, 30, 20) is image
+    assert scaled_image_cache_stats().hits == hits + 1
+    assert load_scaled_image(path, 20, 30).get_size() == (20, 30)
@@ -14,17 +14,19 @@ class ViewManager(EventListener):
     on the screen.
     """
     current_view: Optional[SceneView] = None
+    handled_events = (NewSceneEvent, BasicEvents.TICK, BasicEvents.DEBUG)
+    draws = True
 
     @classmethod
     def notify(cls, event: EventType) -> None:
         if isinstance(event, NewSceneEvent):
             logging.debug('Updating view to new scene: {}'.format(event.scene))
             cls.current_view = SceneView(event.scene)
-        elif event == BasicEvents.TICK:
+        elif event is BasicEvents.TICK:
             assert cls.current_view is not None, ('no scene loaded after '
                                                   'ViewManager initialized.')
             cls.current_view.update()
-        elif event == BasicEvents.DEBUG:
+        elif event is BasicEvents.DEBUG:
             assert cls.current_view is not None, ('no scene loaded after '
                                                   'ViewManager initialized.')
             logging.debug('Toggling debug mode.')